@@ -1,8 +1,13 @@
-from typing import Generator
+from typing import Any, Dict, Generator, Optional
+from pydantic import BaseModel, ConfigDict, Field
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base, Session
 import os
 
+from config.database_routing import RoutingSession
+
 # Obter configurações do banco de dados diretamente das variáveis de ambiente
 DATABASE = {
     "drivername": "mysql+pymysql",
@@ -19,17 +24,119 @@ DATABASE_URL = (
     f"{DATABASE['host']}:{DATABASE['port']}/{DATABASE['name']}"
 )
 
+# Pilha asyncio (AsyncEngine + repositórios assíncronos), usada hoje no login de funcionários.
+# Requer o driver assíncrono instalado (aiomysql ou asyncmy).
+ASYNC_DATABASE_ENABLED = os.getenv("ASYNC_DATABASE_ENABLED", "false").lower() in ("true", "1")
+ASYNC_DATABASE_DRIVERNAME = os.getenv("ASYNC_DATABASE_DRIVERNAME", "mysql+aiomysql")
+
+ASYNC_DATABASE_URL = (
+    f"{ASYNC_DATABASE_DRIVERNAME}://{DATABASE['user']}:{DATABASE['password']}@"
+    f"{DATABASE['host']}:{DATABASE['port']}/{DATABASE['name']}"
+)
+
+# Réplicas de leitura (URLs completas separadas por vírgula). Os métodos `get_*` e `exists_*`
+# dos repositórios leem delas; sem réplicas, tudo vai para o banco principal.
+DATABASE_REPLICA_URLS = [url.strip() for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if url.strip()]
+# Depois de uma escrita, as leituras da mesma requisição voltam ao principal (read-your-writes)
+DATABASE_READ_YOUR_WRITES = os.getenv("DATABASE_READ_YOUR_WRITES", "true").lower() in ("true", "1")
+
 DELETE_MODE = os.getenv("DELETE_MODE", "soft")
 
+
+
+class EngineSettings(BaseModel):
+    """
+    Configuração do motor e do pool de conexões, lida das variáveis de ambiente.
+    Valores inválidos impedem a aplicação de subir. Cada processo (worker do uvicorn)
+    mantém o próprio pool, com até `pool_size + max_overflow` conexões.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    echo: bool = False
+    pool_size: int = Field(5, ge=1)
+    # -1 libera conexões extras sem limite
+    max_overflow: int = Field(10, ge=-1)
+    # Segundos aguardando uma conexão livre antes de falhar
+    pool_timeout: float = Field(30.0, gt=0)
+    pool_pre_ping: bool = True
+    # Segundos até reciclar uma conexão (-1 desabilita)
+    pool_recycle: int = Field(3600, ge=-1)
+
+    @classmethod
+    def from_env(cls) -> "EngineSettings":
+        values = {
+            "echo": os.getenv("DATABASE_ECHO"),
+            "pool_size": os.getenv("DATABASE_POOL_SIZE"),
+            "max_overflow": os.getenv("DATABASE_MAX_OVERFLOW"),
+            "pool_timeout": os.getenv("DATABASE_POOL_TIMEOUT"),
+            "pool_pre_ping": os.getenv("DATABASE_POOL_PRE_PING"),
+            "pool_recycle": os.getenv("DATABASE_POOL_RECYCLE"),
+        }
+        return cls(**{name: value for name, value in values.items() if value is not None})
+
+    def engine_options(self) -> Dict[str, Any]:
+        return self.model_dump()
+
+
+def get_pool_status(target_engine: Engine = None) -> Dict[str, Any]:
+    """
+    Estatísticas atuais do pool de conexões, para dimensioná-lo por pod.
+    `overflow` fica negativo enquanto o pool ainda não abriu todas as `size` conexões.
+    """
+    pool = (target_engine or engine).pool
+    status = {"pool_class": type(pool).__name__}
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        if hasattr(pool, name):
+            status[name] = getattr(pool, name)()
+    return status
+
+
+ENGINE_SETTINGS = EngineSettings.from_env()
+
 # Criar o motor do SQLAlchemy
-engine = create_engine(DATABASE_URL, echo=True, pool_pre_ping=True, pool_recycle=3600)
+engine = create_engine(DATABASE_URL, **ENGINE_SETTINGS.engine_options())
+replica_engines = [create_engine(url, **ENGINE_SETTINGS.engine_options()) for url in DATABASE_REPLICA_URLS]
 
 # Configurar a sessão
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = sessionmaker(
+    class_=RoutingSession,
+    autocommit=False,
+    autoflush=False,
+    bind=engine,
+    replica_binds=replica_engines,
+    sticky=DATABASE_READ_YOUR_WRITES,
+)
 
 # Classe base para os modelos
 Base = declarative_base()
 
+# Motor assíncrono criado no primeiro uso: o driver só é importado quando a pilha asyncio é usada
+_async_engine: Optional[AsyncEngine] = None
+_async_session_factory: Optional[async_sessionmaker] = None
+
+
+def get_async_engine() -> AsyncEngine:
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_engine(ASYNC_DATABASE_URL, **ENGINE_SETTINGS.engine_options())
+    return _async_engine
+
+
+def get_async_session_factory() -> async_sessionmaker:
+    global _async_session_factory
+    if _async_session_factory is None:
+        # Sem expirar ao confirmar: atributos lidos depois do commit não podem disparar I/O implícito
+        _async_session_factory = async_sessionmaker(bind=get_async_engine(), autoflush=False, expire_on_commit=False)
+    return _async_session_factory
+
+
+def open_async_session() -> AsyncSession:
+    """
+    Abre uma AsyncSession; use com `async with` para devolver a conexão ao pool ao final.
+    """
+    return get_async_session_factory()()
+
+
 def get_db() -> Generator[Session, None, None]:
     db = SessionLocal()
     try:
@@ -0,0 +1,125 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from itertools import cycle
+from typing import Callable, ContextManager, Iterator, Optional, Sequence
+import inspect
+
+from sqlalchemy import Delete, Insert, Update
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+# Métodos de repositório somente leitura, que podem ser atendidos pelas réplicas
+READ_ONLY_METHOD_PREFIXES = ("get_", "exists_")
+
+PRIMARY = "primary"
+REPLICA = "replica"
+
+
+class RoutingState:
+    """
+    Estado do roteamento durante uma requisição: depois da primeira escrita, as leituras
+    seguintes da mesma requisição vão para o primário (read-your-writes).
+    """
+
+    def __init__(self):
+        self.wrote = False
+
+    @classmethod
+    def current(cls) -> "RoutingState":
+        state = _current_routing_state.get()
+        if state is None:
+            state = cls()
+            _current_routing_state.set(state)
+        return state
+
+    @classmethod
+    @contextmanager
+    def scope(cls) -> Iterator["RoutingState"]:
+        token = _current_routing_state.set(cls())
+        try:
+            yield _current_routing_state.get()
+        finally:
+            _current_routing_state.reset(token)
+
+
+@contextmanager
+def _route(target: str, override: bool) -> Iterator[None]:
+    if not override and _current_route.get() is not None:
+        yield
+        return
+    token = _current_route.set(target)
+    try:
+        yield
+    finally:
+        _current_route.reset(token)
+
+
+def read_only() -> ContextManager[None]:
+    """
+    Permite que as consultas do bloco sejam atendidas pelas réplicas, a menos que um bloco
+    externo já tenha decidido o destino (ex.: um método de escrita que consulta antes de gravar).
+    """
+    return _route(REPLICA, override=False)
+
+
+def on_primary() -> ContextManager[None]:
+    """Força as consultas do bloco para o primário, inclusive as feitas por métodos somente leitura."""
+    return _route(PRIMARY, override=True)
+
+
+def replica_reads(cls):
+    """
+    Marca os métodos `get_*` e `exists_*` do repositório como somente leitura, permitindo que as
+    consultas feitas por eles sejam enviadas às réplicas. Os demais métodos públicos rodam no
+    primário, inclusive as leituras que fazem por meio dos métodos somente leitura.
+    """
+    for name, method in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.isfunction(method):
+            continue
+        if name.startswith(READ_ONLY_METHOD_PREFIXES):
+            setattr(cls, name, _run_in(method, read_only))
+        else:
+            setattr(cls, name, _run_in(method, on_primary))
+    return cls
+
+
+def _run_in(method, route: Callable[[], ContextManager[None]]):
+    @wraps(method)
+    def wrapper(*args, **kwargs):
+        with route():
+            return method(*args, **kwargs)
+    return wrapper
+
+
+class RoutingSession(Session):
+    """
+    Sessão que envia as leituras dos métodos somente leitura para as réplicas (em rodízio)
+    e todo o resto - escritas, flush e leituras feitas por métodos de escrita - para o primário.
+    Sem réplicas configuradas, se comporta como uma Session comum.
+    """
+
+    def __init__(self, bind: Optional[Engine] = None, replica_binds: Sequence[Engine] = (), sticky: bool = True, **kwargs):
+        super().__init__(bind=bind, **kwargs)
+        self.replica_binds = tuple(replica_binds)
+        self.sticky = sticky
+        self._replicas = cycle(self.replica_binds)
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self._flushing or isinstance(clause, (Insert, Update, Delete)):
+            if self.sticky:
+                RoutingState.current().wrote = True
+            return super().get_bind(mapper, clause=clause, **kwargs)
+
+        if self.replica_binds and _current_route.get() == REPLICA and not (self.sticky and RoutingState.current().wrote):
+            return next(self._replicas)
+
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+
+_current_routing_state: ContextVar[Optional[RoutingState]] = ContextVar("routing_state", default=None)
+# Destino das consultas no contexto atual: None (não decidido), PRIMARY ou REPLICA
+_current_route: ContextVar[Optional[str]] = ContextVar("database_route", default=None)
+
+
+__all__ = ["READ_ONLY_METHOD_PREFIXES", "RoutingSession", "RoutingState", "on_primary", "read_only", "replica_reads"]
@@ -23,6 +23,69 @@ ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 60))
 
 JWT_ALGORITHM = os.getenv("ALGORITHM_JWT", "HS256")
 
+# Algoritmo de hash de senhas (bcrypt ou argon2id) e seus parâmetros.
+# Hashes gerados com parâmetros antigos são refeitos no próximo login.
+PASSWORD_HASHER = os.getenv("PASSWORD_HASHER", "bcrypt")
+PASSWORD_HASHER_BCRYPT_ROUNDS = int(os.getenv("PASSWORD_HASHER_BCRYPT_ROUNDS", 12))
+PASSWORD_HASHER_ARGON2_TIME_COST = int(os.getenv("PASSWORD_HASHER_ARGON2_TIME_COST", 3))
+PASSWORD_HASHER_ARGON2_MEMORY_COST = int(os.getenv("PASSWORD_HASHER_ARGON2_MEMORY_COST", 65536))
+PASSWORD_HASHER_ARGON2_PARALLELISM = int(os.getenv("PASSWORD_HASHER_ARGON2_PARALLELISM", 4))
+
+# Executor dedicado ao hash de senhas no login (thread ou process)
+PASSWORD_HASHING_EXECUTOR = os.getenv("PASSWORD_HASHING_EXECUTOR", "thread")
+PASSWORD_HASHING_MAX_WORKERS = int(os.getenv("PASSWORD_HASHING_MAX_WORKERS", os.cpu_count() or 1))
+
+# Quantidade máxima de tokens já verificados mantidos em memória (0 desabilita o cache)
+JWT_VERIFIED_TOKEN_CACHE_SIZE = int(os.getenv("JWT_VERIFIED_TOKEN_CACHE_SIZE", 4096))
+
+# Cache em memória das permissões de cada perfil usado na emissão de tokens
+PROFILE_PERMISSION_CACHE_MAX_SIZE = int(os.getenv("PROFILE_PERMISSION_CACHE_MAX_SIZE", 128))
+PROFILE_PERMISSION_CACHE_TTL_SECONDS = int(os.getenv("PROFILE_PERMISSION_CACHE_TTL_SECONDS", 300))
+
+# Cache em memória do login de clientes por CPF (0 desabilita o cache)
+CUSTOMER_AUTH_CACHE_MAX_SIZE = int(os.getenv("CUSTOMER_AUTH_CACHE_MAX_SIZE", 10000))
+CUSTOMER_AUTH_CACHE_TTL_SECONDS = int(os.getenv("CUSTOMER_AUTH_CACHE_TTL_SECONDS", 60))
+# CPFs sem cliente: cache à parte, menor e com TTL mais curto, para não expulsarem os clientes em uso
+CUSTOMER_AUTH_CACHE_NEGATIVE_MAX_SIZE = int(os.getenv("CUSTOMER_AUTH_CACHE_NEGATIVE_MAX_SIZE", 1000))
+CUSTOMER_AUTH_CACHE_NEGATIVE_TTL_SECONDS = int(os.getenv("CUSTOMER_AUTH_CACHE_NEGATIVE_TTL_SECONDS", 10))
+
+# Quantidade máxima de entidades no IdentityMap de cada requisição (0 = sem limite)
+IDENTITY_MAP_MAX_SIZE = int(os.getenv("IDENTITY_MAP_MAX_SIZE", 10000))
+# Mantém apenas referências fracas às entidades (ignora IDENTITY_MAP_MAX_SIZE)
+IDENTITY_MAP_WEAK_REFERENCES = os.getenv("IDENTITY_MAP_WEAK_REFERENCES", "false").lower() in ("true", "1")
+
+# Paginação das listagens (keyset por id): sem `limit` a listagem devolve uma página de DEFAULT_PAGE_SIZE
+MAX_PAGE_SIZE = int(os.getenv("MAX_PAGE_SIZE", 1000))
+DEFAULT_PAGE_SIZE = min(int(os.getenv("DEFAULT_PAGE_SIZE", 100)), MAX_PAGE_SIZE)
+
+# Linhas lidas do cursor do banco por vez nas exportações em NDJSON
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", 1000))
+
+# Cliente HTTP do API Gateway (Cognito): conexões reaproveitadas, timeouts, retentativas com jitter
+# e circuit breaker, para que uma indisponibilidade não trave a criação de clientes
+APIGW_CONNECT_TIMEOUT_SECONDS = float(os.getenv("APIGW_CONNECT_TIMEOUT_SECONDS", 2))
+APIGW_READ_TIMEOUT_SECONDS = float(os.getenv("APIGW_READ_TIMEOUT_SECONDS", 5))
+APIGW_MAX_RETRIES = int(os.getenv("APIGW_MAX_RETRIES", 2))
+APIGW_RETRY_BACKOFF_SECONDS = float(os.getenv("APIGW_RETRY_BACKOFF_SECONDS", 0.2))
+APIGW_RETRY_JITTER_SECONDS = float(os.getenv("APIGW_RETRY_JITTER_SECONDS", 0.2))
+APIGW_POOL_MAX_SIZE = int(os.getenv("APIGW_POOL_MAX_SIZE", 10))
+APIGW_CIRCUIT_BREAKER_FAILURE_THRESHOLD = int(os.getenv("APIGW_CIRCUIT_BREAKER_FAILURE_THRESHOLD", 5))
+APIGW_CIRCUIT_BREAKER_RESET_SECONDS = float(os.getenv("APIGW_CIRCUIT_BREAKER_RESET_SECONDS", 30))
+# Sincronizações simultâneas em sync_users (não deve passar de APIGW_POOL_MAX_SIZE)
+APIGW_SYNC_CONCURRENCY = int(os.getenv("APIGW_SYNC_CONCURRENCY", 4))
+# Ressincronização: com um lote inteiro falhando (API Gateway fora do ar ou circuito aberto), espera
+# o circuito voltar a meio aberto e repete o lote; desiste após APIGW_SYNC_MAX_PAUSES pausas seguidas
+APIGW_SYNC_PAUSE_SECONDS = float(os.getenv("APIGW_SYNC_PAUSE_SECONDS", APIGW_CIRCUIT_BREAKER_RESET_SECONDS))
+APIGW_SYNC_MAX_PAUSES = int(os.getenv("APIGW_SYNC_MAX_PAUSES", 5))
+
+# Outbox da sincronização de usuários com o provedor de identidade, entregue em segundo plano
+OUTBOX_DISPATCHER_ENABLED = os.getenv("OUTBOX_DISPATCHER_ENABLED", "true").lower() in ("true", "1")
+OUTBOX_POLL_INTERVAL_SECONDS = float(os.getenv("OUTBOX_POLL_INTERVAL_SECONDS", 2))
+OUTBOX_BATCH_SIZE = int(os.getenv("OUTBOX_BATCH_SIZE", 50))
+OUTBOX_MAX_ATTEMPTS = int(os.getenv("OUTBOX_MAX_ATTEMPTS", 10))
+OUTBOX_RETRY_BACKOFF_SECONDS = float(os.getenv("OUTBOX_RETRY_BACKOFF_SECONDS", 5))
+OUTBOX_RETRY_MAX_BACKOFF_SECONDS = float(os.getenv("OUTBOX_RETRY_MAX_BACKOFF_SECONDS", 600))
+
 
 MERCADO_PAGO_ACCESS_TOKEN = os.getenv("MERCADO_PAGO_ACCESS_TOKEN")
 MERCADO_PAGO_USER_ID = os.getenv('MERCADO_PAGO_USER_ID')
@@ -0,0 +1,68 @@
+"""add lookup indexes
+
+Revision ID: ae791b269d61
+Revises: 79146ba9f218
+Create Date: 2026-10-18 10:12:41.503118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ae791b269d61'
+down_revision: Union[str, None] = '79146ba9f218'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Índices no formato das consultas dos repositórios.
+# As listagens filtram `inactivated_at IS NULL` e paginam por id: o índice (inactivated_at, id)
+# atende o filtro e a ordenação. É usado no lugar de um índice parcial porque o MySQL não os suporta.
+SOFT_DELETE_TABLES = (
+    'customers',
+    'employees',
+    'permissions',
+    'persons',
+    'profile_permissions',
+    'profiles',
+    'roles',
+    'user_profiles',
+    'users',
+)
+
+LOOKUP_INDEXES = (
+    ('ix_customers_person_id', 'customers', ['person_id']),
+    ('ix_employees_person_id', 'employees', ['person_id']),
+    ('ix_employees_user_id', 'employees', ['user_id']),
+    ('ix_employees_role_id', 'employees', ['role_id']),
+    ('ix_user_profiles_user_id_profile_id', 'user_profiles', ['user_id', 'profile_id']),
+    ('ix_user_profiles_profile_id_user_id', 'user_profiles', ['profile_id', 'user_id']),
+    # (profile_id, id) também entrega as permissões do perfil já na ordem de associação
+    ('ix_profile_permissions_profile_id_id', 'profile_permissions', ['profile_id', 'id']),
+    ('ix_profile_permissions_permission_id_profile_id', 'profile_permissions', ['permission_id', 'profile_id']),
+)
+
+
+def upgrade() -> None:
+    for table in SOFT_DELETE_TABLES:
+        op.create_index(f'ix_{table}_inactivated_at_id', table, ['inactivated_at', 'id'])
+
+    for name, table, columns in LOOKUP_INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    # O InnoDB exige um índice em cada chave estrangeira e descarta o que criou automaticamente
+    # quando um dos índices acima passa a cobri-la: no MySQL ele é recriado antes da remoção.
+    is_mysql = op.get_bind().dialect.name == 'mysql'
+
+    for name, table, columns in reversed(LOOKUP_INDEXES):
+        if is_mysql:
+            op.create_index(f'{table}_{columns[0]}_fk', table, [columns[0]])
+        op.drop_index(name, table_name=table)
+
+    for table in reversed(SOFT_DELETE_TABLES):
+        op.drop_index(f'ix_{table}_inactivated_at_id', table_name=table)
@@ -0,0 +1,64 @@
+"""add diagnostics permission
+
+Revision ID: b41c7e2a9d53
+Revises: 68a74a654fa0
+Create Date: 2026-10-18 18:12:40.512903
+
+"""
+
+import os
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import DateTime, Integer, String
+from sqlalchemy.sql import column, select, table
+
+from src.constants.permissions import HealthCheckPermissions
+
+# Revisão e informações básicas da migração
+revision: str = 'b41c7e2a9d53'
+down_revision: Union[str, None] = '68a74a654fa0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+permissions_table = table(
+    'permissions',
+    column('id', Integer),
+    column('name', String),
+    column('description', String)
+)
+
+profile_permissions_table = table(
+    'profile_permissions',
+    column('profile_id', Integer),
+    column('permission_id', Integer),
+    column('created_at', DateTime)
+)
+
+ADMINISTRATOR_PROFILE_ID = 1
+
+
+def upgrade() -> None:
+    if os.getenv("ENVIRONMENT") == "testing":
+        return
+
+    op.bulk_insert(permissions_table, HealthCheckPermissions.values_and_descriptions())
+
+    connection = op.get_bind()
+    rows = connection.execute(
+        select(permissions_table.c.id).where(permissions_table.c.name.in_(HealthCheckPermissions.values()))
+    )
+    op.bulk_insert(profile_permissions_table, [
+        {"profile_id": ADMINISTRATOR_PROFILE_ID, "permission_id": permission_id, "created_at": datetime.now(timezone.utc)}
+        for (permission_id,) in rows
+    ])
+
+
+def downgrade() -> None:
+    if os.getenv("ENVIRONMENT") == "testing":
+        return
+
+    names = ", ".join(f"'{name}'" for name in HealthCheckPermissions.values())
+    op.execute(f"DELETE FROM profile_permissions WHERE permission_id IN (SELECT id FROM permissions WHERE name IN ({names}))")
+    op.execute(f"DELETE FROM permissions WHERE name IN ({names})")
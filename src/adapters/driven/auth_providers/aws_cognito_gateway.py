@@ -1,19 +1,106 @@
+from concurrent.futures import ThreadPoolExecutor
 from http import HTTPStatus
-from src.core.domain.entities.person import Person
-from src.core.ports.auth.i_auth_provider_gateway import IAuthProviderGateway
+from typing import Any, Dict, List, Optional, Sequence
+import logging
 import os
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config.settings import (
+    APIGW_CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    APIGW_CIRCUIT_BREAKER_RESET_SECONDS,
+    APIGW_CONNECT_TIMEOUT_SECONDS,
+    APIGW_MAX_RETRIES,
+    APIGW_POOL_MAX_SIZE,
+    APIGW_READ_TIMEOUT_SECONDS,
+    APIGW_RETRY_BACKOFF_SECONDS,
+    APIGW_RETRY_JITTER_SECONDS,
+    APIGW_SYNC_CONCURRENCY,
+)
+from src.core.domain.entities.person import Person
+from src.core.ports.auth.i_auth_provider_gateway import IAuthProviderGateway
+from src.core.shared.circuit_breaker import CircuitBreaker
 
 
 class AWSCognitoGateway(IAuthProviderGateway):
     """
     Implementação do gateway de autenticação usando o AWS Cognito.
+
+    As chamadas ao API Gateway usam uma sessão HTTP com conexões keep-alive reaproveitadas,
+    timeouts de conexão e leitura, retentativas limitadas com jitter (erros de conexão,
+    timeouts e respostas 502/503/504) e um circuit breaker: com o serviço fora do ar,
+    as chamadas falham na hora em vez de segurar a requisição.
     """
 
-    def __init__(self):
-        self.base_url = os.getenv('APIGW_URL')
+    RETRY_STATUSES = (HTTPStatus.BAD_GATEWAY, HTTPStatus.SERVICE_UNAVAILABLE, HTTPStatus.GATEWAY_TIMEOUT)
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        connect_timeout: float = APIGW_CONNECT_TIMEOUT_SECONDS,
+        read_timeout: float = APIGW_READ_TIMEOUT_SECONDS,
+        max_retries: int = APIGW_MAX_RETRIES,
+        retry_backoff: float = APIGW_RETRY_BACKOFF_SECONDS,
+        retry_jitter: float = APIGW_RETRY_JITTER_SECONDS,
+        pool_max_size: int = APIGW_POOL_MAX_SIZE,
+        sync_concurrency: int = APIGW_SYNC_CONCURRENCY,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+    ):
+        self.base_url = base_url or os.getenv('APIGW_URL')
         self.headers = { "Content-Type": "application/json" }
-    
+        self.timeout = (connect_timeout, read_timeout)
+        self.sync_concurrency = sync_concurrency
+        self.circuit_breaker = circuit_breaker or CircuitBreaker(
+            failure_threshold=APIGW_CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+            reset_timeout=APIGW_CIRCUIT_BREAKER_RESET_SECONDS,
+        )
+        self.session = self._build_session(max_retries, retry_backoff, retry_jitter, pool_max_size)
+
+    def _build_session(self, max_retries: int, retry_backoff: float, retry_jitter: float, pool_max_size: int) -> requests.Session:
+        # O /login do API Gateway é idempotente (autenticação e upsert do usuário),
+        # por isso o POST pode ser repetido
+        retry = Retry(
+            total=max_retries,
+            connect=max_retries,
+            read=max_retries,
+            status=max_retries,
+            backoff_factor=retry_backoff,
+            backoff_jitter=retry_jitter,
+            status_forcelist=self.RETRY_STATUSES,
+            allowed_methods=frozenset({"POST"}),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_max_size, max_retries=retry)
+        session = requests.Session()
+        session.headers.update(self.headers)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _post(self, path: str, payload: Dict[str, Any]) -> Optional[requests.Response]:
+        """
+        Envia o POST passando pelo circuit breaker. Retorna None quando o circuito está aberto
+        ou a chamada falhou (conexão, timeout ou 5xx depois das retentativas).
+        """
+        if not self.circuit_breaker.allow_request():
+            logging.warning("Circuit breaker do API Gateway aberto: chamada a %s ignorada.", path)
+            return None
+
+        try:
+            response = self.session.post(f"{self.base_url}{path}", json=payload, timeout=self.timeout)
+        except requests.RequestException as e:
+            self.circuit_breaker.record_failure()
+            logging.error(f"Erro na chamada ao API Gateway ({path}): {str(e)}")
+            return None
+
+        if response.status_code >= HTTPStatus.INTERNAL_SERVER_ERROR:
+            self.circuit_breaker.record_failure()
+        else:
+            self.circuit_breaker.record_success()
+        return response
+
     def authenticate(self, cpf: str) -> bool:
         """
         Autentica um usuário com o AWS Cognito.
@@ -21,46 +108,54 @@ class AWSCognitoGateway(IAuthProviderGateway):
         """
 
         if not cpf:
-            print("CPF não fornecido para autenticação.")
+            logging.warning("CPF não fornecido para autenticação.")
             return False
 
-        try:
-            response = requests.post(
-                f"{self.base_url}/login",
-                json={"cpf": cpf},
-                headers=self.headers
-            )
-            
-            return response.status_code == HTTPStatus.OK
-        except Exception as e:
-            print(f"Erro ao autenticar usuário: {str(e)}")
-            return False
+        response = self._post("/login", {"cpf": cpf})
+        return response is not None and response.status_code == HTTPStatus.OK
 
-    def sync_user(self, person: Person) -> None:
+    def sync_user(self, person: Person) -> bool:
         """
         Sincroniza os dados do usuário com o AWS Cognito.
+        Retorna True se a sincronização for bem-sucedida, False caso contrário.
         """
         if not person:
-            print("Objeto Person não fornecido para sincronização.")
-            return
-        
-        try:
-            response = requests.post(
-                f"{self.base_url}/login",
-                json={
-                    "cpf": person.cpf,
-                    "email": person.email,
-                    "name": person.name,
-                    "birthdate": person.birth_date.isoformat() if person.birth_date else None
-                },
-                headers=self.headers
-            )
-            
-            # show response status code and text
-            print(f"Response Status Code: {response.status_code}")
-            print(f"Response Text: {response.text}")
-            
-            if response.status_code != HTTPStatus.OK:
-                print(f"Erro ao sincronizar usuário: {response.text}")
-        except Exception as e:
-            print(f"Erro ao sincronizar usuário: {str(e)}")
+            logging.warning("Objeto Person não fornecido para sincronização.")
+            return False
+
+        response = self._post(
+            "/login",
+            {
+                "cpf": person.cpf,
+                "email": person.email,
+                "name": person.name,
+                "birthdate": person.birth_date.isoformat() if person.birth_date else None
+            },
+        )
+        if response is None:
+            return False
+
+        if response.status_code != HTTPStatus.OK:
+            logging.error(f"Erro ao sincronizar usuário: {response.text}")
+            return False
+        return True
+
+    def sync_users(self, persons: Sequence[Person], concurrency: Optional[int] = None) -> List[bool]:
+        """
+        Sincroniza um lote de usuários com até `concurrency` chamadas simultâneas,
+        sobre as mesmas conexões keep-alive. O API Gateway não tem endpoint em lote:
+        o ganho vem de sobrepor as latências das chamadas individuais.
+        Retorna um resultado por pessoa, na ordem de entrada.
+        """
+        if not persons:
+            return []
+
+        workers = max(1, min(concurrency or self.sync_concurrency, len(persons)))
+        if workers == 1:
+            return [self.sync_user(person) for person in persons]
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cognito-sync") as executor:
+            return list(executor.map(self.sync_user, persons))
+
+    def close(self) -> None:
+        self.session.close()
@@ -0,0 +1,50 @@
+from src.adapters.driven.repositories.employee_repository import SINGLE_EMPLOYEE_LOADING
+from src.adapters.driven.repositories.models.employee_model import EmployeeModel
+from src.adapters.driven.repositories.models.user_model import UserModel
+from src.core.shared.identity_map import IdentityMap
+from src.core.ports.employee.i_async_employee_repository import IAsyncEmployeeRepository
+from src.core.domain.entities.employee import Employee
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import contains_eager, joinedload
+from typing import Optional
+
+
+class AsyncEmployeeRepository(IAsyncEmployeeRepository):
+    """
+    Consultas de funcionários pela pilha asyncio. Todos os relacionamentos usados em
+    `to_entity` precisam vir carregados na consulta: não há lazy load em uma AsyncSession.
+    """
+
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+        self.identity_map: IdentityMap = IdentityMap.get_instance()
+
+    async def get_by_id(self, employee_id: int) -> Optional[Employee]:
+        result = await self.db_session.execute(
+            select(EmployeeModel)
+                .options(*SINGLE_EMPLOYEE_LOADING)
+                .where(EmployeeModel.id == employee_id)
+        )
+        employee_model = result.scalars().first()
+        if employee_model is None:
+            return None
+        return employee_model.to_entity()
+
+    async def get_by_username(self, username: str) -> Optional[Employee]:
+        # Usado no login: funcionário, pessoa, cargo e usuário em um único SELECT
+        result = await self.db_session.execute(
+            select(EmployeeModel)
+                .join(EmployeeModel.user)
+                .options(
+                    contains_eager(EmployeeModel.user),
+                    joinedload(EmployeeModel.person),
+                    joinedload(EmployeeModel.role),
+                )
+                .where(UserModel.name == username)
+        )
+        employee_model = result.scalars().first()
+        if employee_model is None:
+            return None
+        return employee_model.to_entity()
@@ -0,0 +1,37 @@
+from src.adapters.driven.repositories.models.permission_model import PermissionModel
+from src.adapters.driven.repositories.models.profile_model import ProfileModel
+from src.adapters.driven.repositories.models.profile_permission_model import ProfilePermissionModel
+from src.core.shared.profile_permission_cache import ProfilePermissionCache
+from src.core.ports.profile.i_async_profile_repository import IAsyncProfileRepository
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional, Tuple
+
+
+class AsyncProfileRepository(IAsyncProfileRepository):
+
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+        # Mesmo cache da pilha síncrona: alterações feitas por ela também o invalidam
+        self.permission_cache = ProfilePermissionCache.get_instance()
+
+    async def get_permission_names(self, name: str) -> Optional[Tuple[str, ...]]:
+        permission_names = self.permission_cache.get(name)
+        if permission_names is not None:
+            return permission_names
+
+        version = self.permission_cache.version
+        profile_id = await self.db_session.scalar(select(ProfileModel.id).where(ProfileModel.name == name))
+        if profile_id is None:
+            return None
+
+        result = await self.db_session.execute(
+            select(PermissionModel.name)
+                .join(ProfilePermissionModel, ProfilePermissionModel.permission_id == PermissionModel.id)
+                .where(ProfilePermissionModel.profile_id == profile_id)
+                .order_by(ProfilePermissionModel.id)
+        )
+        permission_names = tuple(result.scalars())
+        self.permission_cache.set(name, permission_names, version)
+        return permission_names
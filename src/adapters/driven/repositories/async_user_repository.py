@@ -0,0 +1,31 @@
+from src.adapters.driven.repositories.models.user_model import UserModel
+from src.core.shared.identity_map import IdentityMap
+from src.core.ports.user.i_async_user_repository import IAsyncUserRepository
+from src.core.domain.entities.user import User
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+
+
+class AsyncUserRepository(IAsyncUserRepository):
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+        self.identity_map = IdentityMap.get_instance()
+
+    async def get_by_id(self, user_id: int) -> Optional[User]:
+        user_model = await self.db_session.scalar(select(UserModel).where(UserModel.id == user_id))
+        if not user_model:
+            return None
+        return user_model.to_entity()
+
+    async def update(self, user: User) -> User:
+        if user.id is not None:
+            existing = self.identity_map.get(User, user.id)
+            if existing:
+                self.identity_map.remove(existing)
+
+        user_model = UserModel.from_entity(user)
+        await self.db_session.merge(user_model)
+        await self.db_session.commit()
+        return user_model.to_entity()
@@ -1,17 +1,25 @@
+from config.settings import EXPORT_BATCH_SIZE
+from config.database_routing import on_primary, replica_reads
+from src.core.shared.customer_auth_cache import CustomerAuthCache
 from src.core.shared.identity_map import IdentityMap
 from src.adapters.driven.repositories.models.customer_model import CustomerModel
+from src.adapters.driven.repositories.pagination import paginate
 from src.adapters.driven.repositories.models.person_model import PersonModel
+from src.adapters.driven.repositories.read_models import person_columns, person_dto_from_row
+from src.core.domain.dtos.customer.customer_dto import CustomerDTO
 from src.core.ports.customer.i_customer_repository import ICustomerRepository
 from src.core.domain.entities.customer import Customer
 
-from sqlalchemy.orm import Session
-from typing import List
+from sqlalchemy.orm import Session, contains_eager, joinedload
+from typing import Iterator, List, Optional
 
 
+@replica_reads
 class CustomerRepository(ICustomerRepository):
     def __init__(self, db_session: Session):
         self.db_session = db_session
         self.identity_map = IdentityMap.get_instance()
+        self.auth_cache = CustomerAuthCache.get_instance()
 
     def create(self, customer: Customer) -> Customer:
         if customer.id is not None:
@@ -31,6 +39,7 @@ class CustomerRepository(ICustomerRepository):
 
         self.db_session.add(customer_model)
         self.db_session.commit()
+        self.auth_cache.invalidate(person_model.cpf)
         self.db_session.refresh(customer_model)
 
         return customer_model.to_entity()
@@ -38,6 +47,7 @@ class CustomerRepository(ICustomerRepository):
     def get_by_id(self, customer_id: int) -> Customer:
         customer_model = (
             self.db_session.query(CustomerModel)
+            .options(joinedload(CustomerModel.person))
             .filter(CustomerModel.id == customer_id)
             .first()
         )
@@ -45,13 +55,18 @@ class CustomerRepository(ICustomerRepository):
             return None
         return customer_model.to_entity()
     
-    def get_by_cpf(self, cpf: str) -> Customer:
-        customer_model = (
+    def get_by_cpf(self, cpf: str, consistent: bool = False) -> Customer:
+        query = (
             self.db_session.query(CustomerModel)
             .join(CustomerModel.person)
+            .options(contains_eager(CustomerModel.person))
             .filter(PersonModel.cpf == cpf)
-            .first()
         )
+        if consistent:
+            with on_primary():
+                customer_model = query.first()
+        else:
+            customer_model = query.first()
         if not customer_model:
             return None
         return customer_model.to_entity()
@@ -59,6 +74,7 @@ class CustomerRepository(ICustomerRepository):
     def get_by_person_id(self, person_id: int) -> Customer:
         customer_model = (
             self.db_session.query(CustomerModel)
+            .options(joinedload(CustomerModel.person))
             .filter(CustomerModel.person_id == person_id)
             .first()
         )
@@ -66,23 +82,55 @@ class CustomerRepository(ICustomerRepository):
             return None
         return customer_model.to_entity()
     
-    def get_all(self, include_deleted: bool = False) -> List[Customer]:
-        query = self.db_session.query(CustomerModel)
+    def get_all(self, include_deleted: bool = False, limit: Optional[int] = None, after_id: Optional[int] = None, owner_id: Optional[int] = None) -> List[Customer]:
+        # Pessoa carregada no mesmo SELECT: evita uma consulta por cliente em `to_entity`
+        query = self.db_session.query(CustomerModel).options(joinedload(CustomerModel.person))
         if not include_deleted:
             query = query.filter(CustomerModel.inactivated_at.is_(None))
-        customer_models = query.all()
+        if owner_id is not None:
+            # Busca pela chave primária: restringe a listagem ao próprio cliente
+            query = query.filter(CustomerModel.id == owner_id)
+        customer_models = paginate(query, CustomerModel, limit, after_id).all()
         return [cm.to_entity() for cm in customer_models]
+
+    def get_all_dtos(self, include_deleted: bool = False, limit: Optional[int] = None, after_id: Optional[int] = None, owner_id: Optional[int] = None) -> List[CustomerDTO]:
+        query = (
+            self.db_session.query(CustomerModel.id, *person_columns("person_"))
+            .select_from(CustomerModel)
+            .join(CustomerModel.person)
+        )
+        if not include_deleted:
+            query = query.filter(CustomerModel.inactivated_at.is_(None))
+        if owner_id is not None:
+            query = query.filter(CustomerModel.id == owner_id)
+        rows = paginate(query, CustomerModel, limit, after_id).all()
+        return [CustomerDTO.model_construct(id=row.id, person=person_dto_from_row(row, "person_")) for row in rows]
     
+    def stream_all(self, include_deleted: bool = False, owner_id: Optional[int] = None) -> Iterator[Customer]:
+        # Sessão própria: o cursor fica aberto durante toda a exportação sem ocupar a sessão compartilhada.
+        # As entidades não passam pelo IdentityMap, mantendo a memória constante.
+        with Session(bind=self.db_session.get_bind()) as session:
+            query = session.query(CustomerModel).options(joinedload(CustomerModel.person))
+            if not include_deleted:
+                query = query.filter(CustomerModel.inactivated_at.is_(None))
+            if owner_id is not None:
+                query = query.filter(CustomerModel.id == owner_id)
+            for customer_model in query.order_by(CustomerModel.id).yield_per(EXPORT_BATCH_SIZE):
+                yield customer_model.build_entity()
+
     def update(self, customer: Customer) -> Customer:
         existing = self.identity_map.get(Customer, customer.id)
         if existing:
             self.identity_map.remove(existing)
         
+        # A entidade recebida já traz o CPF novo: o anterior vem do banco para sair do cache de login
+        previous_cpf = self.db_session.query(PersonModel.cpf).filter(PersonModel.id == customer.person.id).scalar()
         customer_model = CustomerModel.from_entity(customer)
         customer_model.person = PersonModel.from_entity(customer.person)
 
         self.db_session.merge(customer_model)
         self.db_session.commit()
+        self.auth_cache.invalidate(previous_cpf, customer.person.cpf)
         return self.get_by_id(customer_model.id)
     
     def delete(self, customer: Customer) -> None:
@@ -93,6 +141,8 @@ class CustomerRepository(ICustomerRepository):
         )
 
         if customer_model:
+            cpf = customer_model.person.cpf
             self.db_session.delete(customer_model)
             self.db_session.commit()
+            self.auth_cache.invalidate(cpf)
             self.identity_map.remove(customer)
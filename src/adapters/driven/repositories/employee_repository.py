@@ -1,15 +1,41 @@
+from config.database_routing import replica_reads
 from src.adapters.driven.repositories.models.person_model import PersonModel
+from src.adapters.driven.repositories.pagination import paginate
 from src.adapters.driven.repositories.models.role_model import RoleModel
 from src.adapters.driven.repositories.models.user_model import UserModel
 from src.adapters.driven.repositories.models.employee_model import EmployeeModel
+from src.adapters.driven.repositories.read_models import (
+    person_columns,
+    person_dto_from_row,
+    role_columns,
+    role_dto_from_row,
+    user_columns,
+    user_dto_from_row,
+)
+from src.core.domain.dtos.employee.employee_dto import EmployeeDTO
 from src.core.shared.identity_map import IdentityMap
 from src.core.ports.employee.i_employee_repository import IEmployeeRepository
 from src.core.domain.entities.employee import Employee
 
-from sqlalchemy.orm import Session
-from typing import List
+from sqlalchemy.orm import Session, contains_eager, joinedload, selectinload
+from typing import List, Optional
 
+# Perfis de carregamento dos relacionamentos do funcionário.
+# Consultas de um único funcionário trazem pessoa, cargo e usuário no mesmo SELECT;
+# nas listagens os cargos, compartilhados entre muitos funcionários, vêm em um único SELECT ... IN.
+SINGLE_EMPLOYEE_LOADING = (
+    joinedload(EmployeeModel.person),
+    joinedload(EmployeeModel.role),
+    joinedload(EmployeeModel.user),
+)
+EMPLOYEE_LIST_LOADING = (
+    joinedload(EmployeeModel.person),
+    joinedload(EmployeeModel.user),
+    selectinload(EmployeeModel.role),
+)
 
+
+@replica_reads
 class EmployeeRepository(IEmployeeRepository):
     def __init__(self, db_session: Session):
         self.db_session = db_session
@@ -28,39 +54,101 @@ class EmployeeRepository(IEmployeeRepository):
         return employee_model.to_entity()
     
     def get_by_id(self, employee_id: int) -> Employee:
-        employee_model = self.db_session.query(EmployeeModel).filter(EmployeeModel.id == employee_id).first()
+        employee_model = (
+            self.db_session.query(EmployeeModel)
+                .options(*SINGLE_EMPLOYEE_LOADING)
+                .filter(EmployeeModel.id == employee_id)
+                .first()
+        )
         if employee_model is None:
             return None
         return employee_model.to_entity()
     
     def get_by_person_id(self, person_id: int) -> Employee:
-        employee_model = self.db_session.query(EmployeeModel).join(EmployeeModel.person).filter(PersonModel.id == person_id).first()
+        employee_model = (
+            self.db_session.query(EmployeeModel)
+                .options(*SINGLE_EMPLOYEE_LOADING)
+                .filter(EmployeeModel.person_id == person_id)
+                .first()
+        )
         if employee_model is None:
             return None
         return employee_model.to_entity()
     
     def get_by_user_id(self, user_id: int) -> Employee:
-        employee_model = self.db_session.query(EmployeeModel).join(EmployeeModel.user).filter(UserModel.id == user_id).first()
+        employee_model = (
+            self.db_session.query(EmployeeModel)
+                .options(*SINGLE_EMPLOYEE_LOADING)
+                .filter(EmployeeModel.user_id == user_id)
+                .first()
+        )
         if employee_model is None:
             return None
         return employee_model.to_entity()
     
     def get_by_role_id(self, role_id: int) -> List[Employee]:
-        employee_model = self.db_session.query(EmployeeModel).join(EmployeeModel.role).filter(RoleModel.id == role_id).all()
-        return [employee.to_entity() for employee in employee_model]
+        employee_models = (
+            self.db_session.query(EmployeeModel)
+                .join(EmployeeModel.role)
+                .options(
+                    contains_eager(EmployeeModel.role),
+                    joinedload(EmployeeModel.person),
+                    joinedload(EmployeeModel.user),
+                )
+                .filter(RoleModel.id == role_id)
+                .all()
+        )
+        return [employee.to_entity() for employee in employee_models]
     
     def get_by_username(self, username: str) -> Employee:
-        employee_model = self.db_session.query(EmployeeModel).join(EmployeeModel.user).filter(UserModel.name == username).first()
+        # Usado no login: funcionário, pessoa, cargo e usuário em um único SELECT
+        employee_model = (
+            self.db_session.query(EmployeeModel)
+                .join(EmployeeModel.user)
+                .options(
+                    contains_eager(EmployeeModel.user),
+                    joinedload(EmployeeModel.person),
+                    joinedload(EmployeeModel.role),
+                )
+                .filter(UserModel.name == username)
+                .first()
+        )
         if employee_model is None:
             return None
         return employee_model.to_entity()
 
-    def get_all(self, include_deleted: bool = False) -> List[Employee]:
-        query = self.db_session.query(EmployeeModel)
+    def get_all(self, include_deleted: bool = False, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[Employee]:
+        query = self.db_session.query(EmployeeModel).options(*EMPLOYEE_LIST_LOADING)
         if not include_deleted:
             query = query.filter(EmployeeModel.inactivated_at.is_(None))
-        employee_models = query.all()
+        employee_models = paginate(query, EmployeeModel, limit, after_id).all()
         return [employee_model.to_entity() for employee_model in employee_models]
+
+    def get_all_dtos(self, include_deleted: bool = False, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[EmployeeDTO]:
+        query = (
+            self.db_session.query(
+                EmployeeModel.id,
+                *person_columns("person_"),
+                *role_columns("role_"),
+                *user_columns("user_"),
+            )
+            .select_from(EmployeeModel)
+            .join(EmployeeModel.person)
+            .join(EmployeeModel.role)
+            .join(EmployeeModel.user)
+        )
+        if not include_deleted:
+            query = query.filter(EmployeeModel.inactivated_at.is_(None))
+        rows = paginate(query, EmployeeModel, limit, after_id).all()
+        return [
+            EmployeeDTO.model_construct(
+                id=row.id,
+                person=person_dto_from_row(row, "person_"),
+                role=role_dto_from_row(row, "role_"),
+                user=user_dto_from_row(row, "user_"),
+            )
+            for row in rows
+        ]
     
     def update(self, employee: Employee) -> Employee:
         if employee.id is not None:
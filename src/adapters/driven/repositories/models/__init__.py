@@ -1,6 +1,7 @@
 from .base_model import BaseModel
 from .customer_model import CustomerModel
 from .employee_model import EmployeeModel
+from .outbox_event_model import OutboxEventModel
 from .person_model import PersonModel
 from .profile_model import ProfileModel
 from .permission_model import PermissionModel
@@ -13,6 +14,7 @@ __all__ = [
     "BaseModel",
     "CustomerModel",
     "EmployeeModel",
+    "OutboxEventModel",
     "PersonModel",
     "ProfileModel",
     "PermissionModel",
@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import Type, TypeVar, Generic
-from sqlalchemy import Column, DateTime, Integer, func
+from sqlalchemy import Column, DateTime, Index, Integer, func
 from sqlalchemy.orm import DeclarativeBase, Mapped
 
 from src.core.domain.entities.base_entity import T
@@ -29,4 +29,12 @@ class BaseModel(DeclarativeBase, Generic[M]):
         DateTime(timezone=True), nullable=True
     )
 
-__all__ = ["BaseModel"]
+
+def soft_delete_index(table_name: str) -> Index:
+    """
+    Índice das listagens: filtram `inactivated_at IS NULL` e paginam por id.
+    """
+    return Index(f"ix_{table_name}_inactivated_at_id", "inactivated_at", "id")
+
+
+__all__ = ["BaseModel", "soft_delete_index"]
@@ -1,14 +1,18 @@
 
-from sqlalchemy import Column, ForeignKey
+from sqlalchemy import Column, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 from src.core.shared.identity_map import IdentityMap
-from src.adapters.driven.repositories.models.base_model import BaseModel
+from src.adapters.driven.repositories.models.base_model import BaseModel, soft_delete_index
 from src.core.domain.entities.customer import Customer
 
 
 class CustomerModel(BaseModel):
     __tablename__ = 'customers'
+    __table_args__ = (
+        soft_delete_index('customers'),
+        Index('ix_customers_person_id', 'person_id'),
+    )
 
     person_id = Column(ForeignKey('persons.id'), nullable=True)
     person = relationship('PersonModel')    
@@ -40,5 +44,17 @@ class CustomerModel(BaseModel):
         identity_map.add(customer_entity)
         return customer_entity
 
+    def build_entity(self) -> Customer:
+        """
+        Cria a entidade sem consultar nem registrar no IdentityMap (usado nas exportações).
+        """
+        return Customer(
+            id=self.id,
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+            inactivated_at=self.inactivated_at,
+            person=self.person.build_entity()
+        )
+
 
 __all__ = ['CustomerModel']
@@ -1,13 +1,19 @@
 from src.core.domain.entities.employee import Employee
-from src.adapters.driven.repositories.models.base_model import BaseModel
+from src.adapters.driven.repositories.models.base_model import BaseModel, soft_delete_index
 from src.core.shared.identity_map import IdentityMap
 
-from sqlalchemy import Column, Date, ForeignKey
+from sqlalchemy import Column, Date, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 
 class EmployeeModel(BaseModel):
     __tablename__ = 'employees'
+    __table_args__ = (
+        soft_delete_index('employees'),
+        Index('ix_employees_person_id', 'person_id'),
+        Index('ix_employees_user_id', 'user_id'),
+        Index('ix_employees_role_id', 'role_id'),
+    )
 
     admission_date = Column(Date)
     termination_date = Column(Date)
@@ -0,0 +1,55 @@
+from src.core.domain.entities.outbox_event import OutboxEvent
+from src.adapters.driven.repositories.models.base_model import BaseModel
+
+from sqlalchemy import JSON, Column, DateTime, Index, Integer, String
+
+
+class OutboxEventModel(BaseModel):
+    __tablename__ = 'outbox_events'
+    __table_args__ = (
+        # Eventos pendentes (nem entregues nem na dead-letter), em ordem de criação
+        Index('ix_outbox_events_pending', 'processed_at', 'dead_lettered_at', 'id'),
+    )
+
+    event_type = Column(String(50), nullable=False)
+    payload = Column(JSON, nullable=False)
+    attempts = Column(Integer, nullable=False, default=0)
+    available_at = Column(DateTime, nullable=False)
+    processed_at = Column(DateTime)
+    dead_lettered_at = Column(DateTime)
+    last_error = Column(String(500))
+
+    @classmethod
+    def from_entity(cls, entity: OutboxEvent) -> 'OutboxEventModel':
+        return cls(
+            id=entity.id,
+            event_type=entity.event_type,
+            payload=entity.payload,
+            attempts=entity.attempts,
+            available_at=entity.available_at,
+            processed_at=entity.processed_at,
+            dead_lettered_at=entity.dead_lettered_at,
+            last_error=entity.last_error[:500] if entity.last_error else None,
+            created_at=entity.created_at,
+            updated_at=entity.updated_at,
+            inactivated_at=entity.inactivated_at
+        )
+
+    def to_entity(self) -> OutboxEvent:
+        # Fora do IdentityMap: os eventos são lidos pelo despachante, fora das requisições
+        return OutboxEvent(
+            id=self.id,
+            event_type=self.event_type,
+            payload=self.payload,
+            attempts=self.attempts,
+            available_at=self.available_at,
+            processed_at=self.processed_at,
+            dead_lettered_at=self.dead_lettered_at,
+            last_error=self.last_error,
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+            inactivated_at=self.inactivated_at
+        )
+
+
+__all__ = ['OutboxEventModel']
@@ -1,13 +1,14 @@
 from sqlalchemy import Column, String
 from sqlalchemy.orm import relationship
 
-from src.adapters.driven.repositories.models.base_model import BaseModel
+from src.adapters.driven.repositories.models.base_model import BaseModel, soft_delete_index
 from src.core.domain.entities.permission import Permission
 from src.core.shared.identity_map import IdentityMap
 
 
 class PermissionModel(BaseModel):
     __tablename__ = "permissions"
+    __table_args__ = (soft_delete_index("permissions"),)
 
     name = Column(String(100), nullable=False, unique=True)
     description = Column(String(300))
@@ -1,11 +1,12 @@
 from src.core.shared.identity_map import IdentityMap
-from src.adapters.driven.repositories.models.base_model import BaseModel
+from src.adapters.driven.repositories.models.base_model import BaseModel, soft_delete_index
 from src.core.domain.entities.person import Person
 from sqlalchemy import Column, String, Date
 
 
 class PersonModel(BaseModel):
     __tablename__ = "persons"
+    __table_args__ = (soft_delete_index("persons"),)
 
     name = Column(String(100))
     cpf = Column(String(11), unique=True)
@@ -32,7 +33,15 @@ class PersonModel(BaseModel):
         if existing:
             return existing
         
-        person = Person(
+        person = self.build_entity()
+        identity_map.add(person)
+        return person
+
+    def build_entity(self) -> Person:
+        """
+        Cria a entidade sem consultar nem registrar no IdentityMap (usado nas exportações).
+        """
+        return Person(
             id=self.id,
             created_at=self.created_at,
             updated_at=self.updated_at,
@@ -42,5 +51,3 @@ class PersonModel(BaseModel):
             email=self.email,
             birth_date=self.birth_date
         )
-        identity_map.add(person)
-        return person
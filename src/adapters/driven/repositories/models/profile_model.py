@@ -1,13 +1,16 @@
+from typing import Optional
+
 from sqlalchemy import Column, String
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Session, object_session, relationship
 
-from src.adapters.driven.repositories.models.base_model import BaseModel
-from src.core.domain.entities.profile import Profile
+from src.adapters.driven.repositories.models.base_model import BaseModel, soft_delete_index
+from src.core.domain.entities.profile import LazyList, Profile
 from src.core.shared.identity_map import IdentityMap
 
 
 class ProfileModel(BaseModel):
     __tablename__ = "profiles"
+    __table_args__ = (soft_delete_index("profiles"),)
 
     name = Column(String(100), nullable=False, unique=True)
     description = Column(String(300))
@@ -43,10 +46,12 @@ class ProfileModel(BaseModel):
         profile = Profile(
             id=self.id,
             name=self.name,
+            # Permissões resolvidas enquanto a sessão está aberta: a entidade não guarda referência a este model
             profile_permissions=[profile_permission.to_entity() for profile_permission in self.profile_permissions],
             permissions=[permission.to_entity() for permission in self.permissions],
             # user_profiles=[user_profile.to_entity() for user_profile in self.user_profiles],
-            users=[user.to_entity() for user in self.users],
+            # Usuários sob demanda: carregar um perfil não materializa todos os seus usuários
+            users=self.users_loader(object_session(self), self.id),
             description=self.description,
             created_at=self.created_at,
             updated_at=self.updated_at,
@@ -55,5 +60,29 @@ class ProfileModel(BaseModel):
         identity_map.add(profile)
         return profile
 
+    @staticmethod
+    def users_loader(session: Optional[Session], profile_id: Optional[int]) -> LazyList:
+        """
+        Consulta os usuários do perfil pelo id, sem depender de uma instância de ProfileModel
+        ainda ligada à sessão.
+        """
+        if session is None or profile_id is None:
+            return []
+
+        def load_users() -> list:
+            from src.adapters.driven.repositories.models.user_model import UserModel
+            from src.adapters.driven.repositories.models.user_profile_model import UserProfileModel
+
+            return [
+                user_model.to_entity()
+                for user_model in (
+                    session.query(UserModel)
+                    .join(UserProfileModel, UserProfileModel.user_id == UserModel.id)
+                    .filter(UserProfileModel.profile_id == profile_id)
+                )
+            ]
+
+        return load_users
+
 
 __all__ = ["ProfileModel"]
@@ -1,12 +1,17 @@
 from src.core.domain.entities.profile_permission import ProfilePermission
 from src.core.shared.identity_map import IdentityMap
-from src.adapters.driven.repositories.models.base_model import BaseModel
-from sqlalchemy import Column, ForeignKey
+from src.adapters.driven.repositories.models.base_model import BaseModel, soft_delete_index
+from sqlalchemy import Column, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 
 class ProfilePermissionModel(BaseModel):
     __tablename__ = 'profile_permissions'
+    __table_args__ = (
+        soft_delete_index('profile_permissions'),
+        Index('ix_profile_permissions_profile_id_id', 'profile_id', 'id'),
+        Index('ix_profile_permissions_permission_id_profile_id', 'permission_id', 'profile_id'),
+    )
 
     profile_id = Column(ForeignKey('profiles.id'), nullable=False)
     profile = relationship('ProfileModel', back_populates='profile_permissions', overlaps="permissions,profiles")
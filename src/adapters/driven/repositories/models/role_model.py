@@ -1,6 +1,6 @@
 from src.core.shared.identity_map import IdentityMap
 from src.core.domain.entities.role import Role
-from src.adapters.driven.repositories.models.base_model import BaseModel
+from src.adapters.driven.repositories.models.base_model import BaseModel, soft_delete_index
 
 from sqlalchemy import Column, String
 
@@ -8,6 +8,7 @@ from sqlalchemy import Column, String
 
 class RoleModel(BaseModel):
     __tablename__ = 'roles'
+    __table_args__ = (soft_delete_index('roles'),)
 
     name = Column(String(100), nullable=False, unique=True)
     description = Column(String(100))
@@ -2,13 +2,14 @@
 from sqlalchemy import Column, String
 from sqlalchemy.orm import relationship
 
-from src.adapters.driven.repositories.models.base_model import BaseModel
+from src.adapters.driven.repositories.models.base_model import BaseModel, soft_delete_index
 from src.core.domain.entities.user import User
 from src.core.shared.identity_map import IdentityMap
 
 
 class UserModel(BaseModel):
     __tablename__ = "users"
+    __table_args__ = (soft_delete_index("users"),)
 
     name = Column(String(100), nullable=False, unique=True)
     password_hash = Column(String(255), nullable=False, unique=False)
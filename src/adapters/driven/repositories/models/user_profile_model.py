@@ -1,13 +1,18 @@
-from sqlalchemy import Column, ForeignKey
+from sqlalchemy import Column, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
-from src.adapters.driven.repositories.models.base_model import BaseModel
+from src.adapters.driven.repositories.models.base_model import BaseModel, soft_delete_index
 from src.core.domain.entities.user_profile import UserProfile
 from src.core.shared.identity_map import IdentityMap
 
 
 class UserProfileModel(BaseModel):
     __tablename__ = "user_profiles"
+    __table_args__ = (
+        soft_delete_index("user_profiles"),
+        Index("ix_user_profiles_user_id_profile_id", "user_id", "profile_id"),
+        Index("ix_user_profiles_profile_id_user_id", "profile_id", "user_id"),
+    )
 
     user_id = Column(ForeignKey("users.id"), nullable=False)
     user = relationship("UserModel", back_populates="user_profiles", overlaps="profiles,users") #Alterado para UserModel
@@ -0,0 +1,38 @@
+from datetime import datetime
+from typing import List
+
+from sqlalchemy.orm import Session
+
+from src.adapters.driven.repositories.models.outbox_event_model import OutboxEventModel
+from src.core.domain.entities.outbox_event import OutboxEvent
+from src.core.ports.outbox.i_outbox_repository import IOutboxRepository
+
+
+class OutboxRepository(IOutboxRepository):
+    def __init__(self, db_session: Session):
+        self.db_session = db_session
+
+    def add(self, event: OutboxEvent) -> None:
+        self.db_session.add(OutboxEventModel.from_entity(event))
+
+    def claim_due(self, limit: int, now: datetime) -> List[OutboxEvent]:
+        # SKIP LOCKED: com mais de uma instância, cada despachante fica com eventos diferentes
+        # (no SQLite o FOR UPDATE é ignorado)
+        event_models = (
+            self.db_session.query(OutboxEventModel)
+            .filter(
+                OutboxEventModel.processed_at.is_(None),
+                OutboxEventModel.dead_lettered_at.is_(None),
+                OutboxEventModel.available_at <= now,
+            )
+            .order_by(OutboxEventModel.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+        return [event_model.to_entity() for event_model in event_models]
+
+    def update_all(self, events: List[OutboxEvent]) -> None:
+        for event in events:
+            self.db_session.merge(OutboxEventModel.from_entity(event))
+        self.db_session.commit()
@@ -0,0 +1,19 @@
+from typing import Optional
+
+from sqlalchemy.orm import Query
+
+
+def paginate(query: Query, model, limit: Optional[int] = None, after_id: Optional[int] = None) -> Query:
+    """
+    Paginação por chave (keyset): ordena pelo id e continua a partir do último id da página
+    anterior. Sem OFFSET, o custo de cada página não depende da posição dela na tabela.
+    """
+    query = query.order_by(model.id)
+    if after_id is not None:
+        query = query.filter(model.id > after_id)
+    if limit is not None:
+        query = query.limit(limit)
+    return query
+
+
+__all__ = ["paginate"]
@@ -1,16 +1,21 @@
+from config.database_routing import replica_reads
 from src.adapters.driven.repositories.models.permission_model import PermissionModel
+from src.adapters.driven.repositories.pagination import paginate
 from src.core.shared.identity_map import IdentityMap
+from src.core.shared.profile_permission_cache import ProfilePermissionCache
 from src.core.domain.entities.permission import Permission
 from src.core.ports.permission.i_permission_repository import IPermissionRepository
 from sqlalchemy.orm import Session
 from sqlalchemy.sql import exists
-from typing import List
+from typing import List, Optional
 
+@replica_reads
 class PermissionRepository(IPermissionRepository):
 
     def __init__(self, db_session: Session):
         self.db_session = db_session
         self.identity_map = IdentityMap.get_instance()
+        self.permission_cache = ProfilePermissionCache.get_instance()
 
     def create(self, permission: Permission) -> Permission:
         if permission.id is not None:
@@ -21,6 +26,7 @@ class PermissionRepository(IPermissionRepository):
         permission_model = PermissionModel.from_entity(permission)
         self.db_session.add(permission_model)
         self.db_session.commit()
+        self.permission_cache.invalidate()
         self.db_session.refresh(permission_model)
         return permission_model.to_entity()
     
@@ -39,11 +45,11 @@ class PermissionRepository(IPermissionRepository):
             return None
         return permission_model.to_entity()
     
-    def get_all(self, include_deleted: bool = False) -> List[Permission]:
+    def get_all(self, include_deleted: bool = False, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[Permission]:
         query = self.db_session.query(PermissionModel)
         if not include_deleted:
             query = query.filter(PermissionModel.inactivated_at.is_(None))
-        permission_models = query.all()
+        permission_models = paginate(query, PermissionModel, limit, after_id).all()
         return [permission_model.to_entity() for permission_model in permission_models]
     
     def update(self, permission: Permission) -> Permission:
@@ -55,6 +61,7 @@ class PermissionRepository(IPermissionRepository):
         permission_model = PermissionModel.from_entity(permission)
         self.db_session.merge(permission_model)
         self.db_session.commit()
+        self.permission_cache.invalidate()
         return permission_model.to_entity()
     
     def delete(self, permission: Permission) -> None:
@@ -67,4 +74,5 @@ class PermissionRepository(IPermissionRepository):
         if permission_model:
             self.db_session.delete(permission_model)
             self.db_session.commit()
+            self.permission_cache.invalidate()
             self.identity_map.remove(permission)
@@ -1,17 +1,25 @@
-from typing import List
+from typing import Iterator, List, Optional
 from sqlalchemy.sql import exists
 from sqlalchemy.orm import Session
+from config.settings import EXPORT_BATCH_SIZE
+from config.database_routing import replica_reads
+from src.core.shared.customer_auth_cache import CustomerAuthCache
 from src.core.shared.identity_map import IdentityMap
 from src.adapters.driven.repositories.models.person_model import PersonModel
+from src.adapters.driven.repositories.pagination import paginate
+from src.adapters.driven.repositories.read_models import person_columns, person_dto_from_row
+from src.core.domain.dtos.person.person_dto import PersonDTO
 from src.core.domain.entities.person import Person
 from src.core.ports.person.i_person_repository import IPersonRepository
 
 
+@replica_reads
 class PersonRepository(IPersonRepository):
 
     def __init__(self, db_session: Session):
         self.db_session = db_session
         self.identity_map = IdentityMap.get_instance()
+        self.auth_cache = CustomerAuthCache.get_instance()
 
     def create(self, person: Person) -> Person:
         if person.id is not None:
@@ -22,6 +30,7 @@ class PersonRepository(IPersonRepository):
         person_model = PersonModel.from_entity(person)
         self.db_session.add(person_model)
         self.db_session.commit()
+        self.auth_cache.invalidate(person_model.cpf)
         self.db_session.refresh(person_model)
         return person_model.to_entity()
 
@@ -43,25 +52,47 @@ class PersonRepository(IPersonRepository):
             return None
         return person_model.to_entity()
 
-    def get_all(self, include_deleted: bool = False) -> List[Person]:
+    def get_all(self, include_deleted: bool = False, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[Person]:
         query = self.db_session.query(PersonModel)
         if not include_deleted:
             query = query.filter(PersonModel.inactivated_at.is_(None))
-        persons_models = query.all()
+        persons_models = paginate(query, PersonModel, limit, after_id).all()
         return [person_model.to_entity() for person_model in persons_models]
 
+    def get_all_dtos(self, include_deleted: bool = False, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[PersonDTO]:
+        query = self.db_session.query(*person_columns())
+        if not include_deleted:
+            query = query.filter(PersonModel.inactivated_at.is_(None))
+        rows = paginate(query, PersonModel, limit, after_id).all()
+        return [person_dto_from_row(row) for row in rows]
+
+    def stream_all(self, include_deleted: bool = False) -> Iterator[Person]:
+        # Sessão própria: o cursor fica aberto durante toda a exportação sem ocupar a sessão compartilhada.
+        # As entidades não passam pelo IdentityMap, mantendo a memória constante.
+        with Session(bind=self.db_session.get_bind()) as session:
+            query = session.query(PersonModel)
+            if not include_deleted:
+                query = query.filter(PersonModel.inactivated_at.is_(None))
+            for person_model in query.order_by(PersonModel.id).yield_per(EXPORT_BATCH_SIZE):
+                yield person_model.build_entity()
+
     def update(self, person: Person) -> Person:
         existing = self.identity_map.get(Person, person.id)
         if existing:
             self.identity_map.remove(existing)
+        # A entidade recebida já traz o CPF novo: o anterior vem do banco para sair do cache de login
+        previous_cpf = self.db_session.query(PersonModel.cpf).filter(PersonModel.id == person.id).scalar()
         person_model = PersonModel.from_entity(person)
         self.db_session.merge(person_model)
         self.db_session.commit()
+        self.auth_cache.invalidate(previous_cpf, person.cpf)
         return person_model.to_entity()
 
     def delete(self, person_id: int) -> None:
         person_model = self.db_session.query(PersonModel).filter(PersonModel.id == person_id).first()
         if person_model is not None:
+            cpf = person_model.cpf
             self.db_session.delete(person_model)
             self.db_session.commit()
+            self.auth_cache.invalidate(cpf)
             self.identity_map.remove(person_model.to_entity())
@@ -1,17 +1,22 @@
+from config.database_routing import replica_reads
 from src.adapters.driven.repositories.models.profile_permission_model import ProfilePermissionModel
+from src.adapters.driven.repositories.pagination import paginate
 from src.core.shared.identity_map import IdentityMap
+from src.core.shared.profile_permission_cache import ProfilePermissionCache
 from src.core.ports.profile_permission.i_profile_permission_repository import IProfilePermissionRepository
 from src.core.domain.entities.profile_permission import ProfilePermission
 
 from sqlalchemy.orm import Session
 from sqlalchemy.sql import exists
-from typing import List
+from typing import List, Optional
 
 
+@replica_reads
 class ProfilePermissionRepository(IProfilePermissionRepository):
     def __init__(self, db_session: Session):
         self.db_session = db_session
         self.identity_map = IdentityMap.get_instance()
+        self.permission_cache = ProfilePermissionCache.get_instance()
     
     def create(self, profile_permission: ProfilePermission) -> ProfilePermission:
         if profile_permission.id is not None:
@@ -22,6 +27,7 @@ class ProfilePermissionRepository(IProfilePermissionRepository):
         profile_permission_model = ProfilePermissionModel.from_entity(profile_permission)
         self.db_session.add(profile_permission_model)
         self.db_session.commit()
+        self.permission_cache.invalidate()
         self.db_session.refresh(profile_permission_model)
         return profile_permission_model.to_entity()
     
@@ -29,9 +35,9 @@ class ProfilePermissionRepository(IProfilePermissionRepository):
         return (
             self.db_session.query(
                 exists()
-                .where(ProfilePermission.permission_id == permission_id and ProfilePermission.profile_id == profile_id)
+                .where(ProfilePermissionModel.permission_id == permission_id, ProfilePermissionModel.profile_id == profile_id)
             )
-            .first()
+            .scalar()
         )
     
     def get_by_id(self, profile_permission_id: int) -> ProfilePermission:
@@ -74,11 +80,11 @@ class ProfilePermissionRepository(IProfilePermissionRepository):
             return None
         return profile_permission_model.to_entity()
     
-    def get_all(self, include_deleted: bool = False) -> List[ProfilePermission]:
+    def get_all(self, include_deleted: bool = False, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[ProfilePermission]:
         query = self.db_session.query(ProfilePermissionModel)
         if not include_deleted:
             query = query.filter(ProfilePermissionModel.inactivated_at.is_(None))
-        profile_permission_models = query.all()
+        profile_permission_models = paginate(query, ProfilePermissionModel, limit, after_id).all()
         return [ppm.to_entity() for ppm in profile_permission_models]
     
     def update(self, profile_permission: ProfilePermission) -> ProfilePermission:
@@ -96,6 +102,7 @@ class ProfilePermissionRepository(IProfilePermissionRepository):
 
         self.db_session.merge(profile_permission_model)
         self.db_session.commit()
+        self.permission_cache.invalidate()
         return profile_permission_model.to_entity()
     
     def delete(self, profile_permission: ProfilePermission) -> None:
@@ -108,4 +115,5 @@ class ProfilePermissionRepository(IProfilePermissionRepository):
         if profile_permission_model:
             self.db_session.delete(profile_permission)
             self.db_session.commit()
+            self.permission_cache.invalidate()
             self.identity_map.remove(profile_permission)
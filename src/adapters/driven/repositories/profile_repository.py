@@ -1,16 +1,23 @@
+from config.database_routing import on_primary, replica_reads
+from src.adapters.driven.repositories.models.permission_model import PermissionModel
+from src.adapters.driven.repositories.pagination import paginate
 from src.adapters.driven.repositories.models.profile_model import ProfileModel
+from src.adapters.driven.repositories.models.profile_permission_model import ProfilePermissionModel
 from src.core.shared.identity_map import IdentityMap
+from src.core.shared.profile_permission_cache import ProfilePermissionCache
 from src.core.domain.entities.profile import Profile
 from src.core.ports.profile.i_profile_repository import IProfileRepository
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy.sql import exists
-from typing import List
+from typing import List, Optional, Tuple
 
+@replica_reads
 class ProfileRepository(IProfileRepository):
 
     def __init__(self, db_session: Session):
         self.db_session = db_session
         self.identity_map = IdentityMap.get_instance()
+        self.permission_cache = ProfilePermissionCache.get_instance()
 
     def create(self, profile: Profile) -> Profile:
         if profile.id is not None:
@@ -21,29 +28,53 @@ class ProfileRepository(IProfileRepository):
         profile_model = ProfileModel.from_entity(profile)
         self.db_session.add(profile_model)
         self.db_session.commit()
+        self.permission_cache.invalidate()
         self.db_session.refresh(profile_model)
         return profile_model.to_entity()
     
     def exists_by_name(self, name: str) -> bool:
         return self.db_session.query(exists().where(ProfileModel.name == name)).scalar()
     
-    def get_by_name(self, name: str) -> Profile:
-        profile_model = self.db_session.query(ProfileModel).filter(ProfileModel.name == name).first()
+    def get_by_name(self, name: str, permission_names_only: bool = False) -> Profile:
+        if permission_names_only:
+            return self._get_permission_names_projection(ProfileModel.name == name)
+
+        profile_model = self._query_profiles().filter(ProfileModel.name == name).first()
         if not profile_model:
             return None
         return profile_model.to_entity()
+
+    def get_permission_names(self, name: str) -> Optional[Tuple[str, ...]]:
+        permission_names = self.permission_cache.get(name)
+        if permission_names is not None:
+            return permission_names
+
+        version = self.permission_cache.version
+        # O cache só é preenchido com leituras do banco principal: uma réplica atrasada
+        # devolveria permissões já revogadas, que ficariam cacheadas sob a versão nova
+        with on_primary():
+            profile_id = self.db_session.query(ProfileModel.id).filter(ProfileModel.name == name).scalar()
+            if profile_id is None:
+                return None
+            permission_names = self._query_permission_names(profile_id)
+
+        self.permission_cache.set(name, permission_names, version)
+        return permission_names
     
-    def get_by_id(self, profile_id: int) -> Profile:
-        profile_model = self.db_session.query(ProfileModel).filter(ProfileModel.id == profile_id).first()
+    def get_by_id(self, profile_id: int, permission_names_only: bool = False) -> Profile:
+        if permission_names_only:
+            return self._get_permission_names_projection(ProfileModel.id == profile_id)
+
+        profile_model = self._query_profiles().filter(ProfileModel.id == profile_id).first()
         if not profile_model:
             return None
         return profile_model.to_entity()
     
-    def get_all(self, include_deleted: bool = False) -> List[Profile]:
-        query = self.db_session.query(ProfileModel)
+    def get_all(self, include_deleted: bool = False, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[Profile]:
+        query = self._query_profiles()
         if not include_deleted:
             query = query.filter(ProfileModel.inactivated_at.is_(None))
-        profile_models = query.all()
+        profile_models = paginate(query, ProfileModel, limit, after_id).all()
         return [profile_model.to_entity() for profile_model in profile_models]
     
     def update(self, profile: Profile) -> Profile:
@@ -55,6 +86,7 @@ class ProfileRepository(IProfileRepository):
         profile_model = ProfileModel.from_entity(profile)
         self.db_session.merge(profile_model)
         self.db_session.commit()
+        self.permission_cache.invalidate()
         return profile_model.to_entity()
     
     def delete(self, profile_id: int) -> None:
@@ -62,4 +94,76 @@ class ProfileRepository(IProfileRepository):
         if profile_model:
             self.db_session.delete(profile_model)
             self.db_session.commit()
+            self.permission_cache.invalidate()
             self.identity_map.remove(profile_model)
+
+    def _query_profiles(self):
+        # Permissões carregadas junto com os perfis: to_entity as resolve sem uma consulta por perfil
+        return self.db_session.query(ProfileModel).options(
+            selectinload(ProfileModel.permissions),
+            selectinload(ProfileModel.profile_permissions).joinedload(ProfilePermissionModel.permission),
+        )
+
+    def _query_permission_names(self, profile_id: int) -> Tuple[str, ...]:
+        return tuple(
+            permission_name
+            for (permission_name,) in (
+                self.db_session.query(PermissionModel.name)
+                .join(ProfilePermissionModel, ProfilePermissionModel.permission_id == PermissionModel.id)
+                .filter(ProfilePermissionModel.profile_id == profile_id)
+                .order_by(ProfilePermissionModel.id)
+            )
+        )
+
+    def _get_permission_names_projection(self, criterion) -> Optional[Profile]:
+        """
+        Carrega apenas as colunas do perfil e os nomes das suas permissões, sem instanciar o ProfileModel.
+        As demais coleções ficam disponíveis sob demanda.
+        """
+        row = (
+            self.db_session.query(
+                ProfileModel.id,
+                ProfileModel.name,
+                ProfileModel.description,
+                ProfileModel.created_at,
+                ProfileModel.updated_at,
+                ProfileModel.inactivated_at,
+            )
+            .filter(criterion)
+            .first()
+        )
+        if row is None:
+            return None
+
+        existing = self.identity_map.get(Profile, row.id)
+        if existing:
+            return existing
+
+        profile = Profile(
+            id=row.id,
+            name=row.name,
+            description=row.description,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+            inactivated_at=row.inactivated_at,
+            permission_names=self._query_permission_names(row.id),
+            profile_permissions=lambda: [
+                profile_permission_model.to_entity()
+                for profile_permission_model in (
+                    self.db_session.query(ProfilePermissionModel)
+                    .filter(ProfilePermissionModel.profile_id == row.id)
+                )
+            ],
+            permissions=lambda: [
+                permission_model.to_entity()
+                for permission_model in (
+                    self.db_session.query(PermissionModel)
+                    .join(ProfilePermissionModel, ProfilePermissionModel.permission_id == PermissionModel.id)
+                    .filter(ProfilePermissionModel.profile_id == row.id)
+                    .order_by(ProfilePermissionModel.id)
+                )
+            ],
+            users=ProfileModel.users_loader(self.db_session, row.id),
+        )
+        self.identity_map.add(profile)
+        return profile
@@ -0,0 +1,77 @@
+from typing import Tuple
+
+from sqlalchemy.engine import Row
+from sqlalchemy.sql.elements import Label
+
+from src.adapters.driven.repositories.models.person_model import PersonModel
+from src.adapters.driven.repositories.models.role_model import RoleModel
+from src.adapters.driven.repositories.models.user_model import UserModel
+from src.core.domain.dtos.person.person_dto import PersonDTO
+from src.core.domain.dtos.role.role_dto import RoleDTO
+from src.core.domain.dtos.user.user_dto import UserDTO
+
+# Caminho de leitura das listagens: seleciona somente as colunas expostas nos DTOs e monta
+# os DTOs direto das linhas, sem instanciar os *Model, sem rastreamento pela sessão e sem
+# passar pelo IdentityMap. Os dados já foram validados na escrita, por isso os DTOs são
+# criados com `model_construct`; a validação acontece uma única vez, na serialização da resposta.
+
+
+def person_columns(prefix: str = "") -> Tuple[Label, ...]:
+    return (
+        PersonModel.id.label(f"{prefix}id"),
+        PersonModel.cpf.label(f"{prefix}cpf"),
+        PersonModel.name.label(f"{prefix}name"),
+        PersonModel.email.label(f"{prefix}email"),
+        PersonModel.birth_date.label(f"{prefix}birth_date"),
+    )
+
+
+def person_dto_from_row(row: Row, prefix: str = "") -> PersonDTO:
+    values = row._mapping
+    return PersonDTO.model_construct(
+        id=values[f"{prefix}id"],
+        cpf=values[f"{prefix}cpf"],
+        name=values[f"{prefix}name"],
+        email=values[f"{prefix}email"],
+        birth_date=values[f"{prefix}birth_date"],
+    )
+
+
+def role_columns(prefix: str = "") -> Tuple[Label, ...]:
+    return (
+        RoleModel.id.label(f"{prefix}id"),
+        RoleModel.name.label(f"{prefix}name"),
+        RoleModel.description.label(f"{prefix}description"),
+    )
+
+
+def role_dto_from_row(row: Row, prefix: str = "") -> RoleDTO:
+    values = row._mapping
+    return RoleDTO.model_construct(
+        id=values[f"{prefix}id"],
+        name=values[f"{prefix}name"],
+        description=values[f"{prefix}description"],
+    )
+
+
+def user_columns(prefix: str = "") -> Tuple[Label, ...]:
+    # Nunca inclui o hash da senha
+    return (
+        UserModel.id.label(f"{prefix}id"),
+        UserModel.name.label(f"{prefix}name"),
+    )
+
+
+def user_dto_from_row(row: Row, prefix: str = "") -> UserDTO:
+    values = row._mapping
+    return UserDTO.model_construct(id=values[f"{prefix}id"], name=values[f"{prefix}name"])
+
+
+__all__ = [
+    "person_columns",
+    "person_dto_from_row",
+    "role_columns",
+    "role_dto_from_row",
+    "user_columns",
+    "user_dto_from_row",
+]
@@ -1,13 +1,16 @@
+from config.database_routing import replica_reads
 from src.core.shared.identity_map import IdentityMap
 from src.core.ports.role.i_role_repository import IRoleRepository
 from src.core.domain.entities.role import Role
 from src.adapters.driven.repositories.models.role_model import RoleModel
+from src.adapters.driven.repositories.pagination import paginate
 
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from sqlalchemy.sql import exists
 
 
+@replica_reads
 class RoleRepository(IRoleRepository):
     def __init__(self, db_session: Session):
         self.db_session = db_session
@@ -47,11 +50,11 @@ class RoleRepository(IRoleRepository):
             return None
         return role_model.to_entity()
     
-    def get_all(self, include_deleted: bool = False) -> List[Role]:
+    def get_all(self, include_deleted: bool = False, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[Role]:
         query = self.db_session.query(RoleModel)
         if not include_deleted:
             query = query.filter(RoleModel.inactivated_at.is_(None))
-        role_models = query.all()
+        role_models = paginate(query, RoleModel, limit, after_id).all()
         return [role_model.to_entity() for role_model in role_models]
     
     def update(self, role: Role) -> Role:
@@ -78,4 +81,4 @@ class RoleRepository(IRoleRepository):
             self.identity_map.remove(role)
 
     def exists_by_name(self, name: str) -> bool:
-        return self.db_session.query(exists().where(Role.name == name)).scalar()
+        return self.db_session.query(exists().where(RoleModel.name == name)).scalar()
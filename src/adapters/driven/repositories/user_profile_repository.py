@@ -1,13 +1,16 @@
 from typing import Optional
 from sqlalchemy.orm import Session
 
+from config.database_routing import replica_reads
 from src.adapters.driven.repositories.models.user_profile_model import UserProfileModel
+from src.adapters.driven.repositories.pagination import paginate
 from src.core.shared.identity_map import IdentityMap
 from src.core.ports.user_profile.i_user_profile_repository import IUserProfileRepository
 from src.core.domain.entities.user_profile import UserProfile
 
 
 
+@replica_reads
 class UserProfileRepository(IUserProfileRepository):
 
     def __init__(self, db_session: Session):
@@ -37,11 +40,11 @@ class UserProfileRepository(IUserProfileRepository):
             return None
         return user_profile_model.to_entity()
     
-    def get_all(self, include_deleted: Optional[bool] = False) -> list[UserProfile]:
+    def get_all(self, include_deleted: Optional[bool] = False, limit: Optional[int] = None, after_id: Optional[int] = None) -> list[UserProfile]:
         query = self.db_session.query(UserProfileModel)
         if not include_deleted:
             query = query.filter(UserProfileModel.inactivated_at.is_(None))
-        user_profile_models = query.all()
+        user_profile_models = paginate(query, UserProfileModel, limit, after_id).all()
         return [user_profile_model.to_entity() for user_profile_model in user_profile_models]
     
     def update(self, user_profile: UserProfile) -> UserProfile:
@@ -1,12 +1,15 @@
+from config.database_routing import replica_reads
 from src.adapters.driven.repositories.models.user_model import UserModel
+from src.adapters.driven.repositories.pagination import paginate
 from src.core.shared.identity_map import IdentityMap
 from src.core.ports.user.i_user_repository import IUserRepository
 from src.core.domain.entities.user import User
 
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 
+@replica_reads
 class UserRepository(IUserRepository):
     def __init__(self, db_session: Session):
         self.db_session = db_session
@@ -36,11 +39,11 @@ class UserRepository(IUserRepository):
             return None
         return user_model.to_entity()
 
-    def get_all(self, include_deleted: bool = False) -> List[User]:
+    def get_all(self, include_deleted: bool = False, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[User]:
         query =  self.db_session.query(UserModel)
         if not include_deleted:
             query = query.filter(UserModel.inactivated_at.is_(None))
-        user_models = query.all()
+        user_models = paginate(query, UserModel, limit, after_id).all()
         return [user_model.to_entity() for user_model in user_models]
     
     def update(self, user: User) -> User:
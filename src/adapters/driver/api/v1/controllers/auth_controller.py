@@ -8,6 +8,14 @@ from src.core.domain.dtos.auth.auth_dto import AuthByCpfDTO, LoginDTO, TokenDTO
 from src.core.ports.customer.i_customer_repository import ICustomerRepository
 from src.core.ports.employee.i_employee_repository import IEmployeeRepository
 from src.core.ports.profile.i_profile_repository import IProfileRepository
+from src.core.ports.user.i_user_repository import IUserRepository
+from src.core.ports.employee.i_async_employee_repository import IAsyncEmployeeRepository
+from src.core.ports.profile.i_async_profile_repository import IAsyncProfileRepository
+from src.core.ports.user.i_async_user_repository import IAsyncUserRepository
+from src.application.usecases.auth_usecase.login_employee_async_db_usecase import LoginEmployeeAsyncDbUseCase
+from src.core.shared.password_hashing_executor import PasswordHashingExecutor
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Callable, Optional
 
 class AuthController:
     def __init__(
@@ -16,11 +24,22 @@ class AuthController:
         employee_gateway: IEmployeeRepository,
         customer_gateway: ICustomerRepository,
         auth_provider_gateway: IAuthProviderGateway,
+        user_gateway: IUserRepository,
+        async_session: Optional[Callable[[], AsyncSession]] = None,
+        async_employee_gateway: Optional[Callable[..., IAsyncEmployeeRepository]] = None,
+        async_profile_gateway: Optional[Callable[..., IAsyncProfileRepository]] = None,
+        async_user_gateway: Optional[Callable[..., IAsyncUserRepository]] = None,
     ):
         self.profile_gateway: IProfileRepository = profile_gateway
         self.employee_gateway: IEmployeeRepository = employee_gateway
         self.customer_gateway: ICustomerRepository = customer_gateway
         self.auth_provider_gateway: IAuthProviderGateway = auth_provider_gateway
+        self.user_gateway: IUserRepository = user_gateway
+        # Pilha asyncio: abre uma sessão por login e monta os repositórios assíncronos sobre ela
+        self.async_session = async_session
+        self.async_employee_gateway = async_employee_gateway
+        self.async_profile_gateway = async_profile_gateway
+        self.async_user_gateway = async_user_gateway
         
     def login_customer_by_cpf(self, dto: AuthByCpfDTO) -> TokenDTO:
         login_customer_by_cpf_use_case = LoginCustomerByCpfUseCase.build(self.customer_gateway, self.profile_gateway, self.auth_provider_gateway)
@@ -33,6 +52,21 @@ class AuthController:
         return DTOPresenter.transform_from_dict(token, TokenDTO)
     
     def login_employee(self, dto: LoginDTO) -> TokenDTO:
-        login_employee_use_case = LoginEmployeeUseCase.build(self.employee_gateway, self.profile_gateway)
+        login_employee_use_case = LoginEmployeeUseCase.build(self.employee_gateway, self.profile_gateway, self.user_gateway)
         token = login_employee_use_case.execute(dto)
         return DTOPresenter.transform_from_dict(token, TokenDTO)
+
+    async def login_employee_async(self, dto: LoginDTO) -> TokenDTO:
+        login_employee_use_case = LoginEmployeeUseCase.build(self.employee_gateway, self.profile_gateway, self.user_gateway)
+        token = await login_employee_use_case.execute_async(dto, PasswordHashingExecutor.get_instance())
+        return DTOPresenter.transform_from_dict(token, TokenDTO)
+
+    async def login_employee_async_db(self, dto: LoginDTO) -> TokenDTO:
+        async with self.async_session() as db_session:
+            login_employee_use_case = LoginEmployeeAsyncDbUseCase.build(
+                self.async_employee_gateway(db_session=db_session),
+                self.async_profile_gateway(db_session=db_session),
+                self.async_user_gateway(db_session=db_session),
+            )
+            token = await login_employee_use_case.execute(dto, PasswordHashingExecutor.get_instance())
+        return DTOPresenter.transform_from_dict(token, TokenDTO)
@@ -62,10 +62,9 @@ class EmployeeController:
         employees = list_employees_by_role_id_use_case.execute(role_id)
         return DTOPresenter.transform_list(employees, EmployeeDTO)
 
-    def get_all_employees(self, include_deleted: Optional[bool] = False) -> list[EmployeeDTO]:
+    def get_all_employees(self, include_deleted: Optional[bool] = False, limit: Optional[int] = None, after_id: Optional[int] = None) -> list[EmployeeDTO]:
         get_all_employees_use_case = GetAllEmployeesUseCase.build(self.employee_gateway)
-        employees = get_all_employees_use_case.execute(include_deleted=include_deleted)
-        return DTOPresenter.transform_list(employees, EmployeeDTO)
+        return get_all_employees_use_case.execute(include_deleted=include_deleted, limit=limit, after_id=after_id)
 
     def update_employee(self, employee_id: int, dto: UpdateEmployeeDTO) -> EmployeeDTO:
         update_employee_use_case = UpdateEmployeeUseCase.build(
@@ -32,9 +32,9 @@ class PermissionController:
         permission = permission_by_id_usecase.execute(permission_id)
         return DTOPresenter.transform(permission, PermissionDTO)
     
-    def get_all_permissions(self, include_deleted: Optional[bool]) -> List[PermissionDTO]:
+    def get_all_permissions(self, include_deleted: Optional[bool], limit: Optional[int] = None, after_id: Optional[int] = None) -> List[PermissionDTO]:
         all_permissions_usecase = GetAllPermissionsUsecase.build(self.permission_gateway)
-        permissions = all_permissions_usecase.execute(include_deleted)
+        permissions = all_permissions_usecase.execute(include_deleted, limit=limit, after_id=after_id)
         return DTOPresenter.transform_list(permissions, PermissionDTO)
     
     def update_permission(self, permission_id: int, dto: CreatePermissionDTO) -> PermissionDTO:
@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import Iterator, Optional, List
 
 from src.core.ports.person.i_person_repository import IPersonRepository
 from src.core.domain.dtos.person.create_person_dto import CreatePersonDTO
@@ -8,6 +8,7 @@ from src.adapters.driver.api.v1.presenters.dto_presenter import DTOPresenter
 from src.application.usecases.person_usecase.get_person_by_cpf_usecase import GetPersonByCpfUsecase
 from src.application.usecases.person_usecase.get_person_by_id_usecase import GetPersonByIdUsecase
 from src.application.usecases.person_usecase.get_all_persons_usecase import GetAllPersonsUsecase
+from src.application.usecases.person_usecase.export_persons_usecase import ExportPersonsUsecase
 from src.core.domain.dtos.person.update_person_dto import UpdatePersonDTO
 from src.application.usecases.person_usecase.update_person_usecase import UpdatePersonUsecase
 from src.application.usecases.person_usecase.delete_person_usecase import DeletePersonUsecase
@@ -33,10 +34,14 @@ class PersonController:
         person = person_by_id_usecase.execute(person_id)
         return DTOPresenter.transform(person, PersonDTO)
     
-    def get_all_persons(self, include_deleted: Optional[bool] = False) -> List[PersonDTO]:
+    def get_all_persons(self, include_deleted: Optional[bool] = False, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[PersonDTO]:
         all_persons_usecase = GetAllPersonsUsecase.build(self.person_gateway)
-        persons = all_persons_usecase.execute(include_deleted)
-        return DTOPresenter.transform_list(persons, PersonDTO)
+        return all_persons_usecase.execute(include_deleted, limit=limit, after_id=after_id)
+
+    def export_persons(self, include_deleted: Optional[bool] = False) -> Iterator[PersonDTO]:
+        export_persons_usecase = ExportPersonsUsecase.build(self.person_gateway)
+        persons = export_persons_usecase.execute(include_deleted)
+        return (DTOPresenter.transform(person, PersonDTO) for person in persons)
     
     def update_person(self, person_id: int, dto: UpdatePersonDTO) -> PersonDTO:
         update_person_usecase = UpdatePersonUsecase.build(self.person_gateway)
@@ -32,9 +32,9 @@ class ProfileController:
         profile = profile_by_id_usecase.execute(profile_id)
         return DTOPresenter.transform(profile, ProfileDTO)
     
-    def get_all_profiles(self, include_deleted: Optional[bool]) -> List[ProfileDTO]:
+    def get_all_profiles(self, include_deleted: Optional[bool], limit: Optional[int] = None, after_id: Optional[int] = None) -> List[ProfileDTO]:
         all_profiles_usecase = GetAllProfilesUsecase.build(self.profile_gateway)
-        profiles = all_profiles_usecase.execute(include_deleted)
+        profiles = all_profiles_usecase.execute(include_deleted, limit=limit, after_id=after_id)
         return DTOPresenter.transform_list(profiles, ProfileDTO)
     
     def update_profile(self, profile_id: int, dto: CreateProfileDTO) -> ProfileDTO:
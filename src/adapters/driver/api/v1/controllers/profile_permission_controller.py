@@ -55,9 +55,9 @@ class ProfilePermissionController:
         profile_permission = get_profile_permission_by_profile_id_usecase.execute(profile_id)
         return DTOPresenter.transform(profile_permission, ProfilePermissionDTO)
     
-    def get_all_profile_permissions(self, include_deleted: Optional[bool] = False) -> List[ProfilePermissionDTO]:
+    def get_all_profile_permissions(self, include_deleted: Optional[bool] = False, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[ProfilePermissionDTO]:
         get_all_profile_permissions_usecase = GetAllProfilePermissionsUsecase.build(self.profile_permission_gateway)
-        profile_permissions = get_all_profile_permissions_usecase.execute(include_deleted)
+        profile_permissions = get_all_profile_permissions_usecase.execute(include_deleted, limit=limit, after_id=after_id)
         return DTOPresenter.transform_list(profile_permissions, ProfilePermissionDTO)
     
     def update_profile_permission(
@@ -33,9 +33,9 @@ class RoleController:
         role = role_by_id_usecase.exexute(role_id)
         return DTOPresenter.transform(role, RoleDTO)
     
-    def get_all_roles(self, include_deleted: Optional[bool] = False) -> List[RoleDTO]:
+    def get_all_roles(self, include_deleted: Optional[bool] = False, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[RoleDTO]:
         all_roles_usecase = GetAllRolesUsecase.build(self.role_gateway)
-        roles = all_roles_usecase.execute(include_deleted)
+        roles = all_roles_usecase.execute(include_deleted, limit=limit, after_id=after_id)
         return DTOPresenter.transform_list(roles, RoleDTO)
     
     def update_role(self, role_id: int, dto: UpdateRoleDTO) -> RoleDTO:
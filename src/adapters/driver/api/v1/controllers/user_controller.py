@@ -32,9 +32,9 @@ class UserController:
         user = user_by_id_usecase.execute(user_id)
         return DTOPresenter.transform(user, UserDTO)
     
-    def get_all_users(self, include_deleted: Optional[bool]) -> List[UserDTO]:
+    def get_all_users(self, include_deleted: Optional[bool], limit: Optional[int] = None, after_id: Optional[int] = None) -> List[UserDTO]:
         all_users_usecase = GetAllUsersUsecase.build(self.user_gateway)
-        users = all_users_usecase.execute(include_deleted)
+        users = all_users_usecase.execute(include_deleted, limit=limit, after_id=after_id)
         return DTOPresenter.transform_list(users, UserDTO)
 
     def update_user(self, user_id: int, dto: CreateUserDTO) -> UserDTO:
@@ -41,9 +41,9 @@ class UserProfileController:
         user_profile = user_profile_by_user_id_and_profile_id_usecase.execute(user_id, profile_id)
         return DTOPresenter.transform(user_profile, UserProfileDTO)
 
-    def get_all_user_profiles(self, include_deleted: Optional[bool] = False) -> List[UserProfileDTO]:
+    def get_all_user_profiles(self, include_deleted: Optional[bool] = False, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[UserProfileDTO]:
         all_user_profiles_usecase = GetAllUserProfilesUsecase.build(self.user_profile_gateway)
-        user_profiles = all_user_profiles_usecase.execute(include_deleted)
+        user_profiles = all_user_profiles_usecase.execute(include_deleted, limit=limit, after_id=after_id)
         return DTOPresenter.transform_list(user_profiles, UserProfileDTO)
     
     def update_user_profile(self, user_profile_id, dto: UpdateUserProfileDTO) -> UserProfileDTO:
@@ -1,3 +1,9 @@
+import re
+from typing import Dict, FrozenSet, Iterable, List, Pattern
+
+from starlette.routing import BaseRoute, compile_path
+
+
 def bypass_auth():
     """
     Decorator para adicionar o atributo `bypass_auth` ao endpoint.
@@ -7,4 +13,45 @@ def bypass_auth():
         if not hasattr(func, "bypass_auth"):
             func.bypass_auth = True
         return func
-    return decorator
\ No newline at end of file
+    return decorator
+
+
+class BypassRouteTable:
+    """
+    Tabela pré-compilada dos endpoints marcados com `bypass_auth`, indexada por método HTTP.
+    Caminhos fixos ficam em um conjunto e caminhos com parâmetros em uma única regex por método.
+    """
+
+    _NAMED_GROUP = re.compile(r"\(\?P<\w+>")
+
+    def __init__(self, routes: Iterable[BaseRoute]):
+        exact_paths: Dict[str, set] = {}
+        templated_paths: Dict[str, List[str]] = {}
+
+        for route in routes:
+            path = getattr(route, "path", None)
+            methods = getattr(route, "methods", None)
+            if not path or not methods or not getattr(getattr(route, "endpoint", None), "bypass_auth", False):
+                continue
+
+            path_regex, _, param_convertors = compile_path(path)
+            for method in methods:
+                if param_convertors:
+                    # Remove os grupos nomeados para que rotas com o mesmo parâmetro possam ser unidas
+                    pattern = self._NAMED_GROUP.sub("(?:", path_regex.pattern.lstrip("^").rstrip("$"))
+                    templated_paths.setdefault(method, []).append(pattern)
+                else:
+                    exact_paths.setdefault(method, set()).add(path)
+
+        self._exact_paths: Dict[str, FrozenSet[str]] = {
+            method: frozenset(paths) for method, paths in exact_paths.items()
+        }
+        self._templated_paths: Dict[str, Pattern] = {
+            method: re.compile(f"^(?:{'|'.join(patterns)})$") for method, patterns in templated_paths.items()
+        }
+
+    def is_bypassed(self, method: str, path: str) -> bool:
+        if path in self._exact_paths.get(method, ()):
+            return True
+        matcher = self._templated_paths.get(method)
+        return matcher is not None and matcher.match(path) is not None
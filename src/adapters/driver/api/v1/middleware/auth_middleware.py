@@ -1,74 +1,94 @@
-from fastapi import Request, status
-from starlette.middleware.base import BaseHTTPMiddleware
+from typing import Optional
+from fastapi import status
+from starlette.datastructures import Headers
 from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+from src.adapters.driver.api.v1.decorators.bypass_auth import BypassRouteTable
 from src.core.exceptions.utils import ErrorCode
-from src.core.utils.jwt_util import JWTUtil
+from src.core.auth.auth_claims import AuthClaims
 import logging
 
-class AuthMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        open_routes = [
-            "/openapi.json",
-            "/docs",
-            "/docs/oauth2-redirect",
-            "/redoc",
-            "/api/v1/auth/token",
-            "/api/v1/health",
-        ]
-        if any(request.url.path.startswith(route) for route in open_routes):
-            return await call_next(request)
+OPEN_ROUTE_PREFIXES = (
+    "/openapi.json",
+    "/docs",
+    "/docs/oauth2-redirect",
+    "/redoc",
+    "/api/v1/auth/token",
+)
 
-        for route in request.app.router.routes:
-            if (
-                hasattr(route, "path")
-                and hasattr(route, "methods")
-                and route.path == request.url.path
-                and request.method in route.methods
-            ):
-                if getattr(route.endpoint, "bypass_auth", False):
-                    return await call_next(request)
+# Rotas abertas apenas no caminho exato: os diagnósticos em /api/v1/health/... exigem token
+OPEN_ROUTES = frozenset({
+    "/api/v1/health",
+})
 
+class AuthMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self._bypass_routes: Optional[BypassRouteTable] = None
 
-        token = request.headers.get("Authorization")
+    def _get_bypass_routes(self, scope: Scope) -> BypassRouteTable:
+        # Construída uma única vez, quando todas as rotas já foram registradas na aplicação
+        if self._bypass_routes is None:
+            self._bypass_routes = BypassRouteTable(scope["app"].router.routes)
+        return self._bypass_routes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        if path in OPEN_ROUTES or path.startswith(OPEN_ROUTE_PREFIXES) or self._get_bypass_routes(scope).is_bypassed(scope["method"], path):
+            await self.app(scope, receive, send)
+            return
+
+        token = Headers(scope=scope).get("Authorization")
         if not token:
-            return JSONResponse(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                content={
-                    "error": {
-                        "code": ErrorCode.UNAUTHORIZED.value,
-                        "message": ErrorCode.UNAUTHORIZED.description,
-                        "details": "Missing Authorization header",
-                    }
-                },
+            response = self._create_error_response(
+                status.HTTP_401_UNAUTHORIZED, ErrorCode.UNAUTHORIZED, "Missing Authorization header"
             )
+            await response(scope, receive, send)
+            return
 
         try:
             token = token.split("Bearer ")[1]
-            payload = JWTUtil.decode_token(token)
-            request.state.user = payload
+            claims = AuthClaims.from_token(token)
         except ValueError as e:
             logging.error(f"Unauthorized access: {e}")
-            return JSONResponse(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                content={
-                    "error": {
-                        "code": ErrorCode.UNAUTHORIZED.value,
-                        "message": ErrorCode.UNAUTHORIZED.description,
-                        "details": e.detail.get('message', str(e)),
-                    }
-                },
+            response = self._create_error_response(
+                status.HTTP_401_UNAUTHORIZED, ErrorCode.UNAUTHORIZED, self._get_error_details(e)
             )
+            await response(scope, receive, send)
+            return
         except Exception as e:
             logging.error(f"Forbidden access: {e}")
-            return JSONResponse(
-                status_code=status.HTTP_403_FORBIDDEN,
-                content={
-                    "error": {
-                        "code": ErrorCode.FORBIDDEN.value,
-                        "message": ErrorCode.FORBIDDEN.description,
-                        "details": e.detail.get('message', str(e)),
-                    }
-                },
+            response = self._create_error_response(
+                status.HTTP_403_FORBIDDEN, ErrorCode.FORBIDDEN, self._get_error_details(e)
             )
+            await response(scope, receive, send)
+            return
+
+        # Mesmo dicionário usado por `request.state`
+        state = scope.setdefault("state", {})
+        state["user"] = claims.payload
+        state["claims"] = claims
+
+        await self.app(scope, receive, send)
+
+    def _get_error_details(self, exc: Exception) -> str:
+        detail = getattr(exc, "detail", None)
+        if isinstance(detail, dict):
+            return detail.get("message", str(exc))
+        return str(exc)
 
-        return await call_next(request)
+    def _create_error_response(self, status_code: int, error_code: ErrorCode, details: str) -> JSONResponse:
+        return JSONResponse(
+            status_code=status_code,
+            content={
+                "error": {
+                    "code": error_code.value,
+                    "message": error_code.description,
+                    "details": details,
+                }
+            },
+        )
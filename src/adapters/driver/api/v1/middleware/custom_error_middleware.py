@@ -9,6 +9,7 @@ from src.core.exceptions.entity_not_found_exception import EntityNotFoundExcepti
 from src.core.exceptions.forbidden_exception import ForbiddenException
 from src.core.exceptions.invalid_credentials_exception import InvalidCredentialsException
 from src.core.exceptions.invalid_token_exception import InvalidTokenException
+from src.core.exceptions.service_unavailable_exception import ServiceUnavailableException
 from src.core.exceptions.unauthorized_access_exception import UnauthorizedAccessException
 from src.core.exceptions.validation_exception import ValidationException
 
@@ -40,7 +41,8 @@ class CustomErrorMiddleware:
             InvalidCredentialsException: status.HTTP_401_UNAUTHORIZED,
             InvalidTokenException: status.HTTP_401_UNAUTHORIZED,
             ValidationException: status.HTTP_422_UNPROCESSABLE_ENTITY,
-            BadRequestException: status.HTTP_400_BAD_REQUEST
+            BadRequestException: status.HTTP_400_BAD_REQUEST,
+            ServiceUnavailableException: status.HTTP_503_SERVICE_UNAVAILABLE,
         }
         status_code = status_code_map.get(type(exc), status.HTTP_500_INTERNAL_SERVER_ERROR)
 
@@ -0,0 +1,15 @@
+from config.database_routing import RoutingState
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+class DatabaseRoutingMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Read-your-writes vale dentro da requisição: cada uma começa lendo das réplicas
+        with RoutingState.scope():
+            await self.app(scope, receive, send)
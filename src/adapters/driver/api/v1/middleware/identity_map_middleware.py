@@ -1,5 +1,4 @@
-
-from src.core.containers import Container
+from src.core.shared.identity_map import IdentityMap
 from starlette.types import ASGIApp, Receive, Scope, Send
 
 class IdentityMapMiddleware:
@@ -11,5 +10,6 @@ class IdentityMapMiddleware:
             await self.app(scope, receive, send)
             return
 
-        Container.identity_map.reset()  # Garante que uma nova instância seja criada
-        await self.app(scope, receive, send)
+        # Cada requisição recebe o seu próprio mapa, sem interferir nas requisições concorrentes
+        with IdentityMap.scope():
+            await self.app(scope, receive, send)
@@ -0,0 +1,23 @@
+from typing import Iterable, Iterator
+
+from pydantic import BaseModel
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+class NDJSONPresenter:
+
+    @staticmethod
+    def stream(dtos: Iterable[BaseModel], lines_per_chunk: int = 500) -> Iterator[str]:
+        """
+        Serializa os DTOs em NDJSON (um objeto JSON por linha), agrupando as linhas em blocos
+        para reduzir a quantidade de escritas no socket.
+        """
+        chunk = []
+        for dto in dtos:
+            chunk.append(dto.model_dump_json())
+            if len(chunk) >= lines_per_chunk:
+                yield "\n".join(chunk) + "\n"
+                chunk = []
+        if chunk:
+            yield "\n".join(chunk) + "\n"
@@ -0,0 +1,17 @@
+from typing import Any, List
+
+from fastapi import Response
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class PaginationPresenter:
+
+    @staticmethod
+    def set_next_cursor(response: Response, items: List[Any], limit: int) -> List[Any]:
+        """
+        Informa no header `X-Next-Cursor` o `after_id` da próxima página, quando a página veio cheia.
+        """
+        if items and len(items) >= limit:
+            response.headers[NEXT_CURSOR_HEADER] = str(items[-1].id)
+        return items
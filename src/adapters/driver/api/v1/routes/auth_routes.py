@@ -1,7 +1,9 @@
 from typing import Annotated
 from fastapi import APIRouter, Depends
 from dependency_injector.wiring import inject, Provide
+from starlette.concurrency import run_in_threadpool
 
+from config.database import ASYNC_DATABASE_ENABLED
 from src.core.containers import Container
 from src.adapters.driver.api.v1.controllers.auth_controller import AuthController
 from src.core.auth.oauth2_password_request_form_custom import OAuth2PasswordRequestFormCustom
@@ -12,13 +14,18 @@ router = APIRouter()
 
 @router.post("/auth/token", response_model=TokenDTO)
 @inject
-def get_oauth_token(
+async def get_oauth_token(
     form_data: Annotated[OAuth2PasswordRequestFormCustom, Depends()],
     auth_controller: AuthController = Depends(Provide[Container.auth_controller])
 ):
     if form_data.username and form_data.password:
-        return auth_controller.login_employee(LoginDTO(username=form_data.username, password=form_data.password))
+        login_dto = LoginDTO(username=form_data.username, password=form_data.password)
+        if ASYNC_DATABASE_ENABLED:
+            # Consultas pelo AsyncEngine, aguardadas no event loop
+            return await auth_controller.login_employee_async_db(login_dto)
+        # O bcrypt roda no executor dedicado, fora do threadpool usado pelas demais rotas
+        return await auth_controller.login_employee_async(login_dto)
     elif form_data.username:
-        return auth_controller.login_customer_by_cpf(AuthByCpfDTO(cpf=form_data.username))
+        return await run_in_threadpool(auth_controller.login_customer_by_cpf, AuthByCpfDTO(cpf=form_data.username))
    
-    return auth_controller.login_customer_anonymous()
+    return await run_in_threadpool(auth_controller.login_customer_anonymous)
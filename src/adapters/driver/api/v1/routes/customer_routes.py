@@ -1,7 +1,9 @@
-from fastapi import APIRouter, Depends, status, Security
+from fastapi import APIRouter, Depends, status, Security, Query, Response
 from typing import List, Optional
+from fastapi.responses import StreamingResponse
 from dependency_injector.wiring import inject, Provide
 
+from config.settings import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from src.adapters.driver.api.v1.decorators.bypass_auth import bypass_auth
 from src.core.domain.dtos.customer.customer_dto import CustomerDTO
 from src.core.domain.dtos.customer.create_customer_dto import CreateCustomerDTO
@@ -9,6 +11,8 @@ from src.core.domain.dtos.customer.update_customer_dto import UpdateCustomerDTO
 from src.core.auth.dependencies import get_current_user
 from src.constants.permissions import CustomerPermissions
 from src.adapters.driver.api.v1.controllers.customer_controller import CustomerController
+from src.adapters.driver.api.v1.presenters.pagination_presenter import PaginationPresenter
+from src.adapters.driver.api.v1.presenters.ndjson_presenter import NDJSON_MEDIA_TYPE, NDJSONPresenter
 from src.core.containers import Container
 
 
@@ -67,11 +71,31 @@ def get_customer_by_person_id(
 )
 @inject
 def get_all_customers(
+    response: Response,
     include_deleted: Optional[bool] = False,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after_id: Optional[int] = Query(None, ge=0),
     controller: CustomerController = Depends(Provide[Container.customer_controller]),
     user: dict = Security(get_current_user)
 ):
-    return controller.get_all_customers(user, include_deleted=include_deleted)
+    customers = controller.get_all_customers(user, include_deleted=include_deleted, limit=limit, after_id=after_id)
+    return PaginationPresenter.set_next_cursor(response, customers, limit)
+
+
+@router.get(
+        '/customers/export',
+        response_class=StreamingResponse,
+        status_code=status.HTTP_200_OK,
+        dependencies=[Security(get_current_user, scopes=[CustomerPermissions.CAN_VIEW_CUSTOMERS])]
+)
+@inject
+def export_customers(
+    include_deleted: Optional[bool] = False,
+    controller: CustomerController = Depends(Provide[Container.customer_controller]),
+    user: dict = Security(get_current_user)
+):
+    customers = controller.export_customers(user, include_deleted=include_deleted)
+    return StreamingResponse(NDJSONPresenter.stream(customers), media_type=NDJSON_MEDIA_TYPE)
 
 
 @router.put(
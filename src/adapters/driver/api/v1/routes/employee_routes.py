@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Depends, status, Security
+from fastapi import APIRouter, Depends, status, Security, Query, Response
 from typing import List, Optional
 from dependency_injector.wiring import inject, Provide
 
+from config.settings import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from src.adapters.driver.api.v1.controllers.employee_controller import EmployeeController
+from src.adapters.driver.api.v1.presenters.pagination_presenter import PaginationPresenter
 from src.core.domain.dtos.employee.employee_dto import EmployeeDTO
 from src.core.domain.dtos.employee.create_employee_dto import CreateEmployeeDTO
 from src.core.domain.dtos.employee.update_employee_dto import UpdateEmployeeDTO
@@ -97,11 +99,15 @@ def list_employees_by_role_id(
 )
 @inject
 def get_all_employees(
+    response: Response,
     include_deleted: Optional[bool] = False,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after_id: Optional[int] = Query(None, ge=0),
     controller: EmployeeController = Depends(Provide[Container.employee_controller]),
     user: dict = Security(get_current_user)
 ):
-    return controller.get_all_employees(include_deleted=include_deleted)
+    employees = controller.get_all_employees(include_deleted=include_deleted, limit=limit, after_id=after_id)
+    return PaginationPresenter.set_next_cursor(response, employees, limit)
 
 
 @router.put(
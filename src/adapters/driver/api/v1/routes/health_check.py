@@ -1,9 +1,31 @@
-from src.schemas.health_check_schema import HealthCheckSchemaOut
+from src.schemas.health_check_schema import CustomerAuthCacheStatusSchemaOut, DatabasePoolStatusSchemaOut, HealthCheckSchemaOut
 from src.application.usecases.health_check_usecase.health_check_usecase import HealthCheckUseCase
-from fastapi import APIRouter, status
+from src.application.usecases.health_check_usecase.database_pool_status_usecase import DatabasePoolStatusUseCase
+from src.application.usecases.health_check_usecase.customer_auth_cache_status_usecase import CustomerAuthCacheStatusUseCase
+from src.constants.permissions import HealthCheckPermissions
+from src.core.auth.dependencies import get_current_user
+from fastapi import APIRouter, Security, status
 
 router = APIRouter()
 
 @router.get("/health", response_model=HealthCheckSchemaOut, status_code=status.HTTP_200_OK)
 async def health_check():
     return HealthCheckUseCase().execute()
+
+@router.get(
+    "/health/database",
+    response_model=DatabasePoolStatusSchemaOut,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Security(get_current_user, scopes=[HealthCheckPermissions.CAN_VIEW_DIAGNOSTICS])]
+)
+async def database_pool_status():
+    return DatabasePoolStatusUseCase().execute()
+
+@router.get(
+    "/health/customer-auth-cache",
+    response_model=CustomerAuthCacheStatusSchemaOut,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Security(get_current_user, scopes=[HealthCheckPermissions.CAN_VIEW_DIAGNOSTICS])]
+)
+async def customer_auth_cache_status():
+    return CustomerAuthCacheStatusUseCase().execute()
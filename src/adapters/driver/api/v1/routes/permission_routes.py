@@ -1,13 +1,15 @@
-from fastapi import APIRouter, Depends, Security, status, Query
+from fastapi import APIRouter, Depends, Security, status, Query, Response
 from typing import List, Optional
 from dependency_injector.wiring import inject, Provide
 
+from config.settings import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from src.constants.permissions import PermissionPermissions
 from src.core.auth.dependencies import get_current_user
 from src.core.domain.dtos.permission.permission_dto import PermissionDTO
 from src.core.domain.dtos.permission.create_permission_dto import CreatePermissionDTO
 from src.core.domain.dtos.permission.update_permission_dto import UpdatePermissionDTO
 from src.adapters.driver.api.v1.controllers.permission_controller import PermissionController
+from src.adapters.driver.api.v1.presenters.pagination_presenter import PaginationPresenter
 from src.core.containers import Container
 
 
@@ -68,11 +70,15 @@ def get_permission_by_id(
 )
 @inject
 def get_all_permissions(
+    response: Response,
     include_deleted: Optional[bool] = Query(False),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after_id: Optional[int] = Query(None, ge=0),
     controller: PermissionController = Depends(Provide[Container.permission_controller]),
     user=Depends(get_current_user)
 ):
-    return controller.get_all_permissions(include_deleted)
+    permissions = controller.get_all_permissions(include_deleted, limit=limit, after_id=after_id)
+    return PaginationPresenter.set_next_cursor(response, permissions, limit)
 
 
 @router.put(
@@ -1,13 +1,17 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, Security, status
+from fastapi import APIRouter, Depends, Security, status, Query, Response
+from fastapi.responses import StreamingResponse
 from dependency_injector.wiring import inject, Provide
 
+from config.settings import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from src.constants.permissions import PersonPermissions
 from src.core.auth.dependencies import get_current_user
 from src.core.domain.dtos.person.update_person_dto import UpdatePersonDTO
 from src.core.domain.dtos.person.person_dto import PersonDTO
 from src.core.domain.dtos.person.create_person_dto import CreatePersonDTO
 from src.adapters.driver.api.v1.controllers.person_controller import PersonController
+from src.adapters.driver.api.v1.presenters.pagination_presenter import PaginationPresenter
+from src.adapters.driver.api.v1.presenters.ndjson_presenter import NDJSON_MEDIA_TYPE, NDJSONPresenter
 from src.core.containers import Container
 
 
@@ -67,11 +71,31 @@ def get_person_by_id(
 )
 @inject
 def get_all_person(
+    response: Response,
     include_deleted: Optional[bool] = False,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after_id: Optional[int] = Query(None, ge=0),
     controller: PersonController = Depends(Provide[Container.person_controller]),
     user=Depends(get_current_user)
 ):
-    return controller.get_all_persons(include_deleted)
+    persons = controller.get_all_persons(include_deleted, limit=limit, after_id=after_id)
+    return PaginationPresenter.set_next_cursor(response, persons, limit)
+
+
+@router.get(
+    "/person/export",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Security(get_current_user, scopes=[PersonPermissions.CAN_VIEW_PERSONS])]
+)
+@inject
+def export_persons(
+    include_deleted: Optional[bool] = False,
+    controller: PersonController = Depends(Provide[Container.person_controller]),
+    user=Depends(get_current_user)
+):
+    persons = controller.export_persons(include_deleted)
+    return StreamingResponse(NDJSONPresenter.stream(persons), media_type=NDJSON_MEDIA_TYPE)
 
 
 @router.put(
@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Depends, Security, status
+from fastapi import APIRouter, Depends, Security, status, Query, Response
 from typing import List, Optional
 from dependency_injector.wiring import inject, Provide
 
+from config.settings import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from src.adapters.driver.api.v1.controllers.profile_permission_controller import ProfilePermissionController
+from src.adapters.driver.api.v1.presenters.pagination_presenter import PaginationPresenter
 from src.constants.permissions import ProfilePermissionPermissions
 from src.core.auth.dependencies import get_current_user
 from src.core.domain.dtos.profile_permission.profile_permission_dto import ProfilePermissionDTO
@@ -83,11 +85,15 @@ def get_profile_permission_by_profile_id(
 )
 @inject
 def get_all_profile_permissions(
+    response: Response,
     include_deleted: Optional[bool] = False,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after_id: Optional[int] = Query(None, ge=0),
     controller: ProfilePermissionController = Depends(Provide[Container.profile_permission_controller]),
     user=Depends(get_current_user)
 ):
-    return controller.get_all_profile_permissions(include_deleted=include_deleted)
+    profile_permissions = controller.get_all_profile_permissions(include_deleted=include_deleted, limit=limit, after_id=after_id)
+    return PaginationPresenter.set_next_cursor(response, profile_permissions, limit)
 
 
 @router.put(
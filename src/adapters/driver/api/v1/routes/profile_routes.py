@@ -1,13 +1,15 @@
-from fastapi import APIRouter, Depends, Query, Security, status
+from fastapi import APIRouter, Depends, Query, Security, status, Response
 from typing import List, Optional
 from dependency_injector.wiring import inject, Provide
 
+from config.settings import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from src.constants.permissions import ProfilePermissions
 from src.core.auth.dependencies import get_current_user
 from src.core.domain.dtos.profile.profile_dto import ProfileDTO
 from src.core.domain.dtos.profile.create_profile_dto import CreateProfileDTO
 from src.core.domain.dtos.profile.update_profile_dto import UpdateProfileDTO
 from src.adapters.driver.api.v1.controllers.profile_controller import ProfileController
+from src.adapters.driver.api.v1.presenters.pagination_presenter import PaginationPresenter
 from src.core.containers import Container
 
 
@@ -68,11 +70,15 @@ def get_profile_by_id(
 )
 @inject
 def get_all_profiles(
+    response: Response,
     include_deleted: Optional[bool] = Query(False),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after_id: Optional[int] = Query(None, ge=0),
     controller: ProfileController = Depends(Provide[Container.profile_controller]),
     user=Depends(get_current_user)
 ):
-    return controller.get_all_profiles(include_deleted)
+    profiles = controller.get_all_profiles(include_deleted, limit=limit, after_id=after_id)
+    return PaginationPresenter.set_next_cursor(response, profiles, limit)
 
 
 @router.put(
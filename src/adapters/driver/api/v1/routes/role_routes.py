@@ -1,13 +1,15 @@
-from fastapi import APIRouter, Depends, Security, status, Query
+from fastapi import APIRouter, Depends, Security, status, Query, Response
 from typing import List, Optional
 from dependency_injector.wiring import inject, Provide
 
+from config.settings import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from src.core.auth.dependencies import get_current_user
 from src.constants.permissions import RolePermissions
 from src.core.domain.dtos.role.create_role_dto import CreateRoleDTO
 from src.core.domain.dtos.role.role_dto import RoleDTO
 from src.core.domain.dtos.role.update_role_dto import UpdateRoleDTO
 from src.adapters.driver.api.v1.controllers.role_controller import RoleController
+from src.adapters.driver.api.v1.presenters.pagination_presenter import PaginationPresenter
 from src.core.containers import Container
 
 
@@ -68,11 +70,15 @@ def get_role_by_id(
 )
 @inject
 def get_all_roles(
+    response: Response,
     include_deleted: Optional[bool] = Query(False),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after_id: Optional[int] = Query(None, ge=0),
     controller: RoleController = Depends(Provide[Container.role_controller]),
     user=Depends(get_current_user)
 ):
-    return controller.get_all_roles(include_deleted)
+    roles = controller.get_all_roles(include_deleted, limit=limit, after_id=after_id)
+    return PaginationPresenter.set_next_cursor(response, roles, limit)
 
 
 @router.put(
@@ -1,13 +1,15 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, Query, Security, status
+from fastapi import APIRouter, Depends, Query, Security, status, Response
 from dependency_injector.wiring import inject, Provide
 
+from config.settings import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from src.constants.permissions import UserProfilePermissions
 from src.core.auth.dependencies import get_current_user
 from src.core.domain.dtos.user_profile.create_user_profile_dto import CreateUserProfileDTO
 from src.core.domain.dtos.user_profile.update_user_profile_dto import UpdateUserProfileDTO
 from src.core.domain.dtos.user_profile.user_profile_dto import UserProfileDTO
 from src.adapters.driver.api.v1.controllers.user_profile_controller import UserProfileController
+from src.adapters.driver.api.v1.presenters.pagination_presenter import PaginationPresenter
 from src.core.containers import Container
 
 
@@ -65,11 +67,15 @@ def get_user_profile_by_user_id_and_profile_id(
 )
 @inject
 def get_all_user_profiles(
+    response: Response,
     include_deleted: Optional[bool] = Query(False),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after_id: Optional[int] = Query(None, ge=0),
     controller: UserProfileController = Depends(Provide[Container.user_profile_controller]),
     user: dict = Depends(get_current_user)
 ):
-    return controller.get_all_user_profiles(include_deleted=include_deleted)
+    user_profiles = controller.get_all_user_profiles(include_deleted=include_deleted, limit=limit, after_id=after_id)
+    return PaginationPresenter.set_next_cursor(response, user_profiles, limit)
 
 @router.put(
     path='/user-profiles/{user_profile_id}',
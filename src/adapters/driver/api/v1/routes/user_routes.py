@@ -1,13 +1,15 @@
-from fastapi import APIRouter, Depends, Security, status
+from fastapi import APIRouter, Depends, Security, status, Query, Response
 from typing import List, Optional
 from dependency_injector.wiring import inject, Provide
 
+from config.settings import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from src.constants.permissions import UserPermissions
 from src.core.auth.dependencies import get_current_user
 from src.core.domain.dtos.user.user_dto import UserDTO
 from src.core.domain.dtos.user.create_user_dto import CreateUserDTO
 from src.core.domain.dtos.user.update_user_dto import UpdateUserDTO
 from src.adapters.driver.api.v1.controllers.user_controller import UserController
+from src.adapters.driver.api.v1.presenters.pagination_presenter import PaginationPresenter
 from src.core.containers import Container
 
 
@@ -67,11 +69,15 @@ def get_user_by_id(
 )
 @inject
 def get_all_users(
+    response: Response,
     include_deleted: Optional[bool] = False,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after_id: Optional[int] = Query(None, ge=0),
     controller: UserController = Depends(Provide[Container.user_controller]),
     user: dict = Security(get_current_user)
 ):
-    return controller.get_all_users(include_deleted)
+    users = controller.get_all_users(include_deleted, limit=limit, after_id=after_id)
+    return PaginationPresenter.set_next_cursor(response, users, limit)
 
 
 @router.put(
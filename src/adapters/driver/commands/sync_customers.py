@@ -0,0 +1,109 @@
+"""
+Ressincroniza todos os clientes ativos com o provedor de identidade.
+
+Uso:
+    python -m src.adapters.driver.commands.sync_customers [--batch-size N] [--concurrency N]
+        [--pause-seconds S] [--max-pauses N]
+
+Sai com código 1 quando algum cliente não pôde ser sincronizado e com código 2 quando
+a sincronização foi interrompida por o provedor de identidade continuar indisponível.
+"""
+from typing import Callable, Dict, Optional, Sequence, TextIO
+import argparse
+import sys
+
+from sqlalchemy.orm import Session
+
+from config.settings import APIGW_SYNC_CONCURRENCY, APIGW_SYNC_MAX_PAUSES, APIGW_SYNC_PAUSE_SECONDS
+from src.adapters.driven.repositories.customer_repository import CustomerRepository
+from src.application.usecases.customer_usecase.sync_customers_usecase import SyncCustomersUsecase
+from src.core.exceptions.service_unavailable_exception import ServiceUnavailableException
+from src.core.ports.auth.i_auth_provider_gateway import IAuthProviderGateway
+from src.core.shared.identity_map import IdentityMap
+
+
+def format_progress(stats: Dict[str, float]) -> str:
+    elapsed = stats["elapsed"]
+    throughput = stats["processed"] / elapsed if elapsed > 0 else 0.0
+    pauses = f", {stats['pauses']} pausas" if stats.get("pauses") else ""
+    return (
+        f"{stats['processed']} clientes processados "
+        f"({stats['synced']} sincronizados, {stats['failed']} com falha{pauses}) "
+        f"em {elapsed:.1f}s - {throughput:.1f} clientes/s"
+    )
+
+
+def run(
+    session_factory: Callable[[], Session],
+    auth_provider_gateway: IAuthProviderGateway,
+    batch_size: int,
+    concurrency: int,
+    out: TextIO = sys.stdout,
+    pause_seconds: float = APIGW_SYNC_PAUSE_SECONDS,
+    max_pauses: int = APIGW_SYNC_MAX_PAUSES,
+) -> Dict[str, float]:
+    with session_factory() as session, IdentityMap.scope():
+        usecase = SyncCustomersUsecase.build(CustomerRepository(session), auth_provider_gateway)
+        stats = usecase.execute(
+            batch_size=batch_size,
+            concurrency=concurrency,
+            on_progress=lambda progress: print(format_progress(progress), file=out, flush=True),
+            pause_seconds=pause_seconds,
+            max_pauses=max_pauses,
+        )
+
+    print(f"Concluído: {format_progress(stats)}", file=out, flush=True)
+    return stats
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Ressincroniza os clientes ativos com o provedor de identidade.")
+    parser.add_argument("--batch-size", type=int, default=100, help="Clientes lidos do banco por lote (padrão: 100)")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=APIGW_SYNC_CONCURRENCY,
+        help=f"Chamadas simultâneas ao API Gateway (padrão: {APIGW_SYNC_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--pause-seconds",
+        type=float,
+        default=APIGW_SYNC_PAUSE_SECONDS,
+        help=f"Espera antes de repetir um lote que falhou por inteiro (padrão: {APIGW_SYNC_PAUSE_SECONDS:g})",
+    )
+    parser.add_argument(
+        "--max-pauses",
+        type=int,
+        default=APIGW_SYNC_MAX_PAUSES,
+        help=f"Pausas seguidas antes de interromper a sincronização (padrão: {APIGW_SYNC_MAX_PAUSES})",
+    )
+    args = parser.parse_args(argv)
+    if args.batch_size < 1 or args.concurrency < 1:
+        parser.error("--batch-size e --concurrency devem ser maiores que zero")
+    if args.pause_seconds < 0 or args.max_pauses < 0:
+        parser.error("--pause-seconds e --max-pauses não podem ser negativos")
+
+    # Importados aqui para que o --help funcione sem banco configurado
+    from config.database import SessionLocal
+    from src.adapters.driven.auth_providers.aws_cognito_gateway import AWSCognitoGateway
+
+    gateway = AWSCognitoGateway(pool_max_size=args.concurrency)
+    try:
+        stats = run(
+            SessionLocal,
+            gateway,
+            args.batch_size,
+            args.concurrency,
+            pause_seconds=args.pause_seconds,
+            max_pauses=args.max_pauses,
+        )
+    except ServiceUnavailableException as e:
+        print(f"Interrompido: {e}", file=sys.stderr, flush=True)
+        return 2
+    finally:
+        gateway.close()
+    return 1 if stats["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+from threading import Event, Thread
+from typing import Callable, Dict, Optional
+import logging
+
+from sqlalchemy.orm import Session
+
+from config.database_routing import RoutingState, on_primary
+from src.adapters.driven.repositories.outbox_repository import OutboxRepository
+from src.adapters.driven.repositories.person_repository import PersonRepository
+from src.application.usecases.outbox_usecase.dispatch_outbox_events_usecase import DispatchOutboxEventsUseCase
+from src.core.ports.auth.i_auth_provider_gateway import IAuthProviderGateway
+from src.core.shared.identity_map import IdentityMap
+
+
+class OutboxDispatcher:
+    """
+    Thread em segundo plano que esvazia o outbox: a cada `poll_interval` segundos entrega
+    lotes de eventos até não restar nenhum vencido. Cada rodada usa a própria sessão,
+    separada da sessão das requisições.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        auth_provider_gateway: IAuthProviderGateway,
+        batch_size: int,
+        poll_interval: float,
+        max_attempts: int,
+        retry_backoff: float,
+        retry_max_backoff: float,
+    ):
+        if batch_size < 1:
+            raise ValueError("Outbox batch size must be greater than zero")
+        self.session_factory = session_factory
+        self.auth_provider_gateway = auth_provider_gateway
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self.retry_max_backoff = retry_max_backoff
+        self._stop = Event()
+        self._thread: Optional[Thread] = None
+
+    def run_once(self) -> Dict[str, int]:
+        """
+        Processa um lote e retorna os contadores da rodada.
+
+        Cada rodada tem o próprio estado de roteamento e lê do primário: numa réplica atrasada,
+        uma pessoa recém-criada pareceria removida e o evento seria descartado.
+        """
+        session = self.session_factory()
+        try:
+            with IdentityMap.scope(), RoutingState.scope(), on_primary():
+                dispatch_usecase = DispatchOutboxEventsUseCase.build(
+                    OutboxRepository(session),
+                    PersonRepository(session),
+                    self.auth_provider_gateway,
+                    self.max_attempts,
+                    self.retry_backoff,
+                    self.retry_max_backoff,
+                )
+                return dispatch_usecase.execute(self.batch_size)
+        finally:
+            session.close()
+
+    def drain(self) -> None:
+        # Lote cheio sem falhas: pode haver mais eventos vencidos, segue sem esperar o intervalo
+        while not self._stop.is_set():
+            result = self.run_once()
+            if result["claimed"] < self.batch_size or result["processed"] + result["dead_lettered"] < result["claimed"]:
+                return
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.drain()
+            except Exception as e:
+                logging.error(f"Erro ao despachar eventos do outbox: {str(e)}")
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = Thread(target=self._run, name="outbox-dispatcher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
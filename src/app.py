@@ -1,6 +1,11 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from config.settings import OUTBOX_DISPATCHER_ENABLED
 from src.adapters.driver.api.v1.middleware.identity_map_middleware import IdentityMapMiddleware
+from src.adapters.driver.api.v1.middleware.database_routing_middleware import DatabaseRoutingMiddleware
 from src.core.containers import Container
+from src.core.domain.entities.user import User
 from src.adapters.driver.api.v1.middleware.auth_middleware import AuthMiddleware
 from src.adapters.driver.api.v1.middleware.custom_error_middleware import CustomErrorMiddleware
 from src.adapters.driver.api.v1.routes.health_check import router as health_check_router
@@ -15,15 +20,35 @@ from src.adapters.driver.api.v1.routes.customer_routes import router as customer
 from src.adapters.driver.api.v1.routes.employee_routes import router as employee_routes
 from src.adapters.driver.api.v1.routes.auth_routes import router as auth_routes
 
-app = FastAPI(title="Tech Challenger SOAT10 - Auth Microservice - FIAP")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Entrega em segundo plano os eventos do outbox (sincronização com o provedor de identidade)
+    outbox_dispatcher = app.container.outbox_dispatcher() if OUTBOX_DISPATCHER_ENABLED else None
+    if outbox_dispatcher:
+        outbox_dispatcher.start()
+    try:
+        yield
+    finally:
+        if outbox_dispatcher:
+            outbox_dispatcher.stop()
+        # Encerra as threads (ou processos) do executor de hash de senhas criadas pelos logins
+        app.container.password_hashing_executor().shutdown()
+
+
+app = FastAPI(title="Tech Challenger SOAT10 - Auth Microservice - FIAP", lifespan=lifespan)
 
 # Inicializando o container de dependências
 container = Container()
 app.container = container
 
+# Falha na inicialização quando PASSWORD_HASHER é inválido ou o argon2-cffi não está instalado
+User.use_password_hasher(container.password_hasher())
+
 app.add_middleware(CustomErrorMiddleware)
 app.add_middleware(AuthMiddleware)
 app.add_middleware(IdentityMapMiddleware)
+app.add_middleware(DatabaseRoutingMiddleware)
 
 # Adicionando rotas da versão 1
 app.include_router(health_check_router, prefix="/api/v1")
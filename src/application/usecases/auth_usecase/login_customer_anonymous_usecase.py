@@ -19,8 +19,9 @@ class LoginCustomerAnonymousUseCase:
         return cls(customer_gateway, profile_gateway)
 
     def execute(self) -> Dict[str, Any]:
-        customer_profile = self.profile_gateway.get_by_name("customer")
-        if not customer_profile:
+        profile_name = "customer"
+        permissions = self.profile_gateway.get_permission_names(profile_name)
+        if permissions is None:
             raise EntityNotFoundException(entity_name="Customer profile")
         
         anonymous_person = Person(name=f"Anonymous User - {uuid.uuid4().hex}")
@@ -33,8 +34,8 @@ class LoginCustomerAnonymousUseCase:
                 "name": customer.person.name,
             },
             "profile": {
-                "name": customer_profile.name,
-                "permissions": [permission.name for permission in customer_profile.permissions],
+                "name": profile_name,
+                "permissions": list(permissions),
             },
         }
 
@@ -1,5 +1,5 @@
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from src.core.ports.auth.i_auth_provider_gateway import IAuthProviderGateway
 from src.core.domain.dtos.auth.auth_dto import AuthByCpfDTO
 from src.core.domain.entities.customer import Customer
@@ -8,54 +8,88 @@ from src.core.exceptions.invalid_credentials_exception import InvalidCredentials
 from src.core.utils.jwt_util import JWTUtil
 from src.core.ports.customer.i_customer_repository import ICustomerRepository
 from src.core.ports.profile.i_profile_repository import IProfileRepository
+from src.core.shared.customer_auth_cache import CustomerAuthCache, CustomerAuthEntry
 
 
 class LoginCustomerByCpfUseCase:
     
-    def __init__(self, customer_gateway: ICustomerRepository, profile_gateway: IProfileRepository, auth_provider_gateway: IAuthProviderGateway):
+    def __init__(
+        self,
+        customer_gateway: ICustomerRepository,
+        profile_gateway: IProfileRepository,
+        auth_provider_gateway: IAuthProviderGateway,
+        auth_cache: Optional[CustomerAuthCache] = None,
+    ):
         self.customer_gateway = customer_gateway
         self.profile_gateway = profile_gateway
         self.auth_provider_gateway = auth_provider_gateway
+        self.auth_cache = auth_cache or CustomerAuthCache.get_instance()
         
     @classmethod
     def build(
         cls,
         customer_gateway: ICustomerRepository,
         profile_gateway: IProfileRepository,
-        auth_provider_gateway: IAuthProviderGateway
+        auth_provider_gateway: IAuthProviderGateway,
+        auth_cache: Optional[CustomerAuthCache] = None,
     ) -> 'LoginCustomerByCpfUseCase':
-        return cls(customer_gateway, profile_gateway, auth_provider_gateway)
+        return cls(customer_gateway, profile_gateway, auth_provider_gateway, auth_cache)
+
+    def _get_customer(self, cpf: str) -> Optional[CustomerAuthEntry]:
+        # Os totens repetem o mesmo CPF várias vezes: o resultado da consulta (inclusive
+        # "não encontrado") fica em cache até expirar ou até uma escrita no cliente ou na pessoa
+        entry = self.auth_cache.get(cpf)
+        if entry is CustomerAuthCache.UNKNOWN:
+            return None
+        if entry is not None:
+            return entry
+
+        version = self.auth_cache.version
+        # O cache só é preenchido com leituras do banco principal: uma réplica atrasada devolveria
+        # o cliente de antes da invalidação (ainda ativo ou com o CPF antigo), guardado sob a versão atual.
+        # As repetições do mesmo CPF saem do cache, então a leitura no principal acontece só no miss
+        customer: Customer = self.customer_gateway.get_by_cpf(cpf, consistent=True)
+        if customer:
+            entry = CustomerAuthEntry(
+                customer_id=customer.id,
+                name=customer.person.name,
+                cpf=customer.person.cpf,
+                email=customer.person.email,
+                is_deleted=customer.is_deleted(),
+            )
+        self.auth_cache.set(cpf, entry, version)
+        return entry
     
     def execute(self, dto: AuthByCpfDTO) -> Dict[str, Any]:
         # customer_exists = self.auth_provider_gateway.authenticate(dto.cpf)
         # if customer_exists is False:
         #     raise InvalidCredentialsException()
 
-        customer: Customer = self.customer_gateway.get_by_cpf(dto.cpf)
+        customer = self._get_customer(dto.cpf)
         if not customer:
             raise EntityNotFoundException(entity_name="Customer")
         
-        if customer.is_deleted():
+        if customer.is_deleted:
             raise InvalidCredentialsException()
 
-        customer_profile = self.profile_gateway.get_by_name("customer")
-        if not customer_profile:
+        profile_name = "customer"
+        permissions = self.profile_gateway.get_permission_names(profile_name)
+        if permissions is None:
             raise EntityNotFoundException(entity_name="Customer profile")
 
-        permissions = [permission.name for permission in customer_profile.permissions]
         if not permissions:
             raise EntityNotFoundException(entity_name="Customer permissions")
 
         token_payload = {
             "person": {
-                "id": str(customer.id),
-                "name": customer.person.name,
-                "cpf": customer.person.cpf,
-                "email": customer.person.email,
+                "id": str(customer.customer_id),
+                "name": customer.name,
+                "cpf": customer.cpf,
+                "email": customer.email,
             },
             "profile": {
-                "name": customer_profile.name,
-                "permissions": permissions,
+                "name": profile_name,
+                "permissions": list(permissions),
             },
         }
 
@@ -0,0 +1,45 @@
+from typing import Any, Dict
+
+from src.application.usecases.auth_usecase.login_employee_usecase import login_employee_flow, run_awaiting
+from src.core.domain.dtos.auth.auth_dto import LoginDTO
+from src.core.ports.employee.i_async_employee_repository import IAsyncEmployeeRepository
+from src.core.ports.profile.i_async_profile_repository import IAsyncProfileRepository
+from src.core.ports.user.i_async_user_repository import IAsyncUserRepository
+from src.core.shared.password_hashing_executor import PasswordHashingExecutor
+
+
+class LoginEmployeeAsyncDbUseCase:
+    """
+    Login de funcionários sobre os repositórios assíncronos: as consultas aguardam o banco
+    no próprio event loop, sem ocupar uma thread do threadpool por requisição.
+    O hash da senha continua no executor dedicado.
+    """
+
+    def __init__(
+        self,
+        employee_gateway: IAsyncEmployeeRepository,
+        profile_gateway: IAsyncProfileRepository,
+        user_gateway: IAsyncUserRepository,
+    ):
+        self.employee_gateway = employee_gateway
+        self.profile_gateway = profile_gateway
+        self.user_gateway = user_gateway
+
+    @classmethod
+    def build(
+        cls,
+        employee_gateway: IAsyncEmployeeRepository,
+        profile_gateway: IAsyncProfileRepository,
+        user_gateway: IAsyncUserRepository,
+    ) -> "LoginEmployeeAsyncDbUseCase":
+        return cls(employee_gateway, profile_gateway, user_gateway)
+
+    async def execute(self, login_dto: LoginDTO, password_hashing_executor: PasswordHashingExecutor) -> Dict[str, Any]:
+        return await login_employee_flow(
+            login_dto,
+            self.employee_gateway,
+            self.profile_gateway,
+            self.user_gateway,
+            run_awaiting,
+            password_hashing_executor.run,
+        )
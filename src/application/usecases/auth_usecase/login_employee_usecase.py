@@ -1,42 +1,118 @@
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Union
 
-from typing import Any, Dict
+from anyio import to_thread
 
 from src.core.domain.dtos.auth.auth_dto import LoginDTO
 from src.core.domain.entities.employee import Employee
+from src.core.domain.entities.user import User
 from src.core.exceptions.entity_not_found_exception import EntityNotFoundException
 from src.core.exceptions.invalid_credentials_exception import InvalidCredentialsException
+from src.core.ports.employee.i_async_employee_repository import IAsyncEmployeeRepository
 from src.core.ports.employee.i_employee_repository import IEmployeeRepository
+from src.core.ports.profile.i_async_profile_repository import IAsyncProfileRepository
 from src.core.ports.profile.i_profile_repository import IProfileRepository
+from src.core.ports.user.i_async_user_repository import IAsyncUserRepository
+from src.core.ports.user.i_user_repository import IUserRepository
+from src.core.shared.password_hashing_executor import PasswordHashingExecutor
 from src.core.utils.jwt_util import JWTUtil
 
 
+# Executa uma etapa do login (consulta ao banco ou hash de senha) e devolve o resultado aguardável
+StepRunner = Callable[..., Awaitable[Any]]
+
+
+async def run_awaiting(func: Callable[..., Awaitable[Any]], *args: Any) -> Any:
+    return await func(*args)
+
+
+async def login_employee_flow(
+    login_dto: LoginDTO,
+    employee_gateway: Union[IEmployeeRepository, IAsyncEmployeeRepository],
+    profile_gateway: Union[IProfileRepository, IAsyncProfileRepository],
+    user_gateway: Union[IUserRepository, IAsyncUserRepository],
+    run_db: StepRunner,
+    run_hashing: StepRunner,
+) -> Dict[str, Any]:
+    """
+    Fluxo assíncrono do login de funcionários, compartilhado pela versão no threadpool e pela versão
+    sobre os repositórios assíncronos: muda apenas como cada etapa é executada (`run_db` e `run_hashing`).
+    As regras ficam nos helpers de LoginEmployeeUseCase, usados também pelo `execute` síncrono.
+    """
+    employee: Employee = await run_db(employee_gateway.get_by_username, login_dto.username)
+    password_matches = bool(employee) and await run_hashing(
+        User.check_password, login_dto.password, employee.user.password_hash
+    )
+    LoginEmployeeUseCase.ensure_can_login(employee, password_matches)
+
+    if employee.user.needs_rehash():
+        # Senha conferida: atualiza o hash para o algoritmo e parâmetros atuais.
+        # O algoritmo vai junto com a chamada: no executor de processos o worker não tem o hasher instalado
+        employee.user.password_hash = await run_hashing(User.password_hasher.hash, login_dto.password)
+        await run_db(user_gateway.update, employee.user)
+
+    profile_name = LoginEmployeeUseCase.profile_name_for(employee)
+    permissions = await run_db(profile_gateway.get_permission_names, profile_name)
+    return LoginEmployeeUseCase.build_token(employee, profile_name, permissions)
+
+
 class LoginEmployeeUseCase:
     
-    def __init__(self, employee_gateway: IEmployeeRepository, profile_gateway: IProfileRepository):
+    def __init__(self, employee_gateway: IEmployeeRepository, profile_gateway: IProfileRepository, user_gateway: IUserRepository):
         self.employee_gateway = employee_gateway
         self.profile_gateway = profile_gateway
+        self.user_gateway = user_gateway
         
     @classmethod
-    def build(cls, employee_gateway: IEmployeeRepository, profile_gateway: IProfileRepository) -> "LoginEmployeeUseCase":
-        return cls(employee_gateway, profile_gateway)
+    def build(cls, employee_gateway: IEmployeeRepository, profile_gateway: IProfileRepository, user_gateway: IUserRepository) -> "LoginEmployeeUseCase":
+        return cls(employee_gateway, profile_gateway, user_gateway)
     
     def execute(self, login_dto: LoginDTO) -> Dict[str, Any]:
         employee: Employee = self.employee_gateway.get_by_username(login_dto.username)
-        if not employee or not employee.user.verify_password(login_dto.password):
+        password_matches = bool(employee) and User.check_password(login_dto.password, employee.user.password_hash)
+        self.ensure_can_login(employee, password_matches)
+
+        if employee.user.needs_rehash():
+            # Senha conferida: atualiza o hash para o algoritmo e parâmetros atuais
+            employee.user.password_hash = User.password_hasher.hash(login_dto.password)
+            self.user_gateway.update(employee.user)
+
+        profile_name = self.profile_name_for(employee)
+        return self.build_token(employee, profile_name, self.profile_gateway.get_permission_names(profile_name))
+
+    async def execute_async(self, login_dto: LoginDTO, password_hashing_executor: PasswordHashingExecutor) -> Dict[str, Any]:
+        """
+        Versão assíncrona do login: o acesso ao banco roda no threadpool e a verificação
+        da senha no executor dedicado, sem ocupar o event loop nem o threadpool com o bcrypt.
+        """
+        return await login_employee_flow(
+            login_dto,
+            self.employee_gateway,
+            self.profile_gateway,
+            self.user_gateway,
+            to_thread.run_sync,
+            password_hashing_executor.run,
+        )
+
+    @staticmethod
+    def ensure_can_login(employee: Optional[Employee], password_matches: bool) -> None:
+        if not employee or not password_matches:
             raise InvalidCredentialsException()
-        
+
+        # Funcionário removido não faz login nem tem o hash da senha atualizado (a checagem vem antes do rehash)
         if employee.is_deleted():
             raise InvalidCredentialsException()
-        
-        profile_name = 'employee'
+
+    @staticmethod
+    def profile_name_for(employee: Employee) -> str:
         if employee.role.name == 'manager':
-            profile_name = 'manager'
+            return 'manager'
+        return 'employee'
 
-        employee_profile = self.profile_gateway.get_by_name(profile_name)
-        if not employee_profile:
+    @staticmethod
+    def build_token(employee: Employee, profile_name: str, permissions: Optional[Tuple[str, ...]]) -> Dict[str, Any]:
+        if permissions is None:
             raise EntityNotFoundException(entity_name="Employee profile")
  
-        permissions = [permission.name for permission in employee_profile.permissions]
         if not permissions:
             raise EntityNotFoundException(entity_name="Employee permissions")
 
@@ -48,8 +124,8 @@ class LoginEmployeeUseCase:
                 "email": employee.person.email,
             },
             "profile": {
-                "name": employee_profile.name,
-                "permissions": permissions,
+                "name": profile_name,
+                "permissions": list(permissions),
             },
         }
 
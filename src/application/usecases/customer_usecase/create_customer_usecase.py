@@ -1,26 +1,27 @@
-from src.core.ports.auth.i_auth_provider_gateway import IAuthProviderGateway
 from src.core.ports.customer.i_customer_repository import ICustomerRepository
+from src.core.ports.outbox.i_outbox_repository import IOutboxRepository
 from src.core.ports.person.i_person_repository import IPersonRepository
 from src.core.domain.dtos.customer.create_customer_dto import CreateCustomerDTO
 from src.core.domain.entities.customer import Customer
+from src.core.domain.entities.outbox_event import OutboxEvent
 from src.core.exceptions.entity_duplicated_exception import EntityDuplicatedException
 from src.core.domain.entities.person import Person
 
 
 class CreateCustomerUsecase:
-    def __init__(self, customer_gateway: ICustomerRepository, person_gateway: IPersonRepository, auth_provider_gateway: IAuthProviderGateway):
+    def __init__(self, customer_gateway: ICustomerRepository, person_gateway: IPersonRepository, outbox_gateway: IOutboxRepository):
         self.customer_gateway = customer_gateway
         self.person_gateway = person_gateway
-        self.auth_provider_gateway = auth_provider_gateway
+        self.outbox_gateway = outbox_gateway
 
     @classmethod
     def build(
         cls,
         customer_gateway: ICustomerRepository,
         person_gateway: IPersonRepository,
-        auth_provider_gateway: IAuthProviderGateway
+        outbox_gateway: IOutboxRepository
     ) -> 'CreateCustomerUsecase':
-        return cls(customer_gateway, person_gateway, auth_provider_gateway)
+        return cls(customer_gateway, person_gateway, outbox_gateway)
     
     def execute(self, dto: CreateCustomerDTO) -> Customer:
         person = self.person_gateway.get_by_cpf(dto.person.cpf)
@@ -44,17 +45,19 @@ class CreateCustomerUsecase:
             person = self.person_gateway.update(person)
         
         customer = self.customer_gateway.get_by_person_id(person.id)
+        if customer and not customer.is_deleted():
+            raise EntityDuplicatedException(entity_name='Customer')
+
+        # A sincronização com o provedor de identidade é gravada no outbox e entra
+        # no mesmo commit do cliente; o OutboxDispatcher a entrega em segundo plano
+        self.outbox_gateway.add(OutboxEvent.user_sync(person))
+
         if customer:
-            if not customer.is_deleted():
-                raise EntityDuplicatedException(entity_name='Customer')
-            
             customer.reactivate()
             self.customer_gateway.update(customer)
         
         else:
             customer = Customer(person=person)
             customer = self.customer_gateway.create(customer)
-            
-        self.auth_provider_gateway.sync_user(person=customer.person)
-        
+
         return customer
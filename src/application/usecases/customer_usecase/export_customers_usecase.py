@@ -0,0 +1,22 @@
+from src.core.ports.customer.i_customer_repository import ICustomerRepository
+from src.core.domain.entities.customer import Customer
+from src.application.usecases.customer_usecase.is_customer_usecase import IsCustomerUsecase
+
+from typing import Iterator, Optional
+
+
+class ExportCustomersUsecase:
+    def __init__(self, customer_gateway: ICustomerRepository):
+        self.customer_gateway = customer_gateway
+
+    @classmethod
+    def build(cls, customer_gateway: ICustomerRepository) -> 'ExportCustomersUsecase':
+        return cls(customer_gateway)
+
+    def execute(self, current_user: dict, include_deleted: Optional[bool] = False) -> Iterator[Customer]:
+        owner_id = None
+        if IsCustomerUsecase.is_customer(current_user):
+            # Clientes só exportam o próprio cadastro
+            owner_id = int(current_user['person']['id'])
+
+        return self.customer_gateway.stream_all(include_deleted, owner_id=owner_id)
@@ -1,5 +1,5 @@
 from src.core.ports.customer.i_customer_repository import ICustomerRepository
-from src.core.domain.entities.customer import Customer
+from src.core.domain.dtos.customer.customer_dto import CustomerDTO
 from src.application.usecases.customer_usecase.is_customer_usecase import IsCustomerUsecase
 
 from typing import Optional, List
@@ -13,10 +13,11 @@ class GetAllCustomersUsecase:
     def build(cls, customer_gateway: ICustomerRepository) -> 'GetAllCustomers':
         return cls(customer_gateway)
     
-    def execute(self, current_user: dict, include_deleted: Optional[bool] = False) -> List[Customer]:
-        customers = self.customer_gateway.get_all(include_deleted)
-
+    def execute(self, current_user: dict, include_deleted: Optional[bool] = False, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[CustomerDTO]:
+        owner_id = None
         if IsCustomerUsecase.is_customer(current_user):
-            customer = [customer for customer in customers if customer.id == int(current_user['person']['id'])]
-        
-        return customers
+            # Clientes só enxergam o próprio cadastro
+            owner_id = int(current_user['person']['id'])
+
+        # Listagem somente leitura: os DTOs vêm direto das linhas do banco, sem montar as entidades
+        return self.customer_gateway.get_all_dtos(include_deleted, limit=limit, after_id=after_id, owner_id=owner_id)
@@ -0,0 +1,106 @@
+from src.core.exceptions.service_unavailable_exception import ServiceUnavailableException
+from src.core.ports.customer.i_customer_repository import ICustomerRepository
+from src.core.ports.auth.i_auth_provider_gateway import IAuthProviderGateway
+
+from typing import Callable, Dict, List, Optional
+import logging
+import time
+
+
+class SyncCustomersUsecase:
+    """
+    Ressincroniza todos os clientes ativos com o provedor de identidade.
+    Os clientes são lidos em páginas por chave (`get_all` com `limit` e `after_id`) e enviados em
+    lotes para `sync_users`, então a memória usada depende do tamanho do lote, não do total de clientes.
+    Nenhum cursor fica aberto entre um lote e outro: durante as pausas abaixo, um cursor de streaming
+    parado estouraria o `net_write_timeout` do MySQL e derrubaria a conexão.
+
+    Um lote em que todos os clientes falham indica o provedor fora do ar (ou o circuit breaker aberto):
+    em vez de seguir falhando na hora para cada cliente, a sincronização pausa por `pause_seconds`
+    e repete o lote. Após `max_pauses` pausas seguidas sem nenhum sucesso, desiste com
+    ServiceUnavailableException.
+    """
+
+    def __init__(
+        self,
+        customer_gateway: ICustomerRepository,
+        auth_provider_gateway: IAuthProviderGateway,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.customer_gateway = customer_gateway
+        self.auth_provider_gateway = auth_provider_gateway
+        self.sleep = sleep
+
+    @classmethod
+    def build(cls, customer_gateway: ICustomerRepository, auth_provider_gateway: IAuthProviderGateway) -> 'SyncCustomersUsecase':
+        return cls(customer_gateway, auth_provider_gateway)
+
+    def execute(
+        self,
+        batch_size: int = 100,
+        concurrency: Optional[int] = None,
+        on_progress: Optional[Callable[[Dict[str, float]], None]] = None,
+        pause_seconds: float = 0.0,
+        max_pauses: int = 0,
+    ) -> Dict[str, float]:
+        if batch_size < 1:
+            raise ValueError("Sync batch size must be greater than zero")
+        if pause_seconds < 0 or max_pauses < 0:
+            raise ValueError("Sync pause seconds and max pauses must not be negative")
+
+        stats = {"processed": 0, "synced": 0, "failed": 0, "pauses": 0, "elapsed": 0.0}
+        started_at = time.monotonic()
+        last_id = None
+
+        while True:
+            batch = self.customer_gateway.get_all(include_deleted=False, limit=batch_size, after_id=last_id)
+            if not batch:
+                break
+
+            results = self._sync_batch(batch, concurrency, pause_seconds, max_pauses, stats, started_at)
+            synced = sum(1 for result in results if result)
+            stats["processed"] += len(batch)
+            stats["synced"] += synced
+            stats["failed"] += len(batch) - synced
+            stats["elapsed"] = time.monotonic() - started_at
+            last_id = batch[-1].id
+
+            if on_progress:
+                on_progress(dict(stats))
+
+        stats["elapsed"] = time.monotonic() - started_at
+        return stats
+
+    def _sync_batch(
+        self,
+        batch: list,
+        concurrency: Optional[int],
+        pause_seconds: float,
+        max_pauses: int,
+        stats: Dict[str, float],
+        started_at: float,
+    ) -> List[bool]:
+        persons = [customer.person for customer in batch]
+        pauses = 0
+        while True:
+            results = self.auth_provider_gateway.sync_users(persons, concurrency)
+            if any(results):
+                return results
+
+            if pauses >= max_pauses:
+                stats["elapsed"] = time.monotonic() - started_at
+                raise ServiceUnavailableException(
+                    message=(
+                        f"Provedor de identidade indisponível: lote de {len(batch)} clientes falhou por inteiro "
+                        f"após {pauses} pausa(s) de {pause_seconds:.0f}s; sincronização interrompida."
+                    ),
+                    details=dict(stats),
+                )
+
+            pauses += 1
+            stats["pauses"] += 1
+            logging.warning(
+                "Lote de %s clientes falhou por inteiro; aguardando %.1fs antes de repetir (pausa %s de %s).",
+                len(batch), pause_seconds, pauses, max_pauses,
+            )
+            self.sleep(pause_seconds)
@@ -44,7 +44,6 @@ class UpdateCustomerUsecase:
 
         self.person_gateway.update(person)
 
-        customer.person_id = person.id
         customer.person = person
 
         customer = self.customer_gateway.update(customer)
@@ -1,6 +1,6 @@
 
 from typing import Optional
-from src.core.domain.entities.employee import Employee
+from src.core.domain.dtos.employee.employee_dto import EmployeeDTO
 from src.core.ports.employee.i_employee_repository import IEmployeeRepository
 
 
@@ -13,6 +13,7 @@ class GetAllEmployeesUseCase:
     def build(cls, employee_gateway: IEmployeeRepository) -> 'GetAllEmployeesUseCase':
         return cls(employee_gateway)
     
-    def execute(self, include_deleted: Optional[bool] = False) -> list[Employee]:
-        employees = self.employee_gateway.get_all(include_deleted=include_deleted)
+    def execute(self, include_deleted: Optional[bool] = False, limit: Optional[int] = None, after_id: Optional[int] = None) -> list[EmployeeDTO]:
+        # Listagem somente leitura: os DTOs vêm direto das linhas do banco, sem montar as entidades
+        employees = self.employee_gateway.get_all_dtos(include_deleted=include_deleted, limit=limit, after_id=after_id)
         return employees
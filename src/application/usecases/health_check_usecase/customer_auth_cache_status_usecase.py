@@ -0,0 +1,7 @@
+from src.core.shared.customer_auth_cache import CustomerAuthCache
+from src.schemas.health_check_schema import CustomerAuthCacheStatusSchemaOut
+
+
+class CustomerAuthCacheStatusUseCase:
+    def execute(self) -> CustomerAuthCacheStatusSchemaOut:
+        return CustomerAuthCacheStatusSchemaOut(**CustomerAuthCache.get_instance().stats())
@@ -0,0 +1,13 @@
+from config.database import ENGINE_SETTINGS, get_pool_status
+from src.schemas.health_check_schema import DatabasePoolStatusSchemaOut
+
+
+class DatabasePoolStatusUseCase:
+    def execute(self) -> DatabasePoolStatusSchemaOut:
+        return DatabasePoolStatusSchemaOut(
+            **get_pool_status(),
+            max_overflow=ENGINE_SETTINGS.max_overflow,
+            pool_timeout=ENGINE_SETTINGS.pool_timeout,
+            pool_recycle=ENGINE_SETTINGS.pool_recycle,
+            pool_pre_ping=ENGINE_SETTINGS.pool_pre_ping,
+        )
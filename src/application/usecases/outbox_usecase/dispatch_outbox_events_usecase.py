@@ -0,0 +1,105 @@
+from datetime import timedelta
+from typing import Callable, Dict, Optional
+import logging
+import random
+
+from src.core.domain.entities.outbox_event import OutboxEvent, utc_now
+from src.core.ports.auth.i_auth_provider_gateway import IAuthProviderGateway
+from src.core.ports.outbox.i_outbox_repository import IOutboxRepository
+from src.core.ports.person.i_person_repository import IPersonRepository
+
+
+class DispatchOutboxEventsUseCase:
+    """
+    Entrega um lote de eventos pendentes do outbox ao provedor de identidade.
+
+    Uma falha reagenda o evento com backoff exponencial e jitter e interrompe o lote:
+    com o provedor indisponível, os eventos seguintes esperam a próxima rodada em vez de
+    gastarem tentativas. Após `max_attempts` falhas o evento vai para a dead-letter.
+    """
+
+    def __init__(
+        self,
+        outbox_gateway: IOutboxRepository,
+        person_gateway: IPersonRepository,
+        auth_provider_gateway: IAuthProviderGateway,
+        max_attempts: int,
+        retry_backoff: float,
+        retry_max_backoff: float,
+        jitter: Callable[[], float] = random.random,
+    ):
+        self.outbox_gateway = outbox_gateway
+        self.person_gateway = person_gateway
+        self.auth_provider_gateway = auth_provider_gateway
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self.retry_max_backoff = retry_max_backoff
+        self.jitter = jitter
+
+    @classmethod
+    def build(
+        cls,
+        outbox_gateway: IOutboxRepository,
+        person_gateway: IPersonRepository,
+        auth_provider_gateway: IAuthProviderGateway,
+        max_attempts: int,
+        retry_backoff: float,
+        retry_max_backoff: float,
+    ) -> 'DispatchOutboxEventsUseCase':
+        return cls(outbox_gateway, person_gateway, auth_provider_gateway, max_attempts, retry_backoff, retry_max_backoff)
+
+    def execute(self, batch_size: int) -> Dict[str, int]:
+        result = {"claimed": 0, "processed": 0, "retried": 0, "dead_lettered": 0}
+        now = utc_now()
+        events = self.outbox_gateway.claim_due(batch_size, now)
+        result["claimed"] = len(events)
+
+        handled = []
+        for event in events:
+            handled.append(event)
+            if event.event_type != OutboxEvent.USER_SYNC:
+                event.dead_letter(f"Tipo de evento desconhecido: {event.event_type}", now)
+                result["dead_lettered"] += 1
+                continue
+
+            error = self._sync_user(event)
+            if error is None:
+                event.mark_processed(now)
+                result["processed"] += 1
+                continue
+
+            if event.attempts + 1 >= self.max_attempts:
+                event.dead_letter(error, now)
+                result["dead_lettered"] += 1
+                logging.error(f"Evento {event.id} do outbox movido para a dead-letter após {event.attempts} tentativas: {error}")
+            else:
+                event.schedule_retry(error, now + timedelta(seconds=self._retry_delay(event.attempts + 1)))
+                result["retried"] += 1
+            break
+
+        if handled:
+            self.outbox_gateway.update_all(handled)
+        return result
+
+    def _sync_user(self, event: OutboxEvent) -> Optional[str]:
+        """
+        Sincroniza os dados atuais da pessoa e retorna o erro, ou None em caso de sucesso.
+        """
+        person = self.person_gateway.get_by_id(event.payload.get("person_id"))
+        if not person:
+            # A pessoa foi removida: não há mais o que sincronizar. Quem executa o caso de uso
+            # precisa ler do banco principal (ver OutboxDispatcher), senão o atraso de uma
+            # réplica descartaria eventos de pessoas recém-criadas
+            return None
+
+        try:
+            if self.auth_provider_gateway.sync_user(person):
+                return None
+            return "Sincronização recusada pelo provedor de identidade"
+        except Exception as e:
+            return str(e)
+
+    def _retry_delay(self, attempt: int) -> float:
+        delay = min(self.retry_max_backoff, self.retry_backoff * 2 ** (attempt - 1))
+        # Metade fixa e metade aleatória, para espalhar as retentativas
+        return delay / 2 + delay / 2 * self.jitter()
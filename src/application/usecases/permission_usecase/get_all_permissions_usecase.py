@@ -12,6 +12,6 @@ class GetAllPermissionsUsecase:
     def build(cls, permission_gateway: IPermissionRepository):
         return cls(permission_gateway)
     
-    def execute(self, include_deleted: Optional[bool] = False) -> List[Permission]:
-        permissions = self.permission_gateway.get_all(include_deleted=include_deleted)
+    def execute(self, include_deleted: Optional[bool] = False, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[Permission]:
+        permissions = self.permission_gateway.get_all(include_deleted=include_deleted, limit=limit, after_id=after_id)
         return permissions
\ No newline at end of file
@@ -0,0 +1,15 @@
+from src.core.ports.person.i_person_repository import IPersonRepository
+from typing import Iterator, Optional
+from src.core.domain.entities.person import Person
+
+
+class ExportPersonsUsecase:
+    def __init__(self, person_gateway: IPersonRepository):
+        self.person_gateway = person_gateway
+
+    @classmethod
+    def build(cls, person_gateway: IPersonRepository) -> 'ExportPersonsUsecase':
+        return cls(person_gateway)
+
+    def execute(self, include_deleted: Optional[bool] = False) -> Iterator[Person]:
+        return self.person_gateway.stream_all(include_deleted)
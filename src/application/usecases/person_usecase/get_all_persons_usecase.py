@@ -1,6 +1,6 @@
 from src.core.ports.person.i_person_repository import IPersonRepository
 from typing import Optional, List
-from src.core.domain.entities.person import Person
+from src.core.domain.dtos.person.person_dto import PersonDTO
 
 
 class GetAllPersonsUsecase:
@@ -11,6 +11,7 @@ class GetAllPersonsUsecase:
     def build(cls, person_gateway: IPersonRepository) -> 'GetAllPersonsUsecase':
         return cls(person_gateway)
     
-    def execute(self, include_deleted: Optional[bool] = False) -> List[Person]:
-        persons = self.person_gateway.get_all(include_deleted)
+    def execute(self, include_deleted: Optional[bool] = False, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[PersonDTO]:
+        # Listagem somente leitura: os DTOs vêm direto das linhas do banco, sem montar as entidades
+        persons = self.person_gateway.get_all_dtos(include_deleted, limit=limit, after_id=after_id)
         return persons
\ No newline at end of file
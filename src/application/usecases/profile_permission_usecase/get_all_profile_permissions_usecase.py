@@ -12,6 +12,6 @@ class GetAllProfilePermissionsUsecase:
     def build(cls, profile_permission_gateway: IProfilePermissionRepository) -> 'GetAllProfilePermissionsUsecase':
         return cls(profile_permission_gateway)
     
-    def execute(self, include_deleted: Optional[bool] = False) -> ProfilePermissionDTO:
-        profile_permissions = self.profile_permission_gateway.get_all(include_deleted)
+    def execute(self, include_deleted: Optional[bool] = False, limit: Optional[int] = None, after_id: Optional[int] = None) -> ProfilePermissionDTO:
+        profile_permissions = self.profile_permission_gateway.get_all(include_deleted, limit=limit, after_id=after_id)
         return profile_permissions
@@ -12,6 +12,6 @@ class GetAllProfilesUsecase:
     def build(cls, profile_gateway: IProfileRepository):
         return cls(profile_gateway)
     
-    def execute(self, include_deleted: Optional[bool] = False) -> List[Profile]:
-        profiles = self.profile_gateway.get_all(include_deleted=include_deleted)
+    def execute(self, include_deleted: Optional[bool] = False, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[Profile]:
+        profiles = self.profile_gateway.get_all(include_deleted=include_deleted, limit=limit, after_id=after_id)
         return profiles
\ No newline at end of file
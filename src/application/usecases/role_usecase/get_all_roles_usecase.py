@@ -12,6 +12,6 @@ class GetAllRolesUsecase:
     def build(cls, role_gateway: IRoleRepository) -> 'GetAllRolesUsecase':
         return cls(role_gateway)
     
-    def execute(self, include_deleted: Optional[bool] = False) -> List[Role]:
-        roles = self.role_gateway.get_all(include_deleted)
+    def execute(self, include_deleted: Optional[bool] = False, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[Role]:
+        roles = self.role_gateway.get_all(include_deleted, limit=limit, after_id=after_id)
         return roles
\ No newline at end of file
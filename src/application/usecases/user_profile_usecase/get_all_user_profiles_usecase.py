@@ -12,6 +12,6 @@ class GetAllUserProfilesUsecase:
     def build(cls, user_profile_gateway: IUserProfileRepository) -> 'GetAllUserProfilesUsecase':
         return cls(user_profile_gateway)
     
-    def execute(self, include_deleted: Optional[bool] = False) -> List[UserProfile]:
-        user_profiles = self.user_profile_gateway.get_all(include_deleted)
+    def execute(self, include_deleted: Optional[bool] = False, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[UserProfile]:
+        user_profiles = self.user_profile_gateway.get_all(include_deleted, limit=limit, after_id=after_id)
         return user_profiles
@@ -12,6 +12,6 @@ class GetAllUsersUsecase:
     def build(cls, user_gateway: IUserRepository):
         return cls(user_gateway)
     
-    def execute(self, include_deleted: Optional[bool] = False) -> List[User]:
-        users = self.user_gateway.get_all(include_deleted=include_deleted)
+    def execute(self, include_deleted: Optional[bool] = False, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[User]:
+        users = self.user_gateway.get_all(include_deleted=include_deleted, limit=limit, after_id=after_id)
         return users
\ No newline at end of file
@@ -186,3 +186,6 @@ class PersonPermissions(BasePermissionEnum):
     CAN_VIEW_PERSONS = ("can_view_persons", "Permission to view all persons")
     CAN_UPDATE_PERSON = ("can_update_person", "Permission to update a person")
     CAN_DELETE_PERSON = ("can_delete_person", "Permission to delete a person")
+
+class HealthCheckPermissions(BasePermissionEnum):
+    CAN_VIEW_DIAGNOSTICS = ("can_view_diagnostics", "Permission to view service diagnostics (database pool and caches)")
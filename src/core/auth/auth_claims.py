@@ -0,0 +1,32 @@
+from typing import FrozenSet, Iterable
+
+from src.core.utils.jwt_util import JWTUtil
+
+
+class AuthClaims:
+    """
+    Claims do token da requisição, decodificados uma única vez.
+    As permissões são pré-computadas em um frozenset para que a checagem de escopos seja por pertinência.
+    """
+
+    def __init__(self, payload: dict):
+        self._payload = payload
+        self._permissions = frozenset(payload.get("profile", {}).get("permissions", []))
+
+    @classmethod
+    def from_token(cls, token: str) -> "AuthClaims":
+        return cls(JWTUtil.decode_token(token))
+
+    @property
+    def payload(self) -> dict:
+        return self._payload
+
+    @property
+    def permissions(self) -> FrozenSet[str]:
+        return self._permissions
+
+    def has_scopes(self, scopes: Iterable[str]) -> bool:
+        return self._permissions.issuperset(scopes)
+
+
+__all__ = ["AuthClaims"]
@@ -1,15 +1,21 @@
-from fastapi import Depends
+from fastapi import Depends, Request
 from fastapi.security import SecurityScopes
+from src.core.auth.auth_claims import AuthClaims
 from src.core.exceptions.forbidden_exception import ForbiddenException
-from src.core.utils.jwt_util import JWTUtil
 from src.core.auth.oauth2 import oauth2_scheme
 
-def get_current_user(security_scopes: SecurityScopes, token: str = Depends(oauth2_scheme)):
-    payload = JWTUtil.decode_token(token)
-    permissions = payload.get("profile", {}).get("permissions", [])
+def get_request_claims(request: Request, token: str) -> AuthClaims:
+    # O AuthMiddleware já decodifica o token e guarda os claims no estado da requisição
+    claims = getattr(request.state, "claims", None)
+    if claims is None:
+        claims = AuthClaims.from_token(token)
+        request.state.claims = claims
+    return claims
 
-    for scope in security_scopes.scopes:
-        if scope not in permissions:
-            raise ForbiddenException("Forbidden access")
+def get_current_user(request: Request, security_scopes: SecurityScopes, token: str = Depends(oauth2_scheme)):
+    claims = get_request_claims(request, token)
 
-    return payload
+    if not claims.has_scopes(security_scopes.scopes):
+        raise ForbiddenException("Forbidden access")
+
+    return claims.payload
@@ -1,7 +1,30 @@
 from dependency_injector import containers, providers
 
-from config.database import get_db
-from src.core.shared.identity_map import IdentityMap
+from config.database import SessionLocal, get_db, open_async_session
+from config.settings import (
+    CUSTOMER_AUTH_CACHE_MAX_SIZE,
+    CUSTOMER_AUTH_CACHE_NEGATIVE_MAX_SIZE,
+    CUSTOMER_AUTH_CACHE_NEGATIVE_TTL_SECONDS,
+    CUSTOMER_AUTH_CACHE_TTL_SECONDS,
+    OUTBOX_BATCH_SIZE,
+    OUTBOX_MAX_ATTEMPTS,
+    OUTBOX_POLL_INTERVAL_SECONDS,
+    OUTBOX_RETRY_BACKOFF_SECONDS,
+    OUTBOX_RETRY_MAX_BACKOFF_SECONDS,
+    PASSWORD_HASHER,
+    PASSWORD_HASHER_ARGON2_MEMORY_COST,
+    PASSWORD_HASHER_ARGON2_PARALLELISM,
+    PASSWORD_HASHER_ARGON2_TIME_COST,
+    PASSWORD_HASHER_BCRYPT_ROUNDS,
+    PASSWORD_HASHING_EXECUTOR,
+    PASSWORD_HASHING_MAX_WORKERS,
+    PROFILE_PERMISSION_CACHE_MAX_SIZE,
+    PROFILE_PERMISSION_CACHE_TTL_SECONDS,
+)
+from src.core.domain.entities.user import build_password_hasher
+from src.core.shared.customer_auth_cache import CustomerAuthCache
+from src.core.shared.password_hashing_executor import PasswordHashingExecutor
+from src.core.shared.profile_permission_cache import ProfilePermissionCache
 from src.adapters.driven.auth_providers.aws_cognito_gateway import AWSCognitoGateway
 from src.adapters.driver.api.v1.controllers.auth_controller import AuthController
 from src.adapters.driven.repositories.permission_repository import PermissionRepository
@@ -21,7 +44,12 @@ from src.adapters.driver.api.v1.controllers.customer_controller import CustomerC
 from src.adapters.driven.repositories.role_repository import RoleRepository
 from src.adapters.driver.api.v1.controllers.role_controller import RoleController
 from src.adapters.driven.repositories.employee_repository import EmployeeRepository
+from src.adapters.driven.repositories.async_employee_repository import AsyncEmployeeRepository
+from src.adapters.driven.repositories.async_profile_repository import AsyncProfileRepository
+from src.adapters.driven.repositories.async_user_repository import AsyncUserRepository
 from src.adapters.driver.api.v1.controllers.employee_controller import EmployeeController
+from src.adapters.driven.repositories.outbox_repository import OutboxRepository
+from src.adapters.driver.workers.outbox_dispatcher import OutboxDispatcher
 
 
 class Container(containers.DeclarativeContainer):
@@ -49,7 +77,34 @@ class Container(containers.DeclarativeContainer):
         "src.adapters.driver.api.v1.routes.auth_routes",
     ])
     
-    identity_map = providers.Singleton(IdentityMap)
+    profile_permission_cache = providers.Singleton(
+        ProfilePermissionCache,
+        max_size=PROFILE_PERMISSION_CACHE_MAX_SIZE,
+        ttl=PROFILE_PERMISSION_CACHE_TTL_SECONDS,
+    )
+
+    customer_auth_cache = providers.Singleton(
+        CustomerAuthCache,
+        max_size=CUSTOMER_AUTH_CACHE_MAX_SIZE,
+        ttl=CUSTOMER_AUTH_CACHE_TTL_SECONDS,
+        negative_max_size=CUSTOMER_AUTH_CACHE_NEGATIVE_MAX_SIZE,
+        negative_ttl=CUSTOMER_AUTH_CACHE_NEGATIVE_TTL_SECONDS,
+    )
+
+    password_hasher = providers.Singleton(
+        build_password_hasher,
+        name=PASSWORD_HASHER,
+        bcrypt_rounds=PASSWORD_HASHER_BCRYPT_ROUNDS,
+        argon2_time_cost=PASSWORD_HASHER_ARGON2_TIME_COST,
+        argon2_memory_cost=PASSWORD_HASHER_ARGON2_MEMORY_COST,
+        argon2_parallelism=PASSWORD_HASHER_ARGON2_PARALLELISM,
+    )
+
+    password_hashing_executor = providers.Singleton(
+        PasswordHashingExecutor,
+        max_workers=PASSWORD_HASHING_MAX_WORKERS,
+        kind=PASSWORD_HASHING_EXECUTOR,
+    )
 
     db_session = providers.Resource(get_db)
 
@@ -81,14 +136,29 @@ class Container(containers.DeclarativeContainer):
     person_gateway = providers.Factory(PersonRepository, db_session=db_session)
     person_controller = providers.Factory(PersonController, person_gateway=person_gateway)
 
-    auth_provider_gateway = providers.Factory(AWSCognitoGateway)
+    # Compartilhado entre as requisições: pool de conexões e estado do circuit breaker
+    auth_provider_gateway = providers.Singleton(AWSCognitoGateway)
+
+    # Escreve na sessão da requisição: o evento é gravado no mesmo commit do cliente
+    outbox_gateway = providers.Factory(OutboxRepository, db_session=db_session)
+    outbox_session_factory = providers.Object(SessionLocal)
+    outbox_dispatcher = providers.Singleton(
+        OutboxDispatcher,
+        session_factory=outbox_session_factory,
+        auth_provider_gateway=auth_provider_gateway,
+        batch_size=OUTBOX_BATCH_SIZE,
+        poll_interval=OUTBOX_POLL_INTERVAL_SECONDS,
+        max_attempts=OUTBOX_MAX_ATTEMPTS,
+        retry_backoff=OUTBOX_RETRY_BACKOFF_SECONDS,
+        retry_max_backoff=OUTBOX_RETRY_MAX_BACKOFF_SECONDS,
+    )
 
     customer_gateway = providers.Factory(CustomerRepository, db_session=db_session)
     customer_controller = providers.Factory(
         CustomerController,
         customer_gateway=customer_gateway,
         person_gateway=person_gateway,
-        auth_provider_gateway=auth_provider_gateway,
+        outbox_gateway=outbox_gateway,
     )
 
     role_gateway = providers.Factory(RoleRepository, db_session=db_session)
@@ -103,11 +173,22 @@ class Container(containers.DeclarativeContainer):
         user_gateway=user_gateway
     )
     
+    # Pilha asyncio: a sessão e os repositórios são criados a cada login, dentro do controller
+    async_session = providers.Object(open_async_session)
+    async_employee_gateway = providers.Factory(AsyncEmployeeRepository)
+    async_profile_gateway = providers.Factory(AsyncProfileRepository)
+    async_user_gateway = providers.Factory(AsyncUserRepository)
+
     auth_controller = providers.Factory(
         AuthController,
         profile_gateway=profile_gateway,
         employee_gateway=employee_gateway,
         customer_gateway=customer_gateway,
-        auth_provider_gateway=auth_provider_gateway            
+        auth_provider_gateway=auth_provider_gateway,
+        user_gateway=user_gateway,
+        async_session=async_session,
+        async_employee_gateway=async_employee_gateway.provider,
+        async_profile_gateway=async_profile_gateway.provider,
+        async_user_gateway=async_user_gateway.provider,
     )
     
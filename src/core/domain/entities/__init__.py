@@ -8,6 +8,7 @@ from .user_profile import UserProfile
 from .person import Person
 from .customer import Customer
 from .employee import Employee
+from .outbox_event import OutboxEvent
 
 __all__ = [
     "BaseEntity",
@@ -20,4 +21,5 @@ __all__ = [
     "Person",
     "Customer",
     "Employee",
+    "OutboxEvent",
 ]
\ No newline at end of file
@@ -4,7 +4,10 @@ from typing import Any, Dict, Type, TypeVar
 T = TypeVar("T", bound="BaseEntity")
 
 class BaseEntity:
-    
+    # Sem __dict__ por instância: cada subclasse declara os próprios atributos em __slots__.
+    # __weakref__ permite manter as entidades no IdentityMap em modo de referências fracas.
+    __slots__ = ("_id", "_created_at", "_updated_at", "_inactivated_at", "__weakref__")
+
     def __init__(self, id: int, created_at: datetime, updated_at: datetime, inactivated_at: datetime) -> None:
         self._id = id
         self._created_at = created_at
@@ -61,8 +64,16 @@ class BaseEntity:
     def reactivate(self):
         self.inactivated_at = None
     
+    def _attributes(self) -> Dict[str, Any]:
+        attributes = {}
+        for klass in reversed(type(self).__mro__):
+            for slot in klass.__dict__.get("__slots__", ()):
+                if slot != "__weakref__" and hasattr(self, slot):
+                    attributes[slot] = getattr(self, slot)
+        return attributes
+
     def __repr__(self):
-        attributes_dict = vars(self)
+        attributes_dict = self._attributes()
         attributes = ", ".join(
             f"{key.lstrip('_')}={value!r}" 
             for key, value in attributes_dict.items()
@@ -4,6 +4,8 @@ from typing import Optional
 
 
 class Customer(BaseEntity):
+    __slots__ = ("person",)
+
     def __init__(
         self,
         person: Person,
@@ -7,6 +7,7 @@ from src.core.domain.entities.base_entity import BaseEntity
 
 
 class Employee(BaseEntity):
+    __slots__ = ("_admission_date", "_termination_date", "_person", "_role", "_user")
     
     def __init__(
         self,
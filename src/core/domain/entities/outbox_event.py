@@ -0,0 +1,91 @@
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+from src.core.domain.entities.base_entity import BaseEntity
+from src.core.domain.entities.person import Person
+
+
+def utc_now() -> datetime:
+    # Datas do outbox em UTC sem fuso: DATETIME no MySQL e texto no SQLite comparam do mesmo jeito
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class OutboxEvent(BaseEntity):
+    """
+    Evento a ser entregue a um sistema externo, gravado na mesma transação da escrita que o originou.
+    """
+
+    USER_SYNC = "user_sync"
+
+    __slots__ = ("_event_type", "_payload", "_attempts", "_available_at", "_processed_at", "_dead_lettered_at", "_last_error")
+
+    def __init__(
+        self,
+        event_type: str,
+        payload: Dict[str, Any],
+        attempts: int = 0,
+        available_at: Optional[datetime] = None,
+        processed_at: Optional[datetime] = None,
+        dead_lettered_at: Optional[datetime] = None,
+        last_error: Optional[str] = None,
+        id: Optional[int] = None,
+        created_at: Optional[datetime] = None,
+        updated_at: Optional[datetime] = None,
+        inactivated_at: Optional[datetime] = None
+    ):
+        super().__init__(id, created_at, updated_at, inactivated_at)
+        self._event_type = event_type
+        self._payload = payload
+        self._attempts = attempts
+        self._available_at = available_at or utc_now()
+        self._processed_at = processed_at
+        self._dead_lettered_at = dead_lettered_at
+        self._last_error = last_error
+
+    @classmethod
+    def user_sync(cls, person: Person) -> "OutboxEvent":
+        # Só o id: o despachante envia os dados atuais da pessoa no momento da entrega
+        return cls(event_type=cls.USER_SYNC, payload={"person_id": person.id})
+
+    @property
+    def event_type(self) -> str:
+        return self._event_type
+
+    @property
+    def payload(self) -> Dict[str, Any]:
+        return self._payload
+
+    @property
+    def attempts(self) -> int:
+        return self._attempts
+
+    @property
+    def available_at(self) -> datetime:
+        return self._available_at
+
+    @property
+    def processed_at(self) -> Optional[datetime]:
+        return self._processed_at
+
+    @property
+    def dead_lettered_at(self) -> Optional[datetime]:
+        return self._dead_lettered_at
+
+    @property
+    def last_error(self) -> Optional[str]:
+        return self._last_error
+
+    def mark_processed(self, now: datetime) -> None:
+        self._processed_at = now
+
+    def schedule_retry(self, error: str, available_at: datetime) -> None:
+        self._attempts += 1
+        self._last_error = error
+        self._available_at = available_at
+
+    def dead_letter(self, error: str, now: datetime) -> None:
+        self._attempts += 1
+        self._last_error = error
+        self._dead_lettered_at = now
+
+    def is_dead_lettered(self) -> bool:
+        return self._dead_lettered_at is not None
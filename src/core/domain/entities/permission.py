@@ -4,6 +4,7 @@ from src.core.domain.entities.base_entity import BaseEntity
 
 
 class Permission(BaseEntity):
+    __slots__ = ("_name", "_description")
    
     def __init__(
         self,
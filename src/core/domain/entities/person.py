@@ -5,6 +5,7 @@ from typing import Optional
 
 
 class Person(BaseEntity):
+    __slots__ = ("_name", "_cpf", "_email", "_birth_date")
     
     def __init__(
         self,
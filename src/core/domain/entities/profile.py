@@ -1,16 +1,29 @@
-from typing import Optional
+from typing import Callable, Optional, Tuple, Union
 from src.core.domain.entities.base_entity import BaseEntity
 
+# Coleções podem ser informadas já carregadas ou como uma função que as carrega sob demanda
+LazyList = Union[list, Callable[[], list]]
+
 class Profile(BaseEntity):
+    __slots__ = (
+        "_name",
+        "_description",
+        "_profile_permissions",
+        "_permissions",
+        "_user_profiles",
+        "_users",
+        "_permission_names",
+    )
 
     def __init__(
         self,
         name: str,
         description: Optional[str] = None,
-        profile_permissions: Optional[list] = [],
-        permissions: Optional[list] = [],
-        user_profiles: Optional[list] = [],
-        users: Optional[list] = [],
+        profile_permissions: Optional[LazyList] = [],
+        permissions: Optional[LazyList] = [],
+        user_profiles: Optional[LazyList] = [],
+        users: Optional[LazyList] = [],
+        permission_names: Optional[Tuple[str, ...]] = None,
         id: Optional[int] = None,
         created_at: Optional[str] = None,
         updated_at: Optional[str] = None,
@@ -23,6 +36,14 @@ class Profile(BaseEntity):
         self._permissions = permissions
         self._user_profiles = user_profiles
         self._users = users
+        self._permission_names = permission_names
+
+    def _load(self, attribute: str) -> list:
+        value = getattr(self, attribute)
+        if callable(value):
+            value = value()
+            setattr(self, attribute, value)
+        return value
         
     @property
     def name(self) -> str:
@@ -50,7 +71,7 @@ class Profile(BaseEntity):
 
     @property
     def profile_permissions(self) -> list:
-        return self._profile_permissions
+        return self._load("_profile_permissions")
     
     @profile_permissions.setter
     def profile_permissions(self, value: list):
@@ -60,17 +81,24 @@ class Profile(BaseEntity):
 
     @property
     def permissions(self) -> list:
-        return self._permissions
+        return self._load("_permissions")
     
     @permissions.setter
     def permissions(self, value: list):
         if not isinstance(value, list):
             raise ValueError("Permissions must be a list")
         self._permissions = value
+        self._permission_names = None
+
+    @property
+    def permission_names(self) -> Tuple[str, ...]:
+        if self._permission_names is None:
+            self._permission_names = tuple(permission.name for permission in self.permissions)
+        return self._permission_names
 
     @property
     def user_profiles(self) -> list:
-        return self._user_profiles
+        return self._load("_user_profiles")
     
     @user_profiles.setter
     def user_profiles(self, value: list):
@@ -80,7 +108,7 @@ class Profile(BaseEntity):
 
     @property
     def users(self) -> list:
-        return self._users
+        return self._load("_users")
     
     @users.setter
     def users(self, value: list):
@@ -6,6 +6,7 @@ from src.core.domain.entities.base_entity import BaseEntity
 
 
 class ProfilePermission(BaseEntity):
+    __slots__ = ("_profile", "_permission")
     
     def __init__(
         self,
@@ -1,9 +1,117 @@
+from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Tuple
 from src.core.domain.entities.base_entity import BaseEntity
 import bcrypt
 
+
+class PasswordHasher(ABC):
+    """
+    Algoritmo de hash de senhas. `needs_rehash` indica se um hash foi gerado com
+    outro algoritmo ou com parâmetros diferentes dos configurados.
+    """
+    prefixes: Tuple[str, ...] = ()
+
+    def identifies(self, password_hash: str) -> bool:
+        return password_hash.startswith(self.prefixes)
+
+    @abstractmethod
+    def hash(self, password: str) -> str:
+        pass
+
+    @abstractmethod
+    def verify(self, password: str, password_hash: str) -> bool:
+        pass
+
+    @abstractmethod
+    def needs_rehash(self, password_hash: str) -> bool:
+        pass
+
+
+class BcryptPasswordHasher(PasswordHasher):
+    prefixes = ("$2a$", "$2b$", "$2y$")
+
+    def __init__(self, rounds: int = 12):
+        if not 4 <= rounds <= 31:
+            raise ValueError("bcrypt rounds must be between 4 and 31")
+        self.rounds = rounds
+
+    def hash(self, password: str) -> str:
+        return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=self.rounds)).decode('utf-8')
+
+    def verify(self, password: str, password_hash: str) -> bool:
+        return bcrypt.checkpw(password.encode('utf-8'), password_hash.encode('utf-8'))
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        if not self.identifies(password_hash):
+            return True
+        # Formato: $2b$<custo>$<salt + hash>
+        return int(password_hash.split('$')[2]) != self.rounds
+
+
+class Argon2PasswordHasher(PasswordHasher):
+    """
+    argon2id, disponível apenas com o extra `argon2` instalado (`poetry install --extras argon2`).
+    """
+    prefixes = ("$argon2id$",)
+
+    def __init__(self, time_cost: int = 3, memory_cost: int = 65536, parallelism: int = 4):
+        try:
+            from argon2 import PasswordHasher as Argon2Hasher, Type
+        except ImportError as e:
+            raise RuntimeError(
+                "PASSWORD_HASHER=argon2id requires the argon2-cffi package; "
+                "install it with `poetry install --extras argon2` or use PASSWORD_HASHER=bcrypt"
+            ) from e
+
+        self.time_cost = time_cost
+        self.memory_cost = memory_cost
+        self.parallelism = parallelism
+        self._hasher = Argon2Hasher(
+            time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism, type=Type.ID
+        )
+
+    def hash(self, password: str) -> str:
+        return self._hasher.hash(password)
+
+    def verify(self, password: str, password_hash: str) -> bool:
+        from argon2.exceptions import InvalidHashError, VerificationError
+
+        try:
+            return self._hasher.verify(password_hash, password)
+        except (VerificationError, InvalidHashError):
+            return False
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        if not self.identifies(password_hash):
+            return True
+        return self._hasher.check_needs_rehash(password_hash)
+
+
+def build_password_hasher(
+    name: str,
+    bcrypt_rounds: int = 12,
+    argon2_time_cost: int = 3,
+    argon2_memory_cost: int = 65536,
+    argon2_parallelism: int = 4,
+) -> PasswordHasher:
+    if name == "bcrypt":
+        return BcryptPasswordHasher(rounds=bcrypt_rounds)
+    if name == "argon2id":
+        return Argon2PasswordHasher(
+            time_cost=argon2_time_cost,
+            memory_cost=argon2_memory_cost,
+            parallelism=argon2_parallelism,
+        )
+    raise ValueError(f"Unsupported password hasher: {name}")
+
+
 class User(BaseEntity):
+    __slots__ = ("_name", "_password_hash")
+    # Algoritmo usado para gerar novos hashes; hashes antigos continuam verificáveis.
+    # A aplicação instala o algoritmo configurado no container com `use_password_hasher`.
+    password_hasher: PasswordHasher = BcryptPasswordHasher()
+
     def __init__(
         self,
         name: str,
@@ -28,24 +136,40 @@ class User(BaseEntity):
     def name(self, name: str) -> None:
         self._name = name
 
-    @property 
+    @property
     def password(self):
         raise AttributeError('Password not readable')
-    
+
     @property
     def password_hash(self):
         return self._password_hash
 
+    @password_hash.setter
+    def password_hash(self, password_hash: str) -> None:
+        self._password_hash = password_hash
 
     @password.setter
     def password(self, password: str) -> None:
-        enc_pw = password.encode('utf-8')
-        self._password_hash = bcrypt.hashpw(enc_pw, bcrypt.gensalt()).decode('utf-8')
+        self._password_hash = self.hash_password(password)
 
     def verify_password(self, password: str) -> bool:
-        return bcrypt.checkpw(password.encode('utf-8'), self._password_hash.encode('utf-8'))
+        return self.check_password(password, self._password_hash)
+
+    def needs_rehash(self) -> bool:
+        return User.password_hasher.needs_rehash(self._password_hash)
+
+    @staticmethod
+    def check_password(password: str, password_hash: str) -> bool:
+        hasher = User.password_hasher
+        if not hasher.identifies(password_hash):
+            # Hash gerado por um algoritmo configurado anteriormente
+            hasher = Argon2PasswordHasher() if password_hash.startswith(Argon2PasswordHasher.prefixes) else BcryptPasswordHasher()
+        return hasher.verify(password, password_hash)
+
+    @classmethod
+    def use_password_hasher(cls, password_hasher: PasswordHasher) -> None:
+        User.password_hasher = password_hasher
 
     @classmethod
     def hash_password(cls, password: str) -> str:
-        enc_pw = password.encode('utf-8')
-        return bcrypt.hashpw(enc_pw, bcrypt.gensalt()).decode('utf-8')
+        return User.password_hasher.hash(password)
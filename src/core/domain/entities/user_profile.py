@@ -4,6 +4,7 @@ from src.core.domain.entities.base_entity import BaseEntity
 
 
 class UserProfile(BaseEntity):
+    __slots__ = ("_user", "_profile")
     
     def __init__(
         self,
@@ -0,0 +1,15 @@
+from typing import Optional
+
+from src.core.exceptions.utils import ErrorCode
+from src.core.exceptions.base_exception import BaseDomainException
+
+
+class ServiceUnavailableException(BaseDomainException):
+    def __init__(self, message: Optional[str] = "Service unavailable", **kwargs):
+        super().__init__(
+            message=message,
+            error_code=ErrorCode.SERVICE_UNAVAILABLE,
+            **kwargs
+        )
+
+__all__ = ["ServiceUnavailableException"]
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import List, Optional, Sequence
 
 from src.core.domain.entities.person import Person
 
@@ -18,9 +19,19 @@ class IAuthProviderGateway(ABC):
         pass
 
     @abstractmethod
-    def sync_user(self, person: Person) -> None:
+    def sync_user(self, person: Person) -> bool:
         """
         Synchronizes the user data with the authentication provider.
         This method should be called when user data is updated in the system.
+        Returns True if the synchronization is successful, False otherwise.
         """
         pass
+
+    def sync_users(self, persons: Sequence[Person], concurrency: Optional[int] = None) -> List[bool]:
+        """
+        Synchronizes a batch of users with the authentication provider.
+        Returns one result per person, in the same order as the input.
+        The default implementation syncs one person at a time; providers may run
+        up to `concurrency` synchronizations in parallel.
+        """
+        return [self.sync_user(person) for person in persons]
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Iterator, List, Optional
 
+from src.core.domain.dtos.customer.customer_dto import CustomerDTO
 from src.core.domain.entities.customer import Customer
 
 
@@ -13,7 +14,8 @@ class ICustomerRepository(ABC):
     def get_by_id(self, customer_id: int) -> Customer:
         pass
 
-    def get_by_cpf(self, cpf: str) -> Customer:
+    def get_by_cpf(self, cpf: str, consistent: bool = False) -> Customer:
+        """`consistent` lê do banco principal, sem o atraso das réplicas."""
         pass
 
     @abstractmethod
@@ -21,7 +23,15 @@ class ICustomerRepository(ABC):
         pass
 
     @abstractmethod
-    def get_all(self) -> List[Customer]:
+    def get_all(self, include_deleted: bool = False, limit: Optional[int] = None, after_id: Optional[int] = None, owner_id: Optional[int] = None) -> List[Customer]:
+        pass
+
+    @abstractmethod
+    def get_all_dtos(self, include_deleted: bool = False, limit: Optional[int] = None, after_id: Optional[int] = None, owner_id: Optional[int] = None) -> List[CustomerDTO]:
+        pass
+
+    @abstractmethod
+    def stream_all(self, include_deleted: bool = False, owner_id: Optional[int] = None) -> Iterator[Customer]:
         pass
 
     @abstractmethod
@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from src.core.domain.entities.employee import Employee
+
+
+class IAsyncEmployeeRepository(ABC):
+    @abstractmethod
+    async def get_by_id(self, employee_id: int) -> Optional[Employee]:
+        pass
+
+    @abstractmethod
+    async def get_by_username(self, username: str) -> Optional[Employee]:
+        pass
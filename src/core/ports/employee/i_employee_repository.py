@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
 
+from src.core.domain.dtos.employee.employee_dto import EmployeeDTO
 from src.core.domain.entities.employee import Employee
 
 
@@ -24,7 +25,10 @@ class IEmployeeRepository(ABC):
     def get_by_username(self, username: str) -> Employee:
         pass
 
-    def get_all(self) -> List[Employee]:
+    def get_all(self, include_deleted: bool = False, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[Employee]:
+        pass
+
+    def get_all_dtos(self, include_deleted: bool = False, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[EmployeeDTO]:
         pass
 
     def update(self, employee: Employee) -> Employee:
@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List
+
+from src.core.domain.entities.outbox_event import OutboxEvent
+
+
+class IOutboxRepository(ABC):
+    @abstractmethod
+    def add(self, event: OutboxEvent) -> None:
+        """
+        Registra o evento sem fazer commit: ele é gravado na mesma transação
+        da próxima escrita feita com a mesma sessão.
+        """
+        pass
+
+    @abstractmethod
+    def claim_due(self, limit: int, now: datetime) -> List[OutboxEvent]:
+        """
+        Retorna até `limit` eventos pendentes cuja próxima tentativa já venceu, em ordem de criação.
+        """
+        pass
+
+    @abstractmethod
+    def update_all(self, events: List[OutboxEvent]) -> None:
+        pass
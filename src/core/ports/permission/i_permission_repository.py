@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Optional
 
 from src.core.domain.entities.permission import Permission
 
@@ -22,7 +23,7 @@ class IPermissionRepository(ABC):
         pass
     
     @abstractmethod
-    def get_all(self, include_deleted: bool = False) -> Permission:
+    def get_all(self, include_deleted: bool = False, limit: Optional[int] = None, after_id: Optional[int] = None) -> Permission:
         pass
 
     @abstractmethod
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Iterator, List, Optional
 
+from src.core.domain.dtos.person.person_dto import PersonDTO
 from src.core.domain.entities.person import Person
 
 
@@ -27,7 +28,15 @@ class IPersonRepository(ABC):
         pass
 
     @abstractmethod
-    def get_all(self, include_deleted: bool = False) -> List[Person]:
+    def get_all(self, include_deleted: bool = False, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[Person]:
+        pass
+
+    @abstractmethod
+    def get_all_dtos(self, include_deleted: bool = False, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[PersonDTO]:
+        pass
+
+    @abstractmethod
+    def stream_all(self, include_deleted: bool = False) -> Iterator[Person]:
         pass
 
     @abstractmethod
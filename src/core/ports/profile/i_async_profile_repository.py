@@ -0,0 +1,8 @@
+from abc import ABC, abstractmethod
+from typing import Optional, Tuple
+
+
+class IAsyncProfileRepository(ABC):
+    @abstractmethod
+    async def get_permission_names(self, name: str) -> Optional[Tuple[str, ...]]:
+        pass
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Optional, Tuple
 
 from src.core.domain.entities.profile import Profile
 
@@ -14,15 +15,26 @@ class IProfileRepository(ABC):
         pass
 
     @abstractmethod
-    def get_by_name(self, name: str) -> Profile:
+    def get_by_name(self, name: str, permission_names_only: bool = False) -> Profile:
+        """
+        Com `permission_names_only`, carrega apenas o perfil e `permission_names`;
+        as demais coleções são carregadas sob demanda.
+        """
         pass
 
     @abstractmethod
-    def get_by_id(self, profile_id: int) -> Profile:
+    def get_permission_names(self, name: str) -> Optional[Tuple[str, ...]]:
+        """
+        Retorna os nomes das permissões do perfil informado, ou None se o perfil não existir.
+        """
+        pass
+
+    @abstractmethod
+    def get_by_id(self, profile_id: int, permission_names_only: bool = False) -> Profile:
         pass
     
     @abstractmethod
-    def get_all(self, include_deleted: bool = False) -> Profile:
+    def get_all(self, include_deleted: bool = False, limit: Optional[int] = None, after_id: Optional[int] = None) -> Profile:
         pass
 
     @abstractmethod
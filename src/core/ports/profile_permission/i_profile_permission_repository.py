@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
 
 from src.core.domain.entities.profile_permission import ProfilePermission
 
@@ -29,7 +29,7 @@ class IProfilePermissionRepository(ABC):
         pass
 
     @abstractmethod
-    def get_all(self) -> List[ProfilePermission]:
+    def get_all(self, include_deleted: bool = False, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[ProfilePermission]:
         pass
 
     @abstractmethod
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
 
 from src.core.domain.entities.role import Role
 
@@ -18,7 +18,7 @@ class IRoleRepository(ABC):
         pass
 
     @abstractmethod
-    def get_all(self, include_deleted: bool = False) -> List[Role]:
+    def get_all(self, include_deleted: bool = False, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[Role]:
         pass
 
     @abstractmethod
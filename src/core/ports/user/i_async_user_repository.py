@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from src.core.domain.entities.user import User
+
+
+class IAsyncUserRepository(ABC):
+    @abstractmethod
+    async def get_by_id(self, user_id: int) -> Optional[User]:
+        pass
+
+    @abstractmethod
+    async def update(self, user: User) -> User:
+        pass
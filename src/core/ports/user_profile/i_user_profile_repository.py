@@ -18,7 +18,7 @@ class IUserProfileRepository(ABC):
         pass
 
     @abstractmethod
-    def get_all(self, include_deleted: Optional[bool]) -> list[UserProfile]:
+    def get_all(self, include_deleted: Optional[bool] = False, limit: Optional[int] = None, after_id: Optional[int] = None) -> list[UserProfile]:
         pass
 
     @abstractmethod
@@ -0,0 +1,72 @@
+from threading import Lock
+from typing import Callable, Dict, Optional, Union
+import time
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker thread-safe para chamadas a serviços externos.
+
+    Fechado: as chamadas passam e as falhas consecutivas são contadas.
+    Aberto: após `failure_threshold` falhas seguidas, as chamadas são recusadas por `reset_timeout` segundos.
+    Meio aberto: passado esse tempo, uma única chamada de teste é liberada; sucesso fecha o circuito, falha o reabre.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_timeout: float, clock: Callable[[], float] = time.monotonic):
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be greater than zero")
+        if reset_timeout < 0:
+            raise ValueError("reset_timeout must be greater than or equal to zero")
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_progress = False
+        self._lock = Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state()
+
+    def _state(self) -> str:
+        if self._opened_at is None:
+            return self.CLOSED
+        if self._clock() - self._opened_at >= self._reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            state = self._state()
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._trial_in_progress:
+                self._trial_in_progress = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_progress = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._trial_in_progress or self._failures >= self._failure_threshold:
+                self._opened_at = self._clock()
+            self._trial_in_progress = False
+
+    def stats(self) -> Dict[str, Union[int, str]]:
+        with self._lock:
+            return {"state": self._state(), "failures": self._failures}
+
+
+__all__ = ["CircuitBreaker"]
@@ -0,0 +1,118 @@
+from threading import Lock
+from typing import Callable, Dict, NamedTuple, Optional, Union
+import time
+
+from src.core.shared.ttl_cache import TTLCache
+
+
+class CustomerAuthEntry(NamedTuple):
+    """Dados do cliente necessários para o login por CPF."""
+
+    customer_id: int
+    name: str
+    cpf: str
+    email: str
+    is_deleted: bool
+
+
+class CustomerAuthCache:
+    """
+    Cache em memória do CPF para os dados de login do cliente, usado pelo login por CPF dos totens.
+
+    CPFs sem cliente também são guardados (cache negativo, separado, menor e com TTL mais curto),
+    absorvendo rajadas de tentativas com CPFs inexistentes. Assim como o ProfilePermissionCache, o cache é versionado:
+    toda escrita em clientes ou pessoas chama `invalidate()` com os CPFs afetados, e uma leitura
+    feita antes da invalidação não consegue repovoar o cache com dados antigos.
+
+    O cache é local a cada instância: em outras instâncias a entrada expira pelo TTL.
+    """
+
+    UNKNOWN = object()
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: float,
+        negative_max_size: int,
+        negative_ttl: float,
+        clock: Callable[[], float] = time.time,
+    ):
+        # CPFs desconhecidos ficam em um cache separado: uma rajada de CPFs inexistentes
+        # só descarta outros CPFs inexistentes, nunca os clientes em uso
+        self._entries = TTLCache(max_size=max_size, clock=clock)
+        self._unknown = TTLCache(max_size=negative_max_size, clock=clock)
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._version = 0
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.negative_hits = 0
+        self.invalidations = 0
+
+    @classmethod
+    def get_instance(cls) -> "CustomerAuthCache":
+        from src.core.containers import Container
+        return Container.customer_auth_cache()
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def get(self, cpf: str) -> Union[CustomerAuthEntry, object, None]:
+        """
+        Retorna a entrada do CPF, `CustomerAuthCache.UNKNOWN` quando o CPF não tem cliente
+        ou None quando o CPF não está no cache.
+        """
+        entry = self._entries.get(cpf)
+        if entry is None:
+            entry = self._unknown.get(cpf)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+            elif entry is self.UNKNOWN:
+                self.negative_hits += 1
+            else:
+                self.hits += 1
+        return entry
+
+    def set(self, cpf: str, entry: Optional[CustomerAuthEntry], version: int) -> None:
+        """Guarda a entrada do CPF; None registra que o CPF não tem cliente."""
+        with self._lock:
+            if version != self._version:
+                return
+            if entry is None:
+                self._unknown.set(cpf, self.UNKNOWN, ttl=self._negative_ttl)
+            else:
+                self._entries.set(cpf, entry, ttl=self._ttl)
+
+    def invalidate(self, *cpfs: Optional[str]) -> None:
+        with self._lock:
+            self._version += 1
+            self.invalidations += 1
+            for cpf in cpfs:
+                if cpf:
+                    self._entries.pop(cpf)
+                    self._unknown.pop(cpf)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._version += 1
+            self._entries.clear()
+            self._unknown.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self._entries.max_size,
+                "negative_size": len(self._unknown),
+                "negative_max_size": self._unknown.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "negative_hits": self.negative_hits,
+                "invalidations": self.invalidations,
+            }
+
+
+__all__ = ["CustomerAuthCache", "CustomerAuthEntry"]
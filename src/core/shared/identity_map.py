@@ -1,33 +1,95 @@
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+import weakref
 
+from config.settings import IDENTITY_MAP_MAX_SIZE, IDENTITY_MAP_WEAK_REFERENCES
 from src.core.domain.entities.base_entity import BaseEntity
 
 # pattern Identity Map - Martin Fowler
 # https://martinfowler.com/eaaCatalog/identityMap.html
 class IdentityMap:
-    
-    def __init__(self):
-        self._entities = {}
-        
+
+    def __init__(self, max_size: Optional[int] = None, weak: bool = False):
+        if max_size is not None and max_size <= 0:
+            raise ValueError("max_size must be greater than zero")
+        if weak and max_size is not None:
+            raise ValueError("max_size is not supported in weak mode")
+        self._max_size = max_size
+        self._weak = weak
+        # No modo fraco as entidades saem do mapa assim que deixam de ser usadas pela requisição
+        self._entities = weakref.WeakValueDictionary() if weak else OrderedDict()
+
+    @classmethod
+    def from_settings(cls) -> "IdentityMap":
+        if IDENTITY_MAP_WEAK_REFERENCES:
+            return cls(weak=True)
+        return cls(max_size=IDENTITY_MAP_MAX_SIZE or None)
+
     @classmethod
     def get_instance(cls) -> "IdentityMap":
-        from src.core.containers import Container
-        return Container.identity_map()
-        
+        """
+        Retorna o IdentityMap do contexto atual (a requisição em andamento).
+        Fora de uma requisição, um novo mapa é criado para o contexto na primeira chamada.
+        """
+        identity_map = _current_identity_map.get()
+        if identity_map is None:
+            identity_map = cls.from_settings()
+            _current_identity_map.set(identity_map)
+        return identity_map
+
+    @classmethod
+    @contextmanager
+    def scope(cls, identity_map: Optional["IdentityMap"] = None) -> Iterator["IdentityMap"]:
+        """
+        Isola um IdentityMap novo no contexto atual até o fim do bloco.
+        Como o contexto é copiado para o threadpool, cada requisição enxerga apenas o seu mapa.
+        """
+        token = _current_identity_map.set(identity_map if identity_map is not None else cls.from_settings())
+        try:
+            yield _current_identity_map.get()
+        finally:
+            _current_identity_map.reset(token)
+
+    @property
+    def max_size(self) -> Optional[int]:
+        return self._max_size
+
+    @property
+    def weak(self) -> bool:
+        return self._weak
+
     def add(self, entity: BaseEntity):
         key = (entity.__class__, entity.id)
         self._entities[key] = entity
-    
+        if self._weak:
+            return
+        self._entities.move_to_end(key)
+        if self._max_size is not None and len(self._entities) > self._max_size:
+            # Descarta a entidade usada há mais tempo
+            self._entities.popitem(last=False)
+
     def get(self, entity_class, entity_id):
         key = (entity_class, entity_id)
-        return self._entities.get(key)
-    
+        entity = self._entities.get(key)
+        if entity is not None and not self._weak:
+            self._entities.move_to_end(key)
+        return entity
+
     def has(self, entity: BaseEntity):
         key = (entity.__class__, entity.id)
         return key in self._entities
-    
+
     def remove(self, entity: BaseEntity):
         key = (entity.__class__, entity.id)
         self._entities.pop(key, None)
-        
+
     def clear(self):
         self._entities.clear()
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+
+_current_identity_map: ContextVar[Optional[IdentityMap]] = ContextVar("identity_map", default=None)
@@ -0,0 +1,64 @@
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from threading import Lock
+from typing import Any, Callable, Optional
+
+
+class PasswordHashingExecutor:
+    """
+    Executor dedicado às operações de hash de senha (bcrypt), separado do threadpool padrão do Starlette.
+    Um pico de logins ocupa apenas este executor, sem disputar as threads das demais rotas síncronas.
+
+    `kind="process"` usa processos para contornar o GIL; nesse caso a função e os argumentos precisam ser serializáveis.
+    """
+
+    KINDS = ("thread", "process")
+
+    def __init__(self, max_workers: int, kind: str = "thread"):
+        if kind not in self.KINDS:
+            raise ValueError(f"Password hashing executor kind must be one of {self.KINDS}")
+        if max_workers < 1:
+            raise ValueError("Password hashing executor must have at least one worker")
+        self._max_workers = max_workers
+        self._kind = kind
+        self._executor: Optional[Executor] = None
+        self._lock = Lock()
+
+    @classmethod
+    def get_instance(cls) -> "PasswordHashingExecutor":
+        from src.core.containers import Container
+        return Container.password_hashing_executor()
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    @property
+    def kind(self) -> str:
+        return self._kind
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    if self._kind == "process":
+                        self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
+                    else:
+                        self._executor = ThreadPoolExecutor(
+                            max_workers=self._max_workers, thread_name_prefix="password-hashing"
+                        )
+        return self._executor
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), partial(func, *args))
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait)
+                self._executor = None
+
+
+__all__ = ["PasswordHashingExecutor"]
@@ -0,0 +1,47 @@
+from threading import Lock
+from typing import Optional, Tuple
+
+from src.core.shared.ttl_cache import TTLCache
+
+
+class ProfilePermissionCache:
+    """
+    Snapshot em memória do nome do perfil para a tupla com os nomes das suas permissões.
+
+    O cache é versionado: toda escrita em perfis, permissões ou associações perfil-permissão
+    chama `invalidate()`, que incrementa a versão e descarta as entradas. Uma leitura feita
+    antes da invalidação não consegue repovoar o cache com dados antigos, pois `set` exige a
+    versão observada antes da consulta ao banco.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self._entries = TTLCache(max_size=max_size)
+        self._ttl = ttl
+        self._version = 0
+        self._lock = Lock()
+
+    @classmethod
+    def get_instance(cls) -> "ProfilePermissionCache":
+        from src.core.containers import Container
+        return Container.profile_permission_cache()
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def get(self, profile_name: str) -> Optional[Tuple[str, ...]]:
+        return self._entries.get(profile_name)
+
+    def set(self, profile_name: str, permissions: Tuple[str, ...], version: int) -> None:
+        with self._lock:
+            if version != self._version:
+                return
+            self._entries.set(profile_name, tuple(permissions), ttl=self._ttl)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._version += 1
+            self._entries.clear()
+
+
+__all__ = ["ProfilePermissionCache"]
@@ -0,0 +1,79 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, Optional
+import time
+
+
+class TTLCache:
+    """
+    Cache LRU limitado e thread-safe, cujas entradas expiram em um instante absoluto (epoch).
+    """
+
+    def __init__(self, max_size: int, clock: Callable[[], float] = time.time):
+        if max_size < 0:
+            raise ValueError("max_size must be greater than or equal to zero")
+        self._max_size = max_size
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, expires_at: Optional[float] = None, ttl: Optional[float] = None) -> None:
+        if expires_at is None:
+            if ttl is None:
+                raise ValueError("Either expires_at or ttl must be provided")
+            expires_at = self._clock() + ttl
+
+        if self._max_size == 0 or expires_at <= self._clock():
+            return
+
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self._max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+__all__ = ["TTLCache"]
@@ -1,9 +1,15 @@
+import hashlib
 from jose import jwt
 from datetime import datetime, timedelta, timezone
-from config.settings import ACCESS_TOKEN_EXPIRE_MINUTES, JWT_SECRET_KEY, JWT_ALGORITHM
+from config.settings import ACCESS_TOKEN_EXPIRE_MINUTES, JWT_SECRET_KEY, JWT_ALGORITHM, JWT_VERIFIED_TOKEN_CACHE_SIZE
 from src.core.exceptions.invalid_token_exception import InvalidTokenException
+from src.core.shared.ttl_cache import TTLCache
 
 class JWTUtil:
+    # Tokens já verificados, indexados pelo digest do token e expirando no `exp` de cada um.
+    # Compartilhado pelo AuthMiddleware e pelo get_current_user.
+    verified_tokens = TTLCache(max_size=JWT_VERIFIED_TOKEN_CACHE_SIZE)
+
     @staticmethod
     def create_token(data: dict) -> str:
         payload = {
@@ -15,12 +21,20 @@ class JWTUtil:
 
     @staticmethod
     def decode_token(token: str) -> dict:
+        token_digest = hashlib.sha256(token.encode("utf-8")).digest()
+        payload = JWTUtil.verified_tokens.get(token_digest)
+        if payload is not None:
+            return payload
+
         try:
             payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
             if not payload:
                 raise InvalidTokenException(message="Invalid token payload")
-            return payload
         except jwt.ExpiredSignatureError:
                 raise InvalidTokenException(message="Token has expired.")
-        except jwt.InvalidTokenError:
+        except jwt.JWTError:
                 raise InvalidTokenException(message="Invalid token.")
+
+        if isinstance(payload.get("exp"), (int, float)):
+            JWTUtil.verified_tokens.set(token_digest, payload, expires_at=payload["exp"])
+        return payload
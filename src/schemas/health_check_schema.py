@@ -1,3 +1,4 @@
+from typing import Optional
 from src.core.domain.entities.health_check import HealthCheck
 from pydantic import BaseModel
 
@@ -7,3 +8,26 @@ class HealthCheckSchemaOut(BaseModel):
     @classmethod
     def from_entity(cls, health_check: HealthCheck) -> "HealthCheckSchemaOut":
         return cls(status=health_check.status)
+
+
+class DatabasePoolStatusSchemaOut(BaseModel):
+    pool_class: str
+    size: Optional[int] = None
+    checkedin: Optional[int] = None
+    checkedout: Optional[int] = None
+    overflow: Optional[int] = None
+    max_overflow: int
+    pool_timeout: float
+    pool_recycle: int
+    pool_pre_ping: bool
+
+
+class CustomerAuthCacheStatusSchemaOut(BaseModel):
+    size: int
+    max_size: int
+    negative_size: int
+    negative_max_size: int
+    hits: int
+    misses: int
+    negative_hits: int
+    invalidations: int
@@ -86,7 +86,7 @@ class AuthTestHelper:
         return use_case.execute(dto)
 
     def login_employee(self, dto: LoginDTO):
-        use_case = LoginEmployeeUseCase(self.employee_repo, self.profile_repo)
+        use_case = LoginEmployeeUseCase(self.employee_repo, self.profile_repo, self.user_repo)
         return use_case.execute(dto)
 
     def login_anonymous(self):
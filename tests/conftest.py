@@ -1,16 +1,25 @@
 import os
+
+# O despachante do outbox não roda nos testes: os eventos são entregues explicitamente
+os.environ.setdefault("OUTBOX_DISPATCHER_ENABLED", "false")
+
 from faker import Faker
 import pytest
 from typing import Dict, Generator, List, Optional
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+from dependency_injector import providers
 from alembic.config import Config
 from alembic import command
 from src.core.containers import Container
 from src.app import app
 from config.database import get_db
 from src.core.shared.identity_map import IdentityMap
+from src.core.shared.customer_auth_cache import CustomerAuthCache
+from src.core.shared.profile_permission_cache import ProfilePermissionCache
 from src.core.utils.jwt_util import JWTUtil
 from tests.factories.employee_factory import EmployeeFactory
 from tests.factories.permission_factory import PermissionFactory
@@ -74,6 +83,41 @@ def db_session(test_engine):
         # Limpeza do IdentityMap se necessário
         identity_map = IdentityMap.get_instance()
         identity_map.clear()
+        ProfilePermissionCache.get_instance().invalidate()
+        CustomerAuthCache.get_instance().clear()
+
+
+@pytest.fixture(scope="function")
+def query_counter(test_engine) -> Generator[List[str], None, None]:
+    """
+    Registra os comandos SQL enviados ao banco de testes enquanto o teste executa.
+    """
+    statements: List[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(test_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(test_engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture(scope="function")
+def async_session_factory(db_session, test_engine):
+    """
+    Sessões assíncronas (aiosqlite) sobre o mesmo arquivo do banco de testes.
+    Sem pool: cada teste roda as corrotinas no próprio event loop.
+    """
+    pytest.importorskip("aiosqlite")
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{test_engine.url.database}", poolclass=NullPool)
+    session_factory = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+    app.container.async_session.override(providers.Object(session_factory))
+    try:
+        yield session_factory
+    finally:
+        app.container.async_session.reset_override()
 
 
 @pytest.fixture(scope="function")
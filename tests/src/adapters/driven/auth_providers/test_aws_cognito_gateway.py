@@ -0,0 +1,254 @@
+import json
+import socket
+import threading
+import time
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.adapters.driven.auth_providers.aws_cognito_gateway import AWSCognitoGateway
+from src.core.domain.entities.person import Person
+from src.core.shared.circuit_breaker import CircuitBreaker
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class StubApiGateway(ThreadingHTTPServer):
+    """
+    API Gateway local: responde cada POST com o (atraso, status) do CPF em `responses_by_cpf`
+    ou com o próximo da fila (200 imediato quando vazia), registra as requisições recebidas e o pico de chamadas simultâneas.
+    """
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.responses = []
+        self.responses_by_cpf = {}
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def next_response(self, body):
+        with self.lock:
+            if body.get("cpf") in self.responses_by_cpf:
+                return self.responses_by_cpf[body["cpf"]]
+            return self.responses.pop(0) if self.responses else (0, 200)
+
+    def handle_error(self, request, client_address):
+        # O cliente desiste das respostas lentas: a escrita no socket fechado é esperada
+        pass
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Cabeçalhos e corpo saem em escritas separadas: sem isso, o Nagle atrasa o keep-alive
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with self.server.lock:
+            self.server.requests.append({"port": self.client_address[1], "path": self.path, "body": body})
+            self.server.in_flight += 1
+            self.server.max_in_flight = max(self.server.max_in_flight, self.server.in_flight)
+
+        delay, status = self.server.next_response(body)
+        time.sleep(delay)
+        with self.server.lock:
+            self.server.in_flight -= 1
+        payload = b"{}"
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestAWSCognitoGateway:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.server = StubApiGateway()
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.clock = FakeClock()
+        yield
+        self.server.shutdown()
+        self.server.server_close()
+
+    def build_gateway(self, **kwargs) -> AWSCognitoGateway:
+        options = {
+            "base_url": self.server.url,
+            "connect_timeout": 0.5,
+            "read_timeout": 0.5,
+            "max_retries": 2,
+            "retry_backoff": 0.01,
+            "retry_jitter": 0.01,
+            "circuit_breaker": CircuitBreaker(failure_threshold=3, reset_timeout=30, clock=self.clock),
+        }
+        options.update(kwargs)
+        self.gateway = AWSCognitoGateway(**options)
+        return self.gateway
+
+    def teardown_method(self):
+        if getattr(self, "gateway", None) is not None:
+            self.gateway.close()
+
+    def person(self, cpf: str = "12345678909") -> Person:
+        return Person(name="John Doe", cpf=cpf, email="john@example.com", birth_date=date(1990, 1, 1))
+
+    def test_authenticate_reuses_the_pooled_connection(self):
+        gateway = self.build_gateway()
+
+        assert gateway.authenticate("12345678909") is True
+        assert gateway.authenticate("12345678909") is True
+
+        assert len(self.server.requests) == 2
+        assert len({request["port"] for request in self.server.requests}) == 1
+
+    def test_sync_user_sends_person_data(self):
+        gateway = self.build_gateway()
+
+        assert gateway.sync_user(self.person()) is True
+
+        assert self.server.requests[0]["path"] == "/login"
+        assert self.server.requests[0]["body"] == {
+            "cpf": "12345678909",
+            "email": "john@example.com",
+            "name": "John Doe",
+            "birthdate": "1990-01-01",
+        }
+
+    def test_retries_transient_failures(self):
+        self.server.responses = [(0, 503), (0, 502)]
+        gateway = self.build_gateway()
+
+        assert gateway.sync_user(self.person()) is True
+
+        assert len(self.server.requests) == 3
+        assert gateway.circuit_breaker.stats()["failures"] == 0
+
+    def test_gives_up_after_max_retries(self):
+        self.server.responses = [(0, 503)] * 3
+        gateway = self.build_gateway()
+
+        assert gateway.sync_user(self.person()) is False
+
+        assert len(self.server.requests) == 3
+        assert gateway.circuit_breaker.stats()["failures"] == 1
+
+    def test_does_not_retry_client_errors(self):
+        self.server.responses = [(0, 401)]
+        gateway = self.build_gateway()
+
+        assert gateway.authenticate("12345678909") is False
+
+        assert len(self.server.requests) == 1
+        assert gateway.circuit_breaker.state == CircuitBreaker.CLOSED
+
+    def test_slow_responses_time_out_instead_of_hanging(self):
+        self.server.responses = [(2, 200)] * 2
+        gateway = self.build_gateway(read_timeout=0.2, max_retries=1)
+
+        started_at = time.monotonic()
+        assert gateway.sync_user(self.person()) is False
+        elapsed = time.monotonic() - started_at
+
+        assert elapsed < 1.5
+        assert len(self.server.requests) == 2
+
+    def test_recovers_from_a_slow_response_on_retry(self):
+        self.server.responses = [(2, 200)]
+        gateway = self.build_gateway(read_timeout=0.2)
+
+        assert gateway.authenticate("12345678909") is True
+
+        assert len(self.server.requests) == 2
+
+    def test_connection_errors_are_reported_as_failures(self):
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            closed_port = sock.getsockname()[1]
+        gateway = self.build_gateway(base_url=f"http://127.0.0.1:{closed_port}", max_retries=1)
+
+        assert gateway.authenticate("12345678909") is False
+        assert gateway.circuit_breaker.stats()["failures"] == 1
+
+    def test_open_circuit_skips_the_call(self):
+        self.server.responses = [(0, 503)] * 2
+        gateway = self.build_gateway(
+            max_retries=0, circuit_breaker=CircuitBreaker(failure_threshold=2, reset_timeout=30, clock=self.clock),
+        )
+        gateway.sync_user(self.person())
+        gateway.sync_user(self.person())
+
+        assert gateway.circuit_breaker.state == CircuitBreaker.OPEN
+        assert gateway.sync_user(self.person()) is False
+        assert gateway.authenticate("12345678909") is False
+        assert len(self.server.requests) == 2
+
+    def test_circuit_closes_after_a_successful_trial(self):
+        self.server.responses = [(0, 503)] * 2
+        gateway = self.build_gateway(
+            max_retries=0, circuit_breaker=CircuitBreaker(failure_threshold=2, reset_timeout=30, clock=self.clock),
+        )
+        gateway.sync_user(self.person())
+        gateway.sync_user(self.person())
+
+        self.clock.now += 30
+
+        assert gateway.sync_user(self.person()) is True
+        assert gateway.circuit_breaker.state == CircuitBreaker.CLOSED
+        assert len(self.server.requests) == 3
+
+    def test_missing_input_is_not_sent(self):
+        gateway = self.build_gateway()
+
+        assert gateway.authenticate("") is False
+        assert gateway.sync_user(None) is False
+        assert self.server.requests == []
+
+    def test_sync_users_returns_results_in_input_order(self):
+        # A primeira chamada é a mais lenta e termina por último
+        self.server.responses_by_cpf = {"11111111111": (0.2, 200), "22222222222": (0, 400), "33333333333": (0, 200)}
+        gateway = self.build_gateway(max_retries=0)
+        persons = [self.person(cpf) for cpf in self.server.responses_by_cpf]
+
+        assert gateway.sync_users(persons, concurrency=3) == [True, False, True]
+
+        assert sorted(request["body"]["cpf"] for request in self.server.requests) == [person.cpf for person in persons]
+
+    def test_sync_users_limits_concurrent_calls(self):
+        self.server.responses = [(0.05, 200)] * 8
+        gateway = self.build_gateway(pool_max_size=2)
+
+        assert gateway.sync_users([self.person() for _ in range(8)], concurrency=2) == [True] * 8
+
+        assert self.server.max_in_flight == 2
+        assert len({request["port"] for request in self.server.requests}) == 2
+
+    def test_sync_users_uses_the_configured_concurrency_by_default(self):
+        self.server.responses = [(0.05, 200)] * 6
+        gateway = self.build_gateway(sync_concurrency=3)
+
+        assert gateway.sync_users([self.person() for _ in range(6)]) == [True] * 6
+
+        assert self.server.max_in_flight == 3
+
+    def test_sync_users_with_an_empty_batch(self):
+        assert self.build_gateway().sync_users([]) == []
+        assert self.server.requests == []
@@ -0,0 +1,54 @@
+import asyncio
+import pytest
+
+from src.adapters.driven.repositories.async_employee_repository import AsyncEmployeeRepository
+from src.core.shared.identity_map import IdentityMap
+from tests.factories.employee_factory import EmployeeFactory
+
+
+class TestAsyncEmployeeRepository:
+    @pytest.fixture(autouse=True)
+    def setup(self, db_session, async_session_factory):
+        self.db_session = db_session
+        self.async_session_factory = async_session_factory
+
+    def run(self, lookup: str, value):
+        # Descarta o estado deixado pelas factories para que os relacionamentos venham do banco
+        self.db_session.expunge_all()
+        IdentityMap.get_instance().clear()
+
+        async def main():
+            async with self.async_session_factory() as db_session:
+                return await getattr(AsyncEmployeeRepository(db_session), lookup)(value)
+
+        return asyncio.run(main())
+
+    def test_get_by_username_loads_relationships(self):
+        employee = EmployeeFactory()
+        expected = (employee.id, employee.person.name, employee.role.name, employee.user.name)
+
+        employee_response = self.run("get_by_username", employee.user.name)
+
+        assert (
+            employee_response.id,
+            employee_response.person.name,
+            employee_response.role.name,
+            employee_response.user.name,
+        ) == expected
+
+    def test_get_by_id_loads_relationships(self):
+        employee = EmployeeFactory()
+        expected = (employee.id, employee.person.cpf, employee.role.id, employee.user.id)
+
+        employee_response = self.run("get_by_id", employee.id)
+
+        assert (
+            employee_response.id,
+            employee_response.person.cpf,
+            employee_response.role.id,
+            employee_response.user.id,
+        ) == expected
+
+    @pytest.mark.parametrize("lookup, value", [("get_by_username", "nobody"), ("get_by_id", 999)])
+    def test_unknown_employee_returns_none(self, lookup, value):
+        assert self.run(lookup, value) is None
@@ -0,0 +1,37 @@
+import asyncio
+import pytest
+
+from src.adapters.driven.repositories.async_profile_repository import AsyncProfileRepository
+from src.core.shared.profile_permission_cache import ProfilePermissionCache
+from tests.factories.permission_factory import PermissionFactory
+from tests.factories.profile_factory import ProfileFactory
+from tests.factories.profile_permission_factory import ProfilePermissionFactory
+
+
+class TestAsyncProfileRepository:
+    @pytest.fixture(autouse=True)
+    def setup(self, db_session, async_session_factory):
+        self.async_session_factory = async_session_factory
+        ProfilePermissionCache.get_instance().invalidate()
+
+    def get_permission_names(self, name: str):
+        async def main():
+            async with self.async_session_factory() as db_session:
+                return await AsyncProfileRepository(db_session).get_permission_names(name)
+
+        return asyncio.run(main())
+
+    def test_get_permission_names(self):
+        profile = ProfileFactory(name="employee")
+        first = ProfilePermissionFactory(profile=profile, permission=PermissionFactory(name="view_roles"))
+        second = ProfilePermissionFactory(profile=profile, permission=PermissionFactory(name="view_users"))
+
+        assert self.get_permission_names("employee") == (first.permission.name, second.permission.name)
+
+    def test_get_permission_names_uses_shared_cache(self):
+        ProfilePermissionCache.get_instance().set("employee", ("cached",), ProfilePermissionCache.get_instance().version)
+
+        assert self.get_permission_names("employee") == ("cached",)
+
+    def test_get_permission_names_of_unknown_profile_returns_none(self):
+        assert self.get_permission_names("unknown") is None
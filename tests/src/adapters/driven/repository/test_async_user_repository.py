@@ -0,0 +1,29 @@
+import asyncio
+import pytest
+
+from src.adapters.driven.repositories.async_user_repository import AsyncUserRepository
+from src.adapters.driven.repositories.models.user_model import UserModel
+from tests.factories.user_factory import UserFactory
+
+
+class TestAsyncUserRepository:
+    @pytest.fixture(autouse=True)
+    def setup(self, db_session, async_session_factory):
+        self.db_session = db_session
+        self.async_session_factory = async_session_factory
+
+    def test_update_user_password_hash(self):
+        user = UserFactory().to_entity()
+        user.password_hash = "new-hash"
+
+        async def main():
+            async with self.async_session_factory() as db_session:
+                repository = AsyncUserRepository(db_session)
+                await repository.update(user)
+                return await repository.get_by_id(user.id)
+
+        updated_user = asyncio.run(main())
+
+        assert updated_user.password_hash == "new-hash"
+        self.db_session.expire_all()
+        assert self.db_session.get(UserModel, user.id).password_hash == "new-hash"
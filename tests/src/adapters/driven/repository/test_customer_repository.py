@@ -5,7 +5,9 @@ from pycpfcnpj import gen
 from src.core.domain.entities.person import Person
 from src.adapters.driven.repositories.models.customer_model import CustomerModel
 from src.adapters.driven.repositories.customer_repository import CustomerRepository
+from src.core.domain.dtos.customer.customer_dto import CustomerDTO
 from src.core.domain.entities.customer import Customer
+from src.core.shared.identity_map import IdentityMap
 from tests.factories.person_factory import PersonFactory
 from tests.factories.customer_factory import CustomerFactory
 
@@ -152,4 +154,50 @@ class TestCustomerRepository:
         assert customers[0].person.cpf == customer_model.person.cpf
         assert customers[0].person.email == customer_model.person.email
         assert customers[0].person.birth_date == customer_model.person.birth_date
-    
\ No newline at end of file
+    
+
+    def start_counting(self, query_counter):
+        # Descarta o estado deixado pelas factories para que as pessoas venham do banco
+        self.db_session.expunge_all()
+        IdentityMap.get_instance().clear()
+        query_counter.clear()
+
+    def test_get_all_customers_loads_persons_in_the_same_statement(self, query_counter):
+        CustomerFactory.create_batch(5)
+        self.start_counting(query_counter)
+
+        customers = self.repository.get_all()
+
+        assert len(customers) == 5
+        assert all(customer.person.cpf for customer in customers)
+        assert len(query_counter) == 1
+
+    def test_get_by_cpf_uses_a_single_statement(self, query_counter):
+        customer = CustomerFactory()
+        cpf = customer.person.cpf
+        self.start_counting(query_counter)
+
+        customer_response = self.repository.get_by_cpf(cpf)
+
+        assert customer_response.person.cpf == cpf
+        assert len(query_counter) == 1
+
+    def test_get_all_customer_dtos_skips_models_and_identity_map(self, query_counter):
+        CustomerFactory.create_batch(5)
+        self.start_counting(query_counter)
+
+        customers = self.repository.get_all_dtos()
+
+        assert len(customers) == 5
+        assert all(isinstance(customer, CustomerDTO) and customer.person.cpf for customer in customers)
+        assert len(query_counter) == 1
+        assert len(self.db_session.identity_map) == 0
+        assert len(IdentityMap.get_instance()) == 0
+
+    def test_get_all_customer_dtos_filters_by_owner(self):
+        customers = CustomerFactory.create_batch(3)
+
+        data = self.repository.get_all_dtos(owner_id=customers[1].id)
+
+        assert [customer.id for customer in data] == [customers[1].id]
+        assert data[0].person.id == customers[1].person_id
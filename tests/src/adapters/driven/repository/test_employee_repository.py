@@ -3,7 +3,9 @@ from datetime import datetime
 
 from src.adapters.driven.repositories.models.employee_model import EmployeeModel
 from src.adapters.driven.repositories.employee_repository import EmployeeRepository
+from src.core.domain.dtos.employee.employee_dto import EmployeeDTO
 from src.core.domain.entities.employee import Employee
+from src.core.shared.identity_map import IdentityMap
 from tests.factories.person_factory import PersonFactory
 from tests.factories.role_factory import RoleFactory
 from tests.factories.user_factory import UserFactory
@@ -210,3 +212,88 @@ class TestEmployeeRepository:
         assert data[0].person.id == employee.person_id
         assert data[0].role.id == employee.role_id
         assert data[0].user.id == employee.user_id
+
+    def start_counting(self, query_counter):
+        # Descarta o estado deixado pelas factories para que os relacionamentos venham do banco
+        self.db_session.expunge_all()
+        IdentityMap.get_instance().clear()
+        query_counter.clear()
+
+    def assert_relationships_loaded(self, employee):
+        assert employee.person.name is not None
+        assert employee.role.name is not None
+        assert employee.user.name is not None
+
+    def test_get_employee_by_username_uses_a_single_statement(self, query_counter):
+        employee = EmployeeFactory()
+        username = employee.user.name
+        self.start_counting(query_counter)
+
+        employee_response = self.repository.get_by_username(username)
+
+        self.assert_relationships_loaded(employee_response)
+        assert employee_response.user.name == username
+        assert len(query_counter) == 1
+
+    @pytest.mark.parametrize("lookup, attribute", [
+        ("get_by_id", "id"),
+        ("get_by_person_id", "person_id"),
+        ("get_by_user_id", "user_id"),
+    ])
+    def test_single_employee_lookups_use_a_single_statement(self, query_counter, lookup, attribute):
+        employee = EmployeeFactory()
+        value = getattr(employee, attribute)
+        self.start_counting(query_counter)
+
+        employee_response = getattr(self.repository, lookup)(value)
+
+        self.assert_relationships_loaded(employee_response)
+        assert len(query_counter) == 1
+
+    def test_get_all_employees_statement_count_does_not_grow_with_rows(self, query_counter):
+        EmployeeFactory.create_batch(5)
+        self.start_counting(query_counter)
+
+        employees = self.repository.get_all()
+
+        assert len(employees) == 5
+        for employee in employees:
+            self.assert_relationships_loaded(employee)
+        assert len(query_counter) == 2
+
+    def test_get_employees_by_role_id_uses_a_single_statement(self, query_counter):
+        role = RoleFactory()
+        EmployeeFactory.create_batch(3, role=role)
+        role_id = role.id
+        self.start_counting(query_counter)
+
+        employees = self.repository.get_by_role_id(role_id)
+
+        assert len(employees) == 3
+        for employee in employees:
+            self.assert_relationships_loaded(employee)
+        assert len(query_counter) == 1
+
+    def test_get_all_employee_dtos_reads_rows_in_a_single_statement(self, query_counter):
+        EmployeeFactory.create_batch(5)
+        self.start_counting(query_counter)
+
+        employees = self.repository.get_all_dtos()
+
+        assert len(employees) == 5
+        for employee in employees:
+            assert isinstance(employee, EmployeeDTO)
+            assert employee.person.name is not None
+            assert employee.role.name is not None
+            assert employee.user.name is not None
+        assert len(query_counter) == 1
+        # Nada é instanciado como *Model nem registrado na sessão ou no IdentityMap
+        assert len(self.db_session.identity_map) == 0
+        assert len(IdentityMap.get_instance()) == 0
+
+    def test_get_all_employee_dtos_matches_entity_listing(self):
+        EmployeeFactory.create_batch(3)
+
+        expected = [EmployeeDTO.from_entity(employee) for employee in self.repository.get_all()]
+
+        assert self.repository.get_all_dtos() == expected
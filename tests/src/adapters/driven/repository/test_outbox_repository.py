@@ -0,0 +1,73 @@
+import pytest
+from datetime import timedelta
+
+from src.adapters.driven.repositories.models.outbox_event_model import OutboxEventModel
+from src.adapters.driven.repositories.outbox_repository import OutboxRepository
+from src.core.domain.entities.outbox_event import OutboxEvent, utc_now
+
+
+class TestOutboxRepository:
+    @pytest.fixture(autouse=True)
+    def setup(self, db_session):
+        self.repository = OutboxRepository(db_session)
+        self.db_session = db_session
+        self.clean_database()
+
+    def clean_database(self):
+        self.db_session.query(OutboxEventModel).delete()
+        self.db_session.commit()
+
+    def add_event(self, person_id: int, **kwargs) -> None:
+        self.repository.add(OutboxEvent(event_type=OutboxEvent.USER_SYNC, payload={"person_id": person_id}, **kwargs))
+
+    def test_add_does_not_commit(self):
+        self.add_event(1)
+
+        self.db_session.rollback()
+
+        assert self.db_session.query(OutboxEventModel).count() == 0
+
+    def test_add_is_written_by_the_next_commit(self):
+        self.add_event(1)
+
+        self.db_session.commit()
+
+        event_model = self.db_session.query(OutboxEventModel).one()
+        assert event_model.payload == {"person_id": 1}
+        assert event_model.attempts == 0
+
+    def test_claim_due_returns_pending_events_in_creation_order(self):
+        now = utc_now()
+        self.add_event(1)
+        self.add_event(2)
+        self.add_event(3, available_at=now + timedelta(minutes=5))
+        self.add_event(4, processed_at=now)
+        self.add_event(5, dead_lettered_at=now)
+        self.db_session.commit()
+
+        events = self.repository.claim_due(limit=10, now=now + timedelta(seconds=1))
+
+        assert [event.payload["person_id"] for event in events] == [1, 2]
+
+    def test_claim_due_respects_the_limit(self):
+        for person_id in range(3):
+            self.add_event(person_id)
+        self.db_session.commit()
+
+        events = self.repository.claim_due(limit=2, now=utc_now() + timedelta(seconds=1))
+
+        assert len(events) == 2
+
+    def test_update_all_persists_delivery_state(self):
+        self.add_event(1)
+        self.db_session.commit()
+        now = utc_now() + timedelta(seconds=1)
+        event = self.repository.claim_due(limit=1, now=now)[0]
+
+        event.schedule_retry("timeout", now + timedelta(seconds=30))
+        self.repository.update_all([event])
+
+        event_model = self.db_session.get(OutboxEventModel, event.id)
+        assert event_model.attempts == 1
+        assert event_model.last_error == "timeout"
+        assert self.repository.claim_due(limit=1, now=now) == []
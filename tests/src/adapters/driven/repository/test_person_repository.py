@@ -5,6 +5,7 @@ from sqlalchemy.exc import IntegrityError
 
 from src.adapters.driven.repositories.models.person_model import PersonModel
 from src.adapters.driven.repositories.person_repository import PersonRepository
+from src.core.domain.dtos.person.person_dto import PersonDTO
 from src.core.domain.entities.person import Person
 from tests.factories.person_factory import PersonFactory
 
@@ -130,3 +131,26 @@ class TestPersonRepository:
         assert persons[0].name == person.name
         assert persons[0].email == person.email
 
+    def test_get_all_persons_with_keyset_pagination(self):
+        persons = PersonFactory.create_batch(5)
+        person_ids = [person.id for person in persons]
+
+        first_page = self.repository.get_all(limit=2)
+        second_page = self.repository.get_all(limit=2, after_id=first_page[-1].id)
+        last_page = self.repository.get_all(limit=2, after_id=second_page[-1].id)
+
+        assert [person.id for person in first_page] == person_ids[:2]
+        assert [person.id for person in second_page] == person_ids[2:4]
+        assert [person.id for person in last_page] == person_ids[4:]
+
+    def test_get_all_person_dtos_with_keyset_pagination(self):
+        persons = PersonFactory.create_batch(3)
+        deleted = PersonFactory(inactivated_at=datetime.now())
+
+        first_page = self.repository.get_all_dtos(limit=2)
+        second_page = self.repository.get_all_dtos(limit=2, after_id=first_page[-1].id)
+
+        assert all(isinstance(person, PersonDTO) for person in first_page + second_page)
+        assert [person.id for person in first_page + second_page] == [person.id for person in persons]
+        assert first_page[0] == PersonDTO.from_entity(persons[0].to_entity())
+        assert deleted.id in [person.id for person in self.repository.get_all_dtos(include_deleted=True)]
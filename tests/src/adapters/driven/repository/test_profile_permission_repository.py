@@ -43,6 +43,17 @@ class TestProfilePermissionRepository:
         profile_permission = self.repository.get_by_id(profile_permission_id=1)
         assert profile_permission is None
     
+    def test_exists_by_permission_id_and_profile_id(self):
+        profile_permission = ProfilePermissionFactory()
+        other_permission = PermissionFactory()
+
+        assert self.repository.exists_by_permission_id_and_profile_id(
+            profile_permission.permission_id, profile_permission.profile_id
+        ) is True
+        assert self.repository.exists_by_permission_id_and_profile_id(
+            other_permission.id, profile_permission.profile_id
+        ) is False
+
     def test_get_profile_permission_by_profile_id_success(self, db_session):
         profile_permission = ProfilePermissionFactory()
 
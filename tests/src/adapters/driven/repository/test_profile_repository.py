@@ -1,8 +1,16 @@
 import pytest
 from src.adapters.driven.repositories.profile_repository import ProfileRepository
 from src.core.domain.entities.profile import Profile
+from src.core.shared.identity_map import IdentityMap
 from src.adapters.driven.repositories.models.profile_model import ProfileModel
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+from src.adapters.driven.repositories.profile_permission_repository import ProfilePermissionRepository
+from src.core.domain.entities.profile_permission import ProfilePermission
+from tests.factories.permission_factory import PermissionFactory
+from tests.factories.profile_factory import ProfileFactory
+from tests.factories.profile_permission_factory import ProfilePermissionFactory
+from tests.factories.user_profile_factory import UserProfileFactory
 
 
 class TestProfileRepository:
@@ -181,4 +189,80 @@ class TestProfileRepository:
 
         assert len(self.repository.get_all()) == 1
 
-        
+    def test_get_permission_names_returns_profile_permissions(self):
+        profile_permission = ProfilePermissionFactory()
+
+        permission_names = self.repository.get_permission_names(profile_permission.profile.name)
+
+        assert permission_names == (profile_permission.permission.name,)
+
+    def test_get_permission_names_returns_none_for_unknown_profile(self):
+        assert self.repository.get_permission_names("unknown") is None
+
+    def test_get_permission_names_is_served_from_cache(self, query_counter):
+        profile_permission = ProfilePermissionFactory()
+        profile_name = profile_permission.profile.name
+        expected = self.repository.get_permission_names(profile_name)
+
+        query_counter.clear()
+        permission_names = self.repository.get_permission_names(profile_name)
+
+        assert permission_names == expected
+        assert query_counter == []
+
+    def test_get_permission_names_is_invalidated_by_profile_permission_writes(self):
+        profile = ProfileFactory()
+        permission = PermissionFactory()
+        assert self.repository.get_permission_names(profile.name) == ()
+
+        ProfilePermissionRepository(self.db_session).create(
+            ProfilePermission(profile=profile.to_entity(), permission=permission.to_entity())
+        )
+
+        assert self.repository.get_permission_names(profile.name) == (permission.name,)
+
+    def test_get_by_name_loads_permissions_but_not_users(self, query_counter):
+        profile_permission = ProfilePermissionFactory()
+        profile_name = profile_permission.profile.name
+        permission_name = profile_permission.permission.name
+        IdentityMap.get_instance().clear()
+
+        query_counter.clear()
+        profile = self.repository.get_by_name(profile_name)
+        statements = len(query_counter)
+
+        assert [permission.name for permission in profile.permissions] == [permission_name]
+        assert [item.id for item in profile.profile_permissions] == [profile_permission.id]
+        assert len(query_counter) == statements
+        assert not any("FROM users" in statement for statement in query_counter)
+
+    def test_profile_collections_are_readable_after_session_is_closed(self, test_engine):
+        profile_permission = ProfilePermissionFactory()
+        user_profile = UserProfileFactory(profile=profile_permission.profile)
+        IdentityMap.get_instance().clear()
+
+        with sessionmaker(bind=test_engine)() as session:
+            profile = ProfileRepository(session).get_by_id(profile_permission.profile.id)
+            profile_from_model = session.get(ProfileModel, profile_permission.profile.id).to_entity()
+
+        assert profile_from_model is profile
+        assert [permission.name for permission in profile.permissions] == [profile_permission.permission.name]
+        assert [user.id for user in profile.users] == [user_profile.user.id]
+
+    def test_get_by_name_with_permission_names_projection(self, query_counter):
+        profile_permission = ProfilePermissionFactory()
+        profile_name = profile_permission.profile.name
+        permission_name = profile_permission.permission.name
+        IdentityMap.get_instance().clear()
+
+        query_counter.clear()
+        profile = self.repository.get_by_name(profile_name, permission_names_only=True)
+
+        assert profile.name == profile_name
+        assert profile.permission_names == (permission_name,)
+        assert len(query_counter) == 2
+        assert profile.users == []
+        assert [permission.name for permission in profile.permissions] == [permission_name]
+
+    def test_get_by_id_with_permission_names_projection_returns_none_for_unknown_id(self):
+        assert self.repository.get_by_id(999, permission_names_only=True) is None
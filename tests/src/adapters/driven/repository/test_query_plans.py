@@ -0,0 +1,150 @@
+import re
+import pytest
+from sqlalchemy import event
+
+from src.adapters.driven.repositories.customer_repository import CustomerRepository
+from src.adapters.driven.repositories.employee_repository import EmployeeRepository
+from src.adapters.driven.repositories.outbox_repository import OutboxRepository
+from src.adapters.driven.repositories.permission_repository import PermissionRepository
+from src.adapters.driven.repositories.person_repository import PersonRepository
+from src.adapters.driven.repositories.profile_permission_repository import ProfilePermissionRepository
+from src.adapters.driven.repositories.profile_repository import ProfileRepository
+from src.adapters.driven.repositories.role_repository import RoleRepository
+from src.adapters.driven.repositories.user_profile_repository import UserProfileRepository
+from src.adapters.driven.repositories.user_repository import UserRepository
+from src.core.domain.entities.outbox_event import utc_now
+from src.core.shared.identity_map import IdentityMap
+from src.core.shared.profile_permission_cache import ProfilePermissionCache
+from tests.factories.customer_factory import CustomerFactory
+from tests.factories.employee_factory import EmployeeFactory
+from tests.factories.profile_permission_factory import ProfilePermissionFactory
+from tests.factories.user_profile_factory import UserProfileFactory
+
+# Varredura completa de uma tabela no EXPLAIN QUERY PLAN do SQLite ("SCAN customers",
+# "SCAN employees USING INDEX ..."). Subconsultas (anon_N) e "SCAN CONSTANT ROW" não leem tabelas.
+FULL_SCAN = re.compile(r"^SCAN (?!CONSTANT ROW|anon_\d+)(\S+)")
+
+# Consultas de cada repositório, no formato (repositório, método, argumentos a partir dos dados criados)
+REPOSITORY_QUERIES = [
+    (CustomerRepository, "get_by_id", lambda data: (data["customer"].id,)),
+    (CustomerRepository, "get_by_cpf", lambda data: (data["customer"].person.cpf,)),
+    (CustomerRepository, "get_by_person_id", lambda data: (data["customer"].person_id,)),
+    (CustomerRepository, "get_all", lambda data: ()),
+    (CustomerRepository, "get_all_dtos", lambda data: ()),
+    (CustomerRepository, "get_all_dtos", lambda data: (False, 10, None, data["customer"].id)),
+    (EmployeeRepository, "get_by_id", lambda data: (data["employee"].id,)),
+    (EmployeeRepository, "get_by_person_id", lambda data: (data["employee"].person_id,)),
+    (EmployeeRepository, "get_by_user_id", lambda data: (data["employee"].user_id,)),
+    (EmployeeRepository, "get_by_role_id", lambda data: (data["employee"].role_id,)),
+    (EmployeeRepository, "get_by_username", lambda data: (data["employee"].user.name,)),
+    (EmployeeRepository, "get_all", lambda data: ()),
+    (EmployeeRepository, "get_all_dtos", lambda data: ()),
+    (OutboxRepository, "claim_due", lambda data: (10, utc_now())),
+    (PermissionRepository, "exists_by_name", lambda data: (data["profile_permission"].permission.name,)),
+    (PermissionRepository, "get_by_name", lambda data: (data["profile_permission"].permission.name,)),
+    (PermissionRepository, "get_by_id", lambda data: (data["profile_permission"].permission_id,)),
+    (PermissionRepository, "get_all", lambda data: ()),
+    (PersonRepository, "exists_by_cpf", lambda data: (data["customer"].person.cpf,)),
+    (PersonRepository, "exists_by_email", lambda data: (data["customer"].person.email,)),
+    (PersonRepository, "get_by_cpf", lambda data: (data["customer"].person.cpf,)),
+    (PersonRepository, "get_by_id", lambda data: (data["customer"].person_id,)),
+    (PersonRepository, "get_all", lambda data: ()),
+    (PersonRepository, "get_all_dtos", lambda data: ()),
+    (ProfilePermissionRepository, "exists_by_permission_id_and_profile_id", lambda data: (
+        data["profile_permission"].permission_id, data["profile_permission"].profile_id,
+    )),
+    (ProfilePermissionRepository, "get_by_id", lambda data: (data["profile_permission"].id,)),
+    (ProfilePermissionRepository, "get_by_permission_id_and_profile_id", lambda data: (
+        data["profile_permission"].permission_id, data["profile_permission"].profile_id,
+    )),
+    (ProfilePermissionRepository, "get_by_profile_id", lambda data: (data["profile_permission"].profile_id,)),
+    (ProfilePermissionRepository, "get_by_permission_id", lambda data: (data["profile_permission"].permission_id,)),
+    (ProfilePermissionRepository, "get_all", lambda data: ()),
+    (ProfileRepository, "exists_by_name", lambda data: (data["profile_permission"].profile.name,)),
+    (ProfileRepository, "get_by_name", lambda data: (data["profile_permission"].profile.name,)),
+    (ProfileRepository, "get_by_name", lambda data: (data["profile_permission"].profile.name, True)),
+    (ProfileRepository, "get_permission_names", lambda data: (data["profile_permission"].profile.name,)),
+    (ProfileRepository, "get_by_id", lambda data: (data["profile_permission"].profile_id,)),
+    (ProfileRepository, "get_all", lambda data: ()),
+    (RoleRepository, "exists_by_name", lambda data: (data["employee"].role.name,)),
+    (RoleRepository, "get_by_name", lambda data: (data["employee"].role.name,)),
+    (RoleRepository, "get_by_id", lambda data: (data["employee"].role_id,)),
+    (RoleRepository, "get_all", lambda data: ()),
+    (UserProfileRepository, "get_by_id", lambda data: (data["user_profile"].id,)),
+    (UserProfileRepository, "get_by_user_id_and_profile_id", lambda data: (
+        data["user_profile"].user_id, data["user_profile"].profile_id,
+    )),
+    (UserProfileRepository, "get_all", lambda data: ()),
+    (UserRepository, "get_by_name", lambda data: (data["employee"].user.name,)),
+    (UserRepository, "get_by_id", lambda data: (data["employee"].user_id,)),
+    (UserRepository, "get_all", lambda data: ()),
+]
+
+
+class TestQueryPlans:
+    @pytest.fixture(autouse=True)
+    def setup(self, db_session, test_engine):
+        self.db_session = db_session
+        self.engine = test_engine
+        employee = EmployeeFactory()
+        profile_permission = ProfilePermissionFactory()
+        self.data = {
+            "customer": CustomerFactory(),
+            "employee": employee,
+            "profile_permission": profile_permission,
+            "user_profile": UserProfileFactory(user=employee.user, profile=profile_permission.profile),
+        }
+
+    def capture_selects(self, call):
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT"):
+                statements.append((statement, parameters))
+
+        event.listen(self.engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            call()
+        finally:
+            event.remove(self.engine, "before_cursor_execute", before_cursor_execute)
+        return statements
+
+    def query_plan(self, statement, parameters):
+        with self.engine.connect() as connection:
+            rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+        return [row[3] for row in rows]
+
+    @pytest.mark.parametrize(
+        "repository_class, method, arguments",
+        REPOSITORY_QUERIES,
+        ids=[f"{repository_class.__name__}.{method}-{index}" for index, (repository_class, method, _) in enumerate(REPOSITORY_QUERIES)],
+    )
+    def test_repository_query_does_not_scan_whole_tables(self, repository_class, method, arguments):
+        repository = repository_class(self.db_session)
+        args = arguments(self.data)
+        # Sem cache: as consultas precisam chegar ao banco
+        IdentityMap.get_instance().clear()
+        ProfilePermissionCache.get_instance().invalidate()
+        self.db_session.expunge_all()
+
+        def call():
+            result = getattr(repository, method)(*args)
+            if isinstance(result, list):
+                result = list(result)
+            return result
+
+        statements = self.capture_selects(call)
+
+        assert statements, f"{repository_class.__name__}.{method} não executou nenhuma consulta"
+        for statement, parameters in statements:
+            plan = self.query_plan(statement, parameters)
+            scans = [detail for detail in plan if FULL_SCAN.match(detail)]
+            assert not scans, f"Varredura completa em {repository_class.__name__}.{method}:\n{statement}\n{plan}"
+
+    def test_paginated_listings_do_not_sort_in_memory(self):
+        # A ordenação por id precisa vir do índice (inactivated_at, id), não de um B-tree temporário
+        statements = self.capture_selects(lambda: PersonRepository(self.db_session).get_all_dtos(limit=10))
+
+        plan = self.query_plan(*statements[0])
+
+        assert "USE TEMP B-TREE FOR ORDER BY" not in plan
@@ -37,6 +37,12 @@ class TestRoleRepository:
         with pytest.raises(IntegrityError):
             self.repository.create(duplicate_role)
     
+    def test_exists_by_name(self):
+        self.repository.create(Role(name='Admin', description='Admin role'))
+
+        assert self.repository.exists_by_name('Admin') is True
+        assert self.repository.exists_by_name('Manager') is False
+
     def test_get_role_by_name_success(self):
         new_role = RoleFactory()
 
@@ -0,0 +1,157 @@
+import pytest
+from sqlalchemy import create_engine, event, text
+
+from src.adapters.driven.repositories.models.base_model import BaseModel
+from src.adapters.driven.repositories.profile_repository import ProfileRepository
+from src.adapters.driven.repositories.role_repository import RoleRepository
+from src.adapters.driven.repositories.user_repository import UserRepository
+from config.database_routing import RoutingSession, RoutingState, on_primary
+from src.core.domain.entities.role import Role
+from src.core.domain.entities.user import User
+from src.core.shared.identity_map import IdentityMap
+from src.core.shared.profile_permission_cache import ProfilePermissionCache
+
+
+def insert_role(engine, name: str):
+    with engine.begin() as connection:
+        connection.execute(text(
+            "INSERT INTO roles (id, name, description, created_at, updated_at) "
+            "VALUES (1, :name, :name, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+        ), {"name": name})
+
+
+def insert_profile(engine, permission_names):
+    with engine.begin() as connection:
+        connection.execute(text(
+            "INSERT INTO profiles (id, name, description, created_at, updated_at) "
+            "VALUES (1, 'employee', 'employee', CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+        ))
+        for permission_id, permission_name in enumerate(permission_names, start=1):
+            connection.execute(text(
+                "INSERT INTO permissions (id, name, description, created_at, updated_at) "
+                "VALUES (:id, :name, :name, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+            ), {"id": permission_id, "name": permission_name})
+            connection.execute(text(
+                "INSERT INTO profile_permissions (id, profile_id, permission_id, created_at, updated_at) "
+                "VALUES (:id, 1, :id, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+            ), {"id": permission_id})
+
+
+class TestRoutingSession:
+    @pytest.fixture(autouse=True)
+    def setup(self, test_engine, tmp_path):
+        # Réplica: outro arquivo SQLite com o mesmo schema e dados diferentes,
+        # para identificar qual banco atendeu cada consulta
+        self.primary = test_engine
+        self.replica = create_engine(f"sqlite:///{tmp_path / 'replica.sqlite'}")
+        BaseModel.metadata.create_all(self.replica)
+        insert_role(self.primary, "primary")
+        insert_role(self.replica, "replica")
+
+        with IdentityMap.scope(), RoutingState.scope():
+            yield
+        self.replica.dispose()
+
+    def build_repository(self, **kwargs) -> RoleRepository:
+        self.session = RoutingSession(bind=self.primary, replica_binds=[self.replica], **kwargs)
+        return RoleRepository(self.session)
+
+    def read_role_name(self, repository: RoleRepository) -> str:
+        IdentityMap.get_instance().clear()
+        return repository.get_by_id(1).name
+
+    def replica_statements(self):
+        statements = []
+        event.listen(self.replica, "before_cursor_execute", lambda conn, cursor, statement, *args: statements.append(statement))
+        return statements
+
+    def teardown_method(self):
+        if getattr(self, "session", None) is not None:
+            self.session.close()
+        # O cache de permissões é global: não deixa entradas lidas destes bancos para outros testes
+        ProfilePermissionCache.get_instance().invalidate()
+
+    def test_read_only_methods_use_the_replica(self):
+        repository = self.build_repository()
+
+        assert self.read_role_name(repository) == "replica"
+        assert repository.get_by_name("replica").id == 1
+
+    def test_without_replicas_reads_use_the_primary(self):
+        self.session = RoutingSession(bind=self.primary)
+
+        assert self.read_role_name(RoleRepository(self.session)) == "primary"
+
+    def test_writes_go_to_the_primary(self):
+        repository = self.build_repository()
+
+        repository.create(Role(name="manager", description="Manager"))
+
+        with self.primary.connect() as connection:
+            assert connection.execute(text("SELECT COUNT(*) FROM roles WHERE name = 'manager'")).scalar() == 1
+        with self.replica.connect() as connection:
+            assert connection.execute(text("SELECT COUNT(*) FROM roles WHERE name = 'manager'")).scalar() == 0
+
+    def test_reads_after_a_write_stick_to_the_primary(self):
+        repository = self.build_repository()
+        assert self.read_role_name(repository) == "replica"
+
+        repository.create(Role(name="manager", description="Manager"))
+
+        assert self.read_role_name(repository) == "primary"
+
+    def test_stickiness_is_scoped_to_the_request(self):
+        repository = self.build_repository()
+        repository.create(Role(name="manager", description="Manager"))
+
+        with RoutingState.scope():
+            assert self.read_role_name(repository) == "replica"
+
+    def test_reads_after_a_write_use_the_replica_when_stickiness_is_disabled(self):
+        repository = self.build_repository(sticky=False)
+
+        repository.create(Role(name="manager", description="Manager"))
+
+        assert self.read_role_name(repository) == "replica"
+
+    def test_reads_inside_write_methods_use_the_primary(self):
+        repository = self.build_repository()
+
+        # delete consulta o cargo antes de removê-lo: a consulta precisa ir ao primário
+        repository.delete(Role(id=1, name="primary", description="primary"))
+
+        with self.primary.connect() as connection:
+            assert connection.execute(text("SELECT COUNT(*) FROM roles WHERE id = 1")).scalar() == 0
+
+    def test_get_methods_called_by_write_methods_use_the_primary(self):
+        self.session = RoutingSession(bind=self.primary, replica_binds=[self.replica])
+        replica_statements = self.replica_statements()
+
+        # create consulta o usuário pelo id (get_by_id) antes de inserir
+        UserRepository(self.session).create(User(id=5, name="routed", password_hash="hash"))
+
+        assert replica_statements == []
+        with self.primary.connect() as connection:
+            assert connection.execute(text("SELECT COUNT(*) FROM users WHERE id = 5")).scalar() == 1
+
+    def test_on_primary_overrides_read_only_methods(self):
+        repository = self.build_repository()
+
+        with on_primary():
+            assert self.read_role_name(repository) == "primary"
+        assert self.read_role_name(repository) == "replica"
+
+    def test_permission_names_are_cached_from_the_primary(self):
+        # A réplica atrasada ainda tem a permissão que o primário já revogou
+        insert_profile(self.primary, ["can_view_orders"])
+        insert_profile(self.replica, ["can_view_orders", "can_delete_orders"])
+        permission_cache = ProfilePermissionCache.get_instance()
+        permission_cache.invalidate()
+        self.session = RoutingSession(bind=self.primary, replica_binds=[self.replica])
+        replica_statements = self.replica_statements()
+
+        permission_names = ProfileRepository(self.session).get_permission_names("employee")
+
+        assert permission_names == ("can_view_orders",)
+        assert permission_cache.get("employee") == ("can_view_orders",)
+        assert replica_statements == []
@@ -0,0 +1,66 @@
+from fastapi import APIRouter, status
+
+from src.adapters.driver.api.v1.decorators.bypass_auth import BypassRouteTable, bypass_auth
+
+
+def build_routes():
+    router = APIRouter(prefix="/api/v1")
+
+    @router.post("/customers")
+    @bypass_auth()
+    def create_customer():
+        pass
+
+    @router.get("/customers/{customer_id}/id")
+    @bypass_auth()
+    def get_customer(customer_id: int):
+        pass
+
+    @router.get("/orders/{order_id}/items/{item_id}")
+    @bypass_auth()
+    def get_order_item(order_id: int, item_id: int):
+        pass
+
+    @router.get("/customers")
+    def list_customers():
+        pass
+
+    return router.routes
+
+
+def test_bypass_route_table_matches_exact_paths_by_method():
+    table = BypassRouteTable(build_routes())
+
+    assert table.is_bypassed("POST", "/api/v1/customers")
+    assert not table.is_bypassed("GET", "/api/v1/customers")
+
+
+def test_bypass_route_table_matches_templated_paths():
+    table = BypassRouteTable(build_routes())
+
+    assert table.is_bypassed("GET", "/api/v1/customers/10/id")
+    assert table.is_bypassed("GET", "/api/v1/orders/1/items/2")
+    assert not table.is_bypassed("DELETE", "/api/v1/customers/10/id")
+    assert not table.is_bypassed("GET", "/api/v1/customers/10/id/extra")
+    assert not table.is_bypassed("GET", "/api/v1/customers/10/person_id")
+
+
+def test_bypassed_route_is_reachable_without_token(client):
+    payload = {
+        "person": {
+            "name": "John Doe",
+            "cpf": "52998224725",
+            "email": "john.bypass@example.com",
+            "birth_date": "1990-01-01",
+        }
+    }
+
+    response = client._original_post("/api/v1/customers", json=payload)
+
+    assert response.status_code == status.HTTP_201_CREATED
+
+
+def test_protected_route_requires_token(client):
+    response = client._original_get("/api/v1/customers")
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,36 @@
+from fastapi import status
+
+from src.constants.permissions import PersonPermissions
+from src.core.exceptions.utils import ErrorCode
+
+
+def test_missing_authorization_header_returns_unauthorized(client):
+    response = client._original_get("/api/v1/person")
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    assert response.json() == {
+        "error": {
+            "code": ErrorCode.UNAUTHORIZED.value,
+            "message": ErrorCode.UNAUTHORIZED.description,
+            "details": "Missing Authorization header",
+        }
+    }
+
+
+def test_invalid_token_returns_forbidden(client):
+    response = client._original_get("/api/v1/person", headers={"Authorization": "Bearer invalid"})
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+    assert response.json()["error"]["details"] == "Invalid token."
+
+
+def test_open_routes_do_not_require_token(client):
+    response = client._original_get("/api/v1/health")
+
+    assert response.status_code == status.HTTP_200_OK
+
+
+def test_valid_token_reaches_the_route(client):
+    response = client.get("/api/v1/person", permissions=[PersonPermissions.CAN_VIEW_PERSONS])
+
+    assert response.status_code == status.HTTP_200_OK
@@ -0,0 +1,172 @@
+from datetime import datetime
+import threading
+
+import pytest
+from fastapi import status
+
+from src.adapters.driven.repositories.employee_repository import EmployeeRepository
+from src.adapters.driven.repositories.models.user_model import UserModel
+from src.adapters.driver.api.v1.routes import auth_routes
+from src.constants.permissions import RolePermissions
+from src.core.domain.entities.user import BcryptPasswordHasher, User
+from tests.factories.employee_factory import EmployeeFactory
+from tests.factories.profile_factory import ProfileFactory
+from tests.factories.profile_permission_factory import ProfilePermissionFactory
+from tests.factories.user_factory import UserFactory
+
+
+def create_employee(password: str):
+    ProfilePermissionFactory(profile=ProfileFactory(name="employee"))
+    user = UserFactory(password_hash=User.hash_password(password))
+    return EmployeeFactory(user=user)
+
+
+def test_employee_login_returns_token(client):
+    employee = create_employee("secret123")
+
+    response = client._original_post(
+        "/api/v1/auth/token", data={"username": employee.user.name, "password": "secret123"}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["token_type"] == "bearer"
+
+
+def test_employee_login_with_wrong_password_is_rejected(client):
+    employee = create_employee("secret123")
+
+    response = client._original_post(
+        "/api/v1/auth/token", data={"username": employee.user.name, "password": "wrong"}
+    )
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_other_routes_stay_responsive_while_password_hashing_is_busy(client, mocker):
+    employee = create_employee("secret123")
+    username = employee.user.name
+    hashing_started = threading.Event()
+    release_hashing = threading.Event()
+    hashing_threads = []
+    check_password = User.check_password
+
+    def blocking_check_password(password, password_hash):
+        hashing_threads.append(threading.current_thread().name)
+        hashing_started.set()
+        release_hashing.wait(timeout=10)
+        return check_password(password, password_hash)
+
+    mocker.patch.object(User, "check_password", side_effect=blocking_check_password)
+
+    login_responses = []
+    login = threading.Thread(
+        target=lambda: login_responses.append(
+            client._original_post("/api/v1/auth/token", data={"username": username, "password": "secret123"})
+        )
+    )
+    login.start()
+    try:
+        assert hashing_started.wait(timeout=10)
+
+        response = client.get("/api/v1/roles", permissions=[RolePermissions.CAN_VIEW_ROLES])
+        assert response.status_code == status.HTTP_200_OK
+        assert login_responses == []
+    finally:
+        release_hashing.set()
+        login.join(timeout=10)
+
+    assert login_responses[0].status_code == status.HTTP_200_OK
+    assert hashing_threads[0].startswith("password-hashing")
+
+
+def test_employee_login_rehashes_outdated_password_hash(client, db_session, mocker):
+    mocker.patch.object(User, "password_hasher", BcryptPasswordHasher(rounds=4))
+    ProfilePermissionFactory(profile=ProfileFactory(name="employee"))
+    user = UserFactory(password_hash=BcryptPasswordHasher(rounds=5).hash("secret123"))
+    employee = EmployeeFactory(user=user)
+
+    response = client._original_post(
+        "/api/v1/auth/token", data={"username": employee.user.name, "password": "secret123"}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    db_session.expire_all()
+    password_hash = db_session.get(UserModel, user.id).password_hash
+    assert password_hash.startswith("$2b$04$")
+    assert User.check_password("secret123", password_hash)
+
+
+def test_deleted_employee_login_does_not_rehash_password(client, db_session, mocker):
+    mocker.patch.object(User, "password_hasher", BcryptPasswordHasher(rounds=4))
+    ProfilePermissionFactory(profile=ProfileFactory(name="employee"))
+    outdated_hash = BcryptPasswordHasher(rounds=5).hash("secret123")
+    user = UserFactory(password_hash=outdated_hash)
+    employee = EmployeeFactory(user=user, inactivated_at=datetime.now())
+
+    response = client._original_post(
+        "/api/v1/auth/token", data={"username": employee.user.name, "password": "secret123"}
+    )
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    db_session.expire_all()
+    assert db_session.get(UserModel, user.id).password_hash == outdated_hash
+
+
+@pytest.fixture
+def async_database(client, async_session_factory, mocker):
+    mocker.patch.object(auth_routes, "ASYNC_DATABASE_ENABLED", True)
+    # Falha se o login cair no caminho síncrono, que consulta pelo threadpool
+    mocker.patch.object(EmployeeRepository, "get_by_username", side_effect=AssertionError("sync repository used"))
+    return async_session_factory
+
+
+def test_employee_login_with_async_database_returns_token(client, async_database):
+    employee = create_employee("secret123")
+
+    response = client._original_post(
+        "/api/v1/auth/token", data={"username": employee.user.name, "password": "secret123"}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["token_type"] == "bearer"
+
+
+def test_employee_login_with_async_database_rejects_wrong_password(client, async_database):
+    employee = create_employee("secret123")
+
+    response = client._original_post(
+        "/api/v1/auth/token", data={"username": employee.user.name, "password": "wrong"}
+    )
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_employee_login_with_async_database_rehashes_outdated_password_hash(client, db_session, async_database, mocker):
+    mocker.patch.object(User, "password_hasher", BcryptPasswordHasher(rounds=4))
+    ProfilePermissionFactory(profile=ProfileFactory(name="employee"))
+    user = UserFactory(password_hash=BcryptPasswordHasher(rounds=5).hash("secret123"))
+    employee = EmployeeFactory(user=user)
+
+    response = client._original_post(
+        "/api/v1/auth/token", data={"username": employee.user.name, "password": "secret123"}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    db_session.expire_all()
+    assert db_session.get(UserModel, user.id).password_hash.startswith("$2b$04$")
+
+
+def test_deleted_employee_login_with_async_database_does_not_rehash_password(client, db_session, async_database, mocker):
+    mocker.patch.object(User, "password_hasher", BcryptPasswordHasher(rounds=4))
+    ProfilePermissionFactory(profile=ProfileFactory(name="employee"))
+    outdated_hash = BcryptPasswordHasher(rounds=5).hash("secret123")
+    user = UserFactory(password_hash=outdated_hash)
+    employee = EmployeeFactory(user=user, inactivated_at=datetime.now())
+
+    response = client._original_post(
+        "/api/v1/auth/token", data={"username": employee.user.name, "password": "secret123"}
+    )
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    db_session.expire_all()
+    assert db_session.get(UserModel, user.id).password_hash == outdated_hash
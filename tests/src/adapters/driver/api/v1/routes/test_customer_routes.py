@@ -1,11 +1,14 @@
+import factory
 from tests.factories.employee_factory import EmployeeFactory
 from tests.factories.person_factory import PersonFactory
 from tests.factories.customer_factory import CustomerFactory
 from src.core.exceptions.utils import ErrorCode
 from src.constants.permissions import CustomerPermissions
+from src.core.shared.identity_map import IdentityMap
 from pycpfcnpj import gen
 
 from fastapi import status
+import json
 from datetime import datetime
 import pytest
 
@@ -290,4 +293,87 @@ def test_delete_customer_success(client):
                 'email': customer2.person.email,
                 'birth_date': customer2.person.birth_date.strftime('%Y-%m-%d')
             }
-    }]
\ No newline at end of file
+    }]
+
+
+def test_get_all_customers_statement_count_is_constant(client, db_session, query_counter):
+    def count_listing_statements():
+        db_session.expunge_all()
+        IdentityMap.get_instance().clear()
+        query_counter.clear()
+        response = client.get('/api/v1/customers', permissions=[CustomerPermissions.CAN_VIEW_CUSTOMERS])
+        assert response.status_code == status.HTTP_200_OK
+        return len(response.json()), len(query_counter)
+
+    CustomerFactory.create_batch(2)
+    few_customers, few_statements = count_listing_statements()
+
+    CustomerFactory.create_batch(10)
+    many_customers, many_statements = count_listing_statements()
+
+    assert (few_customers, many_customers) == (2, 12)
+    assert many_statements == few_statements == 1
+
+
+def test_export_customers_streams_ndjson(client):
+    customers = CustomerFactory.create_batch(3)
+
+    response = client.get('/api/v1/customers/export', permissions=[CustomerPermissions.CAN_VIEW_CUSTOMERS])
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers['content-type'] == 'application/x-ndjson'
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [(row['id'], row['person']['cpf']) for row in rows] == [
+        (customer.id, customer.person.cpf) for customer in customers
+    ]
+
+
+def test_export_customers_as_customer_returns_only_own_record(client):
+    customer, _ = CustomerFactory.create_batch(2)
+
+    response = client.get(
+        '/api/v1/customers/export',
+        permissions=[CustomerPermissions.CAN_VIEW_CUSTOMERS],
+        profile_name='customer',
+        person={'id': str(customer.id)}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row['id'] for row in rows] == [customer.id]
+
+
+def test_get_all_customers_without_limit_returns_the_default_page(client):
+    # Mais que uma página de DEFAULT_PAGE_SIZE (100): sem `limit` a listagem continua paginada
+    customers = CustomerFactory.create_batch(101, person__email=factory.Sequence(lambda n: f'customer{n}@example.com'))
+    ids = [item.id for item in customers]
+
+    response = client.get('/api/v1/customers', permissions=[CustomerPermissions.CAN_VIEW_CUSTOMERS])
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [item['id'] for item in response.json()] == ids[:100]
+    assert response.headers['X-Next-Cursor'] == str(ids[99])
+
+    response = client.get(
+        f"/api/v1/customers?after_id={response.headers['X-Next-Cursor']}",
+        permissions=[CustomerPermissions.CAN_VIEW_CUSTOMERS]
+    )
+    assert [item['id'] for item in response.json()] == ids[100:]
+    assert 'X-Next-Cursor' not in response.headers
+
+
+def test_get_all_customers_paginates_with_next_cursor(client):
+    customers = CustomerFactory.create_batch(3)
+    ids = [item.id for item in customers]
+
+    response = client.get('/api/v1/customers?limit=2', permissions=[CustomerPermissions.CAN_VIEW_CUSTOMERS])
+    assert response.status_code == status.HTTP_200_OK
+    assert [item['id'] for item in response.json()] == ids[:2]
+    assert response.headers['X-Next-Cursor'] == str(ids[1])
+
+    response = client.get(
+        f"/api/v1/customers?limit=2&after_id={response.headers['X-Next-Cursor']}",
+        permissions=[CustomerPermissions.CAN_VIEW_CUSTOMERS]
+    )
+    assert [item['id'] for item in response.json()] == ids[2:]
+    assert 'X-Next-Cursor' not in response.headers
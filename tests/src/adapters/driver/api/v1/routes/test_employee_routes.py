@@ -1,3 +1,4 @@
+import factory
 from tests.factories.person_factory import PersonFactory
 from tests.factories.role_factory import RoleFactory
 from tests.factories.user_factory import UserFactory
@@ -417,4 +418,42 @@ def test_delete_employee_success(client):
                 'id': employee2.user.id,
                 'name': employee2.user.name
             }
-    }]
\ No newline at end of file
+    }]
+
+
+def test_get_all_employees_without_limit_returns_the_default_page(client):
+    # Mais que uma página de DEFAULT_PAGE_SIZE (100): sem `limit` a listagem continua paginada
+    employees = EmployeeFactory.create_batch(
+        101, user__password_hash='hash', person__email=factory.Sequence(lambda n: f'employee{n}@example.com')
+    )
+    ids = [item.id for item in employees]
+
+    response = client.get('/api/v1/employees', permissions=[EmployeePermissions.CAN_VIEW_EMPLOYEES])
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [item['id'] for item in response.json()] == ids[:100]
+    assert response.headers['X-Next-Cursor'] == str(ids[99])
+
+    response = client.get(
+        f"/api/v1/employees?after_id={response.headers['X-Next-Cursor']}",
+        permissions=[EmployeePermissions.CAN_VIEW_EMPLOYEES]
+    )
+    assert [item['id'] for item in response.json()] == ids[100:]
+    assert 'X-Next-Cursor' not in response.headers
+
+
+def test_get_all_employees_paginates_with_next_cursor(client):
+    employees = EmployeeFactory.create_batch(3, user__password_hash='hash')
+    ids = [item.id for item in employees]
+
+    response = client.get('/api/v1/employees?limit=2', permissions=[EmployeePermissions.CAN_VIEW_EMPLOYEES])
+    assert response.status_code == status.HTTP_200_OK
+    assert [item['id'] for item in response.json()] == ids[:2]
+    assert response.headers['X-Next-Cursor'] == str(ids[1])
+
+    response = client.get(
+        f"/api/v1/employees?limit=2&after_id={response.headers['X-Next-Cursor']}",
+        permissions=[EmployeePermissions.CAN_VIEW_EMPLOYEES]
+    )
+    assert [item['id'] for item in response.json()] == ids[2:]
+    assert 'X-Next-Cursor' not in response.headers
@@ -0,0 +1,53 @@
+from fastapi import status
+
+from src.constants.permissions import HealthCheckPermissions, PersonPermissions
+from src.core.shared.customer_auth_cache import CustomerAuthCache
+
+
+def test_health_check_is_public(client):
+    response = client._original_get("/api/v1/health")
+
+    assert response.status_code == status.HTTP_200_OK
+
+
+def test_database_pool_status(client):
+    response = client.get("/api/v1/health/database", permissions=[HealthCheckPermissions.CAN_VIEW_DIAGNOSTICS])
+
+    assert response.status_code == status.HTTP_200_OK
+    assert "pool_class" in response.json()
+
+
+def test_database_pool_status_requires_a_token(client):
+    response = client._original_get("/api/v1/health/database")
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_database_pool_status_requires_the_diagnostics_permission(client):
+    response = client.get("/api/v1/health/database", permissions=[PersonPermissions.CAN_VIEW_PERSONS])
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_customer_auth_cache_status_exposes_counters(client):
+    cache = CustomerAuthCache.get_instance()
+    before = cache.stats()
+    cache.set("00000000000", None, cache.version)
+    cache.get("00000000000")
+    cache.get("11111111111")
+
+    response = client.get("/api/v1/health/customer-auth-cache", permissions=[HealthCheckPermissions.CAN_VIEW_DIAGNOSTICS])
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["negative_size"] == before["negative_size"] + 1
+    assert data["misses"] == before["misses"] + 1
+    assert data["negative_hits"] == before["negative_hits"] + 1
+
+
+def test_customer_auth_cache_status_requires_the_diagnostics_permission(client):
+    assert client._original_get("/api/v1/health/customer-auth-cache").status_code == status.HTTP_401_UNAUTHORIZED
+
+    response = client.get("/api/v1/health/customer-auth-cache", permissions=[PersonPermissions.CAN_VIEW_PERSONS])
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -1,9 +1,12 @@
+import factory
 from fastapi import status
+import json
 import pytest
 from datetime import datetime
 
 from src.core.exceptions.utils import ErrorCode
 from src.constants.permissions import PersonPermissions
+from src.core.shared.identity_map import IdentityMap
 from tests.factories.person_factory import PersonFactory
 from pycpfcnpj import gen
 
@@ -161,4 +164,63 @@ def test_delete_person_and_return_success(client):
     data = response.json()
 
     assert len(data) == 0
-    assert data == []
\ No newline at end of file
+    assert data == []
+
+
+def test_export_persons_streams_ndjson_without_filling_identity_map(client, mocker):
+    persons = PersonFactory.create_batch(3)
+    PersonFactory(inactivated_at=datetime.now())
+    identity_map_add = mocker.spy(IdentityMap, "add")
+
+    response = client.get("/api/v1/person/export", permissions=[PersonPermissions.CAN_VIEW_PERSONS])
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert rows == [
+        {
+            "id": person.id,
+            "cpf": person.cpf,
+            "name": person.name,
+            "email": person.email,
+            "birth_date": person.birth_date.strftime("%Y-%m-%d"),
+        }
+        for person in persons
+    ]
+    assert identity_map_add.call_count == 0
+
+
+def test_get_all_persons_without_limit_returns_the_default_page(client):
+    # Mais que uma página de DEFAULT_PAGE_SIZE (100): sem `limit` a listagem continua paginada
+    persons = PersonFactory.create_batch(101, email=factory.Sequence(lambda n: f'person{n}@example.com'))
+    ids = [item.id for item in persons]
+
+    response = client.get('/api/v1/person', permissions=[PersonPermissions.CAN_VIEW_PERSONS])
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [item['id'] for item in response.json()] == ids[:100]
+    assert response.headers['X-Next-Cursor'] == str(ids[99])
+
+    response = client.get(
+        f"/api/v1/person?after_id={response.headers['X-Next-Cursor']}",
+        permissions=[PersonPermissions.CAN_VIEW_PERSONS]
+    )
+    assert [item['id'] for item in response.json()] == ids[100:]
+    assert 'X-Next-Cursor' not in response.headers
+
+
+def test_get_all_persons_paginates_with_next_cursor(client):
+    persons = PersonFactory.create_batch(3)
+    ids = [item.id for item in persons]
+
+    response = client.get('/api/v1/person?limit=2', permissions=[PersonPermissions.CAN_VIEW_PERSONS])
+    assert response.status_code == status.HTTP_200_OK
+    assert [item['id'] for item in response.json()] == ids[:2]
+    assert response.headers['X-Next-Cursor'] == str(ids[1])
+
+    response = client.get(
+        f"/api/v1/person?limit=2&after_id={response.headers['X-Next-Cursor']}",
+        permissions=[PersonPermissions.CAN_VIEW_PERSONS]
+    )
+    assert [item['id'] for item in response.json()] == ids[2:]
+    assert 'X-Next-Cursor' not in response.headers
@@ -102,6 +102,36 @@ def test_get_all_roles_and_return_success(client):
     ]
 
 
+def test_get_all_roles_paginates_with_next_cursor(client):
+    roles = RoleFactory.create_batch(5)
+    role_ids = [role.id for role in roles]
+
+    response = client.get('/api/v1/roles?limit=2', permissions=[RolePermissions.CAN_VIEW_ROLES])
+    assert response.status_code == status.HTTP_200_OK
+    assert [role['id'] for role in response.json()] == role_ids[:2]
+    assert response.headers['X-Next-Cursor'] == str(role_ids[1])
+
+    response = client.get(
+        f"/api/v1/roles?limit=2&after_id={response.headers['X-Next-Cursor']}",
+        permissions=[RolePermissions.CAN_VIEW_ROLES]
+    )
+    assert [role['id'] for role in response.json()] == role_ids[2:4]
+
+    response = client.get(
+        f"/api/v1/roles?limit=2&after_id={response.headers['X-Next-Cursor']}",
+        permissions=[RolePermissions.CAN_VIEW_ROLES]
+    )
+    assert [role['id'] for role in response.json()] == role_ids[4:]
+    assert 'X-Next-Cursor' not in response.headers
+
+
+@pytest.mark.parametrize('limit', [0, 1001])
+def test_get_all_roles_rejects_out_of_range_limit(client, limit):
+    response = client.get(f'/api/v1/roles?limit={limit}', permissions=[RolePermissions.CAN_VIEW_ROLES])
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
 def test_update_role_and_return_success(client):
     role = RoleFactory()
 
@@ -123,3 +153,22 @@ def test_delete_role_and_return_success(client):
     response = client.get('/api/v1/roles', permissions=[RolePermissions.CAN_VIEW_ROLES])
     data = response.json()
     assert data == [{'id': role1.id, 'name': role1.name, 'description': role1.description}]
+
+
+def test_get_all_roles_without_limit_returns_the_default_page(client):
+    # Mais que uma página de DEFAULT_PAGE_SIZE (100): sem `limit` a listagem continua paginada
+    roles = RoleFactory.create_batch(101)
+    ids = [item.id for item in roles]
+
+    response = client.get('/api/v1/roles', permissions=[RolePermissions.CAN_VIEW_ROLES])
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [item['id'] for item in response.json()] == ids[:100]
+    assert response.headers['X-Next-Cursor'] == str(ids[99])
+
+    response = client.get(
+        f"/api/v1/roles?after_id={response.headers['X-Next-Cursor']}",
+        permissions=[RolePermissions.CAN_VIEW_ROLES]
+    )
+    assert [item['id'] for item in response.json()] == ids[100:]
+    assert 'X-Next-Cursor' not in response.headers
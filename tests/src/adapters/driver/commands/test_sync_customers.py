@@ -0,0 +1,69 @@
+import io
+from datetime import datetime
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from src.adapters.driver.commands import sync_customers
+from src.core.domain.entities.person import Person
+from src.core.exceptions.service_unavailable_exception import ServiceUnavailableException
+from src.core.ports.auth.i_auth_provider_gateway import IAuthProviderGateway
+from tests.factories.customer_factory import CustomerFactory
+
+
+class RecordingAuthProviderGateway(IAuthProviderGateway):
+    def __init__(self, result: bool = True):
+        self.result = result
+        self.synced = []
+
+    def authenticate(self, cpf: str) -> bool:
+        return True
+
+    def sync_user(self, person: Person) -> bool:
+        self.synced.append(person.id)
+        return self.result
+
+
+class TestSyncCustomersCommand:
+    @pytest.fixture(autouse=True)
+    def setup(self, db_session, test_engine):
+        self.session_factory = sessionmaker(bind=test_engine)
+        self.active = [CustomerFactory() for _ in range(3)]
+        CustomerFactory(inactivated_at=datetime.now())
+
+    def test_run_syncs_active_customers_and_reports_progress(self):
+        gateway = RecordingAuthProviderGateway()
+        out = io.StringIO()
+
+        stats = sync_customers.run(self.session_factory, gateway, batch_size=2, concurrency=2, out=out)
+
+        assert gateway.synced == [customer.person_id for customer in self.active]
+        assert stats["synced"] == 3
+        lines = out.getvalue().splitlines()
+        assert lines[0].startswith("2 clientes processados (2 sincronizados, 0 com falha)")
+        assert lines[-1].startswith("Concluído: 3 clientes processados")
+        assert "clientes/s" in lines[-1]
+
+    def test_run_stops_when_provider_stays_unavailable(self):
+        gateway = RecordingAuthProviderGateway(result=False)
+
+        with pytest.raises(ServiceUnavailableException):
+            sync_customers.run(
+                self.session_factory, gateway, batch_size=2, concurrency=1, out=io.StringIO(), max_pauses=0
+            )
+
+        assert gateway.synced == [customer.person_id for customer in self.active[:2]]
+
+    def test_format_progress_reports_throughput(self):
+        line = sync_customers.format_progress({"processed": 50, "synced": 48, "failed": 2, "elapsed": 2.0})
+
+        assert line == "50 clientes processados (48 sincronizados, 2 com falha) em 2.0s - 25.0 clientes/s"
+
+    def test_main_rejects_invalid_arguments(self):
+        with pytest.raises(SystemExit):
+            sync_customers.main(["--concurrency", "0"])
+
+    def test_format_progress_reports_pauses(self):
+        line = sync_customers.format_progress({"processed": 4, "synced": 4, "failed": 0, "pauses": 2, "elapsed": 2.0})
+
+        assert line == "4 clientes processados (4 sincronizados, 0 com falha, 2 pausas) em 2.0s - 2.0 clientes/s"
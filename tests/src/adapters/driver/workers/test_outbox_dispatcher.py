@@ -0,0 +1,117 @@
+import time
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from config.database_routing import RoutingSession, RoutingState
+from src.adapters.driven.repositories.models.base_model import BaseModel
+
+from src.adapters.driven.repositories.models.outbox_event_model import OutboxEventModel
+from src.adapters.driver.workers.outbox_dispatcher import OutboxDispatcher
+from src.core.domain.entities.outbox_event import OutboxEvent, utc_now
+from src.core.domain.entities.person import Person
+from src.core.ports.auth.i_auth_provider_gateway import IAuthProviderGateway
+from tests.factories.person_factory import PersonFactory
+
+
+class RecordingAuthProviderGateway(IAuthProviderGateway):
+    def __init__(self):
+        self.synced = []
+
+    def authenticate(self, cpf: str) -> bool:
+        return True
+
+    def sync_user(self, person: Person) -> bool:
+        self.synced.append(person.id)
+        return True
+
+
+class TestOutboxDispatcher:
+    @pytest.fixture(autouse=True)
+    def setup(self, db_session, test_engine):
+        self.db_session = db_session
+        self.gateway = RecordingAuthProviderGateway()
+        self.dispatcher = OutboxDispatcher(
+            session_factory=sessionmaker(bind=test_engine),
+            auth_provider_gateway=self.gateway,
+            batch_size=2,
+            poll_interval=0.05,
+            max_attempts=3,
+            retry_backoff=1,
+            retry_max_backoff=10,
+        )
+        yield
+        self.dispatcher.stop(timeout=5)
+
+    def enqueue_for_new_people(self, count: int):
+        people = [PersonFactory() for _ in range(count)]
+        for person in people:
+            self.db_session.add(OutboxEventModel.from_entity(OutboxEvent(
+                event_type=OutboxEvent.USER_SYNC,
+                payload={"person_id": person.id},
+                available_at=utc_now() - timedelta(seconds=1),
+            )))
+        self.db_session.commit()
+        return [person.id for person in people]
+
+    def pending_count(self) -> int:
+        self.db_session.expire_all()
+        return self.db_session.query(OutboxEventModel).filter(OutboxEventModel.processed_at.is_(None)).count()
+
+    def test_run_once_processes_a_single_batch(self):
+        self.enqueue_for_new_people(3)
+
+        result = self.dispatcher.run_once()
+
+        assert result["processed"] == 2
+        assert self.pending_count() == 1
+
+    def test_drain_processes_batches_until_no_event_is_due(self):
+        person_ids = self.enqueue_for_new_people(5)
+
+        self.dispatcher.drain()
+
+        assert self.gateway.synced == person_ids
+        assert self.pending_count() == 0
+
+    def test_background_thread_delivers_events(self):
+        person_ids = self.enqueue_for_new_people(3)
+
+        self.dispatcher.start()
+        deadline = time.monotonic() + 5
+        while self.pending_count() and time.monotonic() < deadline:
+            time.sleep(0.05)
+        self.dispatcher.stop(timeout=5)
+
+        assert self.gateway.synced == person_ids
+        assert self.pending_count() == 0
+
+    def test_reads_people_from_the_primary_with_lagging_replicas(self, test_engine, tmp_path):
+        # Réplica vazia: a pessoa recém-criada ainda não chegou nela
+        replica = create_engine(f"sqlite:///{tmp_path / 'replica.sqlite'}")
+        BaseModel.metadata.create_all(replica)
+        self.dispatcher.session_factory = sessionmaker(bind=test_engine, class_=RoutingSession, replica_binds=[replica])
+        person_ids = self.enqueue_for_new_people(1)
+
+        with RoutingState.scope() as state:
+            result = self.dispatcher.run_once()
+
+        assert result["processed"] == 1
+        assert self.gateway.synced == person_ids
+        # As escritas da rodada não marcam o estado de roteamento de quem a chamou
+        assert state.wrote is False
+        replica.dispose()
+
+    def test_rejects_empty_batches(self):
+        with pytest.raises(ValueError):
+            OutboxDispatcher(
+                session_factory=sessionmaker(),
+                auth_provider_gateway=self.gateway,
+                batch_size=0,
+                poll_interval=1,
+                max_attempts=3,
+                retry_backoff=1,
+                retry_max_backoff=10,
+            )
@@ -4,8 +4,7 @@ from src.core.domain.entities.person import Person
 from src.adapters.driver.api.v1.controllers.auth_controller import AuthController
 from src.core.domain.entities.customer import Customer
 from src.core.domain.entities.employee import Employee
-from src.core.domain.entities.permission import Permission
-from src.core.domain.entities.profile import Profile
+from src.core.domain.entities.user import User
 from src.core.domain.dtos.auth.auth_dto import AuthByCpfDTO, LoginDTO
 from src.core.exceptions.entity_not_found_exception import EntityNotFoundException
 from src.core.exceptions.invalid_credentials_exception import InvalidCredentialsException
@@ -26,6 +25,10 @@ def mock_employee_repository(mocker):
 @pytest.fixture
 def mock_auth_provider_gateway(mocker):
     return mocker.Mock()
+
+@pytest.fixture
+def mock_user_repository(mocker):
+    return mocker.Mock()
     
 @pytest.fixture
 def auth_controller(
@@ -33,14 +36,16 @@ def auth_controller(
     mock_profile_repository,
     mock_employee_repository,
     mock_auth_provider_gateway,
+    mock_user_repository,
     db_session
 ):
     employee_gateway = mock_employee_repository
     customer_gateway = mock_customer_repository
     profile_gateway = mock_profile_repository
     auth_provider_gateway = mock_auth_provider_gateway
+    user_gateway = mock_user_repository
     
-    controller = AuthController(profile_gateway, employee_gateway, customer_gateway, auth_provider_gateway)
+    controller = AuthController(profile_gateway, employee_gateway, customer_gateway, auth_provider_gateway, user_gateway)
     return controller
 
 def test_login_customer_by_cpf(auth_controller, mock_customer_repository, mock_profile_repository):
@@ -48,10 +53,8 @@ def test_login_customer_by_cpf(auth_controller, mock_customer_repository, mock_p
         id=1,
         person=type('Person', (), {"name": "John Doe", "cpf": "12345678900", "email": "john@example.com"})
     )
-    profile = Profile(name="Customer", permissions=[Permission(name="can_create_order")])
-
     mock_customer_repository.get_by_cpf.return_value = customer
-    mock_profile_repository.get_by_name.return_value = profile
+    mock_profile_repository.get_permission_names.return_value = ("can_create_order",)
 
     auth_dto = AuthByCpfDTO(cpf="12345678900")
 
@@ -68,10 +71,9 @@ def test_login_customer_by_cpf_not_found(auth_controller, mock_customer_reposito
         auth_controller.login_customer_by_cpf(auth_dto)
 
 def test_login_anonymous(auth_controller, mock_profile_repository, mock_customer_repository):
-    profile = Profile(name="Customer", permissions=[Permission(name="view_orders")])
     person = Person(name="Anonymous User", cpf="00000000000", email="anonymous@example.com", birth_date=datetime(2000, 1, 1))
     customer = Customer(id=1, person=person)
-    mock_profile_repository.get_by_name.return_value = profile
+    mock_profile_repository.get_permission_names.return_value = ("view_orders",)
     mock_customer_repository.create.return_value = customer
 
     token_dto = auth_controller.login_customer_anonymous()
@@ -84,13 +86,11 @@ def test_login_employee(auth_controller, mock_employee_repository, mock_profile_
     employee = Employee(
         id=1,
         person=type('Person', (), {"name": "Jane Doe", "cpf": "12345678900", "email": "jane@example.com"}),
-        user=type('User', (), {"verify_password": lambda password: password == "password123"}),
+        user=User(name="janedoe", password_hash=User.hash_password("password123")),
         role=role
     )
-    profile = Profile(name="Employee", permissions=[Permission(name="manage_orders")])
-
     mock_employee_repository.get_by_username.return_value = employee
-    mock_profile_repository.get_by_name.return_value = profile
+    mock_profile_repository.get_permission_names.return_value = ("manage_orders",)
 
     login_dto = LoginDTO(username="janedoe", password="password123")
     token_dto =auth_controller.login_employee(login_dto)
@@ -0,0 +1,164 @@
+import pytest
+from pycpfcnpj import gen
+from sqlalchemy import create_engine, insert, select
+
+from config.database_routing import RoutingSession, RoutingState
+from src.adapters.driven.repositories.models.base_model import BaseModel
+from src.adapters.driven.repositories.models.customer_model import CustomerModel
+from src.adapters.driven.repositories.models.person_model import PersonModel
+
+from src.adapters.driven.repositories.customer_repository import CustomerRepository
+from src.adapters.driven.repositories.person_repository import PersonRepository
+from src.application.usecases.auth_usecase.login_customer_by_cpf_usecase import LoginCustomerByCpfUseCase
+from src.core.domain.dtos.auth.auth_dto import AuthByCpfDTO
+from src.core.domain.entities.customer import Customer
+from src.core.exceptions.entity_not_found_exception import EntityNotFoundException
+from src.core.exceptions.invalid_credentials_exception import InvalidCredentialsException
+from src.core.shared.customer_auth_cache import CustomerAuthCache
+from src.core.shared.identity_map import IdentityMap
+from src.core.utils.jwt_util import JWTUtil
+from tests.factories.customer_factory import CustomerFactory
+from tests.factories.person_factory import PersonFactory
+
+
+class TestLoginCustomerByCpfUseCase:
+    @pytest.fixture(autouse=True)
+    def setup(self, db_session, mocker):
+        self.db_session = db_session
+        self.customer_gateway = CustomerRepository(db_session)
+        self.person_gateway = PersonRepository(db_session)
+        profile_gateway = mocker.Mock()
+        profile_gateway.get_permission_names.return_value = ("can_create_order",)
+        self.auth_cache = CustomerAuthCache.get_instance()
+        self.usecase = LoginCustomerByCpfUseCase.build(self.customer_gateway, profile_gateway, mocker.Mock())
+
+    def login(self, cpf: str) -> dict:
+        token = self.usecase.execute(AuthByCpfDTO(cpf=cpf))["access_token"]
+        return JWTUtil.decode_token(token)["person"]
+
+    def start_counting(self, query_counter):
+        self.db_session.expunge_all()
+        IdentityMap.get_instance().clear()
+        query_counter.clear()
+
+    def test_repeated_logins_are_served_from_the_cache(self, query_counter):
+        customer = CustomerFactory()
+        customer_id, cpf = customer.id, customer.person.cpf
+        self.start_counting(query_counter)
+        hits = self.auth_cache.stats()["hits"]
+
+        first = self.login(cpf)
+        second = self.login(cpf)
+
+        assert first == second
+        assert first["id"] == str(customer_id)
+        assert len(query_counter) == 1
+        assert self.auth_cache.stats()["hits"] == hits + 1
+
+    def test_unknown_cpfs_are_cached(self, query_counter):
+        cpf = gen.cpf()
+        self.start_counting(query_counter)
+        negative_hits = self.auth_cache.stats()["negative_hits"]
+
+        for _ in range(3):
+            with pytest.raises(EntityNotFoundException):
+                self.login(cpf)
+
+        # Uma única consulta no banco principal; as tentativas seguintes vêm do cache
+        assert len(query_counter) == 1
+        assert self.auth_cache.stats()["negative_hits"] == negative_hits + 2
+
+    def test_creating_the_customer_invalidates_the_unknown_cpf(self):
+        person = PersonFactory.build()
+        with pytest.raises(EntityNotFoundException):
+            self.login(person.cpf)
+
+        self.customer_gateway.create(Customer(person=person.to_entity()))
+
+        assert self.login(person.cpf)["cpf"] == person.cpf
+
+    def test_person_update_invalidates_old_and_new_cpf(self):
+        customer = CustomerFactory()
+        old_cpf = customer.person.cpf
+        self.login(old_cpf)
+        new_cpf = gen.cpf()
+        with pytest.raises(EntityNotFoundException):
+            self.login(new_cpf)
+
+        person = self.person_gateway.get_by_id(customer.person_id)
+        person.cpf = new_cpf
+        person.name = "Renamed Customer"
+        self.person_gateway.update(person)
+
+        assert self.login(new_cpf)["name"] == "Renamed Customer"
+        with pytest.raises(EntityNotFoundException):
+            self.login(old_cpf)
+
+    def test_soft_deleted_customer_is_rejected_after_invalidation(self):
+        customer = CustomerFactory()
+        self.login(customer.person.cpf)
+
+        entity = self.customer_gateway.get_by_id(customer.id)
+        entity.soft_delete()
+        self.customer_gateway.update(entity)
+
+        with pytest.raises(InvalidCredentialsException):
+            self.login(customer.person.cpf)
+        with pytest.raises(InvalidCredentialsException):
+            self.login(customer.person.cpf)
+
+    def test_deleting_the_customer_invalidates_the_cpf(self):
+        customer = CustomerFactory()
+        self.login(customer.person.cpf)
+
+        self.customer_gateway.delete(self.customer_gateway.get_by_id(customer.id))
+
+        with pytest.raises(EntityNotFoundException):
+            self.login(customer.person.cpf)
+
+    def test_signup_missing_from_a_lagging_replica_is_not_cached_as_unknown(self, test_engine, tmp_path, mocker):
+        # Réplica vazia: o cadastro recém-feito ainda não chegou nela
+        replica = create_engine(f"sqlite:///{tmp_path / 'replica.sqlite'}")
+        BaseModel.metadata.create_all(replica)
+        session = RoutingSession(bind=test_engine, replica_binds=[replica])
+        profile_gateway = mocker.Mock()
+        profile_gateway.get_permission_names.return_value = ("can_create_order",)
+        self.usecase = LoginCustomerByCpfUseCase.build(CustomerRepository(session), profile_gateway, mocker.Mock())
+        customer = CustomerFactory()
+
+        try:
+            with RoutingState.scope():
+                assert self.login(customer.person.cpf)["id"] == str(customer.id)
+                assert self.auth_cache.get(customer.person.cpf) is not CustomerAuthCache.UNKNOWN
+        finally:
+            session.close()
+            replica.dispose()
+
+    def test_customer_deleted_on_the_primary_is_rejected_with_a_lagging_replica(self, test_engine, tmp_path, mocker):
+        customer = CustomerFactory()
+        # Réplica atrasada: ainda tem o cliente ativo
+        replica = create_engine(f"sqlite:///{tmp_path / 'replica.sqlite'}")
+        BaseModel.metadata.create_all(replica)
+        with test_engine.connect() as primary, replica.begin() as replica_connection:
+            for table in (PersonModel.__table__, CustomerModel.__table__):
+                rows = [dict(row) for row in primary.execute(select(table)).mappings()]
+                replica_connection.execute(insert(table), rows)
+
+        entity = self.customer_gateway.get_by_id(customer.id)
+        entity.soft_delete()
+        self.customer_gateway.update(entity)
+
+        session = RoutingSession(bind=test_engine, replica_binds=[replica])
+        profile_gateway = mocker.Mock()
+        profile_gateway.get_permission_names.return_value = ("can_create_order",)
+        self.usecase = LoginCustomerByCpfUseCase.build(CustomerRepository(session), profile_gateway, mocker.Mock())
+        IdentityMap.get_instance().clear()
+
+        try:
+            with RoutingState.scope():
+                with pytest.raises(InvalidCredentialsException):
+                    self.login(customer.person.cpf)
+                assert self.auth_cache.get(customer.person.cpf).is_deleted
+        finally:
+            session.close()
+            replica.dispose()
@@ -0,0 +1,101 @@
+from datetime import datetime
+import asyncio
+
+import pytest
+
+from src.application.usecases.auth_usecase.login_employee_async_db_usecase import LoginEmployeeAsyncDbUseCase
+from src.application.usecases.auth_usecase.login_employee_usecase import LoginEmployeeUseCase
+from src.core.domain.dtos.auth.auth_dto import LoginDTO
+from src.core.domain.entities.employee import Employee
+from src.core.domain.entities.person import Person
+from src.core.domain.entities.role import Role
+from src.core.domain.entities.user import BcryptPasswordHasher, User
+from src.core.exceptions.invalid_credentials_exception import InvalidCredentialsException
+from src.core.shared.password_hashing_executor import PasswordHashingExecutor
+
+
+LOGIN = LoginDTO(username="janedoe", password="secret123")
+
+
+@pytest.fixture
+def executor():
+    executor = PasswordHashingExecutor(max_workers=1)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.fixture(autouse=True)
+def fast_hasher(mocker):
+    mocker.patch.object(User, "password_hasher", BcryptPasswordHasher(rounds=4))
+
+
+def make_employee(password_hash: str, inactivated_at=None) -> Employee:
+    return Employee(
+        id=1,
+        person=Person(id=1, name="Jane Doe", cpf="12345678900", email="jane@example.com"),
+        user=User(id=1, name=LOGIN.username, password_hash=password_hash),
+        role=Role(id=1, name="employee", description="Employee"),
+        inactivated_at=inactivated_at,
+    )
+
+
+def sync_login(gateways, executor, login_dto=LOGIN):
+    return LoginEmployeeUseCase.build(*gateways).execute(login_dto)
+
+
+def threadpool_login(gateways, executor, login_dto=LOGIN):
+    return asyncio.run(LoginEmployeeUseCase.build(*gateways).execute_async(login_dto, executor))
+
+
+def async_db_login(gateways, executor, login_dto=LOGIN):
+    return asyncio.run(LoginEmployeeAsyncDbUseCase.build(*gateways).execute(login_dto, executor))
+
+
+LOGIN_FLOWS = [
+    pytest.param(sync_login, False, id="sync"),
+    pytest.param(threadpool_login, False, id="threadpool"),
+    pytest.param(async_db_login, True, id="async-db"),
+]
+
+
+def make_gateways(mocker, employee: Employee, is_async: bool):
+    mock = mocker.AsyncMock if is_async else mocker.Mock
+    employee_gateway, profile_gateway, user_gateway = mock(), mock(), mock()
+    employee_gateway.get_by_username.return_value = employee
+    profile_gateway.get_permission_names.return_value = ("can_view_orders",)
+    return employee_gateway, profile_gateway, user_gateway
+
+
+@pytest.mark.parametrize("login, is_async", LOGIN_FLOWS)
+def test_login_rehashes_outdated_password_hash(mocker, executor, login, is_async):
+    employee = make_employee(BcryptPasswordHasher(rounds=5).hash(LOGIN.password))
+    gateways = make_gateways(mocker, employee, is_async)
+
+    token = login(gateways, executor)
+
+    assert token["token_type"] == "bearer"
+    gateways[2].update.assert_called_once_with(employee.user)
+    assert employee.user.password_hash.startswith("$2b$04$")
+
+
+@pytest.mark.parametrize("login, is_async", LOGIN_FLOWS)
+def test_deleted_employee_is_rejected_before_rehash(mocker, executor, login, is_async):
+    outdated_hash = BcryptPasswordHasher(rounds=5).hash(LOGIN.password)
+    employee = make_employee(outdated_hash, inactivated_at=datetime.now())
+    gateways = make_gateways(mocker, employee, is_async)
+
+    with pytest.raises(InvalidCredentialsException):
+        login(gateways, executor)
+
+    gateways[2].update.assert_not_called()
+    assert employee.user.password_hash == outdated_hash
+
+
+@pytest.mark.parametrize("login, is_async", LOGIN_FLOWS)
+def test_wrong_password_is_rejected(mocker, executor, login, is_async):
+    gateways = make_gateways(mocker, make_employee(User.hash_password(LOGIN.password)), is_async)
+
+    with pytest.raises(InvalidCredentialsException):
+        login(gateways, executor, LoginDTO(username=LOGIN.username, password="wrong"))
+
+    gateways[1].get_permission_names.assert_not_called()
@@ -1,26 +1,54 @@
 import pytest
 from datetime import datetime
+from sqlalchemy import event, text
 from src.adapters.driven.repositories.customer_repository import CustomerRepository
 from src.adapters.driven.repositories.person_repository import PersonRepository
 from src.application.usecases.customer_usecase.create_customer_usecase import CreateCustomerUsecase
 from src.application.usecases.customer_usecase.get_all_customers_usecase import GetAllCustomersUsecase
-from src.adapters.driven.auth_providers.aws_cognito_gateway import AWSCognitoGateway
+from src.adapters.driven.repositories.outbox_repository import OutboxRepository
 from src.core.exceptions.entity_duplicated_exception import EntityDuplicatedException
 from src.core.domain.dtos.customer.create_customer_dto import CreateCustomerDTO
 from src.core.domain.dtos.customer.update_customer_dto import UpdateCustomerDTO
 from src.core.domain.dtos.person.create_person_dto import CreatePersonDTO
 from src.application.usecases.customer_usecase.delete_customer_usecase import DeleteCustomerUsecase
 from src.application.usecases.customer_usecase.update_customer_usecase import UpdateCustomerUsecase
+from src.application.usecases.customer_usecase.sync_customers_usecase import SyncCustomersUsecase
+from src.core.exceptions.service_unavailable_exception import ServiceUnavailableException
+from src.adapters.driven.repositories.models.outbox_event_model import OutboxEventModel
+from src.core.domain.entities.outbox_event import OutboxEvent
+from src.core.domain.entities.person import Person
+from src.core.ports.auth.i_auth_provider_gateway import IAuthProviderGateway
+from src.core.shared.identity_map import IdentityMap
+from tests.factories.customer_factory import CustomerFactory
 from pycpfcnpj import gen
 
+class RecordingAuthProviderGateway(IAuthProviderGateway):
+    def __init__(self, failing_cpfs=(), unavailable_calls=0):
+        self.failing_cpfs = set(failing_cpfs)
+        # Chamadas a sync_users em que o provedor está fora do ar (todas as sincronizações falham)
+        self.unavailable_calls = unavailable_calls
+        self.batches = []
+
+    def authenticate(self, cpf: str) -> bool:
+        return True
+
+    def sync_user(self, person: Person) -> bool:
+        return person.cpf not in self.failing_cpfs and len(self.batches) > self.unavailable_calls
+
+    def sync_users(self, persons, concurrency=None):
+        self.batches.append(([person.id for person in persons], concurrency))
+        return super().sync_users(persons, concurrency)
+
+
 class TestCustomerUsecases:
 
     @pytest.fixture(autouse=True)
     def setup(self, db_session):
+        self.db_session = db_session
         self.customer_gateway = CustomerRepository(db_session)
         self.person_gateway = PersonRepository(db_session)
-        self.auth_provider_gateway = AWSCognitoGateway()
-        self.create_customer_usecase = CreateCustomerUsecase(self.customer_gateway, self.person_gateway, self.auth_provider_gateway)
+        self.outbox_gateway = OutboxRepository(db_session)
+        self.create_customer_usecase = CreateCustomerUsecase(self.customer_gateway, self.person_gateway, self.outbox_gateway)
         self.update_customer_usecase = UpdateCustomerUsecase(self.customer_gateway, self.person_gateway)
         self.get_all_customers_usecase = GetAllCustomersUsecase(self.customer_gateway)
         self.delete_customer_usecase = DeleteCustomerUsecase(self.customer_gateway)
@@ -43,6 +71,34 @@ class TestCustomerUsecases:
         assert customer.person.email == 'john@example.com'
         assert customer.person.birth_date is not None
 
+    def test_create_customer_writes_user_sync_event_to_outbox(self):
+        dto = CreateCustomerDTO(person=CreatePersonDTO(
+            name='John Doe', cpf=gen.cpf(), email='john@example.com', birth_date='1990-01-01'
+        ))
+
+        customer = self.create_customer_usecase.execute(dto)
+
+        events = self.db_session.query(OutboxEventModel).all()
+        assert len(events) == 1
+        assert events[0].event_type == OutboxEvent.USER_SYNC
+        assert events[0].payload == {'person_id': customer.person.id}
+        assert events[0].processed_at is None
+
+    def test_outbox_event_is_discarded_when_customer_is_not_saved(self, monkeypatch):
+        def fail_before_commit(customer):
+            raise RuntimeError('database unavailable')
+
+        monkeypatch.setattr(self.customer_gateway, 'create', fail_before_commit)
+        dto = CreateCustomerDTO(person=CreatePersonDTO(
+            name='John Doe', cpf=gen.cpf(), email='john@example.com', birth_date='1990-01-01'
+        ))
+
+        with pytest.raises(RuntimeError):
+            self.create_customer_usecase.execute(dto)
+        self.db_session.rollback()
+
+        assert self.db_session.query(OutboxEventModel).count() == 0
+
     def test_update_customer_usecase(self):
         cpf = gen.cpf()
         person_dto = CreatePersonDTO(
@@ -148,3 +204,106 @@ class TestCustomerUsecases:
 
         self.delete_customer_usecase.execute(customer.id, current_user)
         assert customer.is_deleted() is True
+
+    def seed_customers(self, count: int):
+        self.db_session.execute(
+            text(
+                "INSERT INTO persons (name, cpf, email, created_at, updated_at) "
+                "VALUES (:name, :cpf, :email, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+            ),
+            [{'name': f'Person {i}', 'cpf': f'{i:011d}', 'email': f'person{i}@example.com'} for i in range(count)]
+        )
+        self.db_session.execute(text(
+            "INSERT INTO customers (person_id, created_at, updated_at) "
+            "SELECT id, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP FROM persons WHERE email LIKE 'person%@example.com'"
+        ))
+        self.db_session.commit()
+
+    def test_get_all_customers_usecase_for_customer_is_a_primary_key_lookup(self):
+        self.seed_customers(5000)
+        customer = CustomerFactory()
+        current_user = {
+            'profile': {'name': 'customer'},
+            'person': {'id': str(customer.id)}
+        }
+        IdentityMap.get_instance().clear()
+
+        executed = []
+        connection = self.db_session.connection()
+        listener = lambda conn, cursor, statement, parameters, context, executemany: executed.append((statement, parameters))
+        event.listen(connection, 'before_cursor_execute', listener)
+        try:
+            customers = self.get_all_customers_usecase.execute(current_user)
+        finally:
+            event.remove(connection, 'before_cursor_execute', listener)
+
+        assert [c.id for c in customers] == [customer.id]
+        assert len(executed) == 1
+
+        statement, parameters = executed[0]
+        plan = ' '.join(row[-1] for row in connection.exec_driver_sql(f'EXPLAIN QUERY PLAN {statement}', parameters))
+        assert 'SEARCH customers USING INTEGER PRIMARY KEY' in plan
+        assert 'SCAN customers' not in plan
+
+    def test_sync_customers_usecase_reads_active_customers_in_keyset_batches(self):
+        active = [CustomerFactory() for _ in range(5)]
+        CustomerFactory(inactivated_at=datetime.now())
+        gateway = RecordingAuthProviderGateway(failing_cpfs={active[1].person.cpf})
+        progress = []
+        pages = []
+        get_all = self.customer_gateway.get_all
+        self.customer_gateway.get_all = lambda **kwargs: pages.append(kwargs) or get_all(**kwargs)
+
+        stats = SyncCustomersUsecase.build(self.customer_gateway, gateway).execute(
+            batch_size=2, concurrency=3, on_progress=progress.append,
+        )
+
+        assert [batch for batch, _ in gateway.batches] == [
+            [active[0].person_id, active[1].person_id],
+            [active[2].person_id, active[3].person_id],
+            [active[4].person_id],
+        ]
+        assert {concurrency for _, concurrency in gateway.batches} == {3}
+        assert [item["processed"] for item in progress] == [2, 4, 5]
+        assert (stats["processed"], stats["synced"], stats["failed"]) == (5, 4, 1)
+        # Cada lote é uma consulta própria a partir do último id: nenhum cursor atravessa as pausas
+        assert [page["after_id"] for page in pages] == [None, active[1].id, active[3].id, active[4].id]
+        assert {page["limit"] for page in pages} == {2}
+        assert stats["elapsed"] >= 0
+
+    def test_sync_customers_usecase_pauses_and_retries_batch_while_provider_is_down(self):
+        active = [CustomerFactory() for _ in range(3)]
+        gateway = RecordingAuthProviderGateway(unavailable_calls=2)
+        sleeps = []
+
+        stats = SyncCustomersUsecase(self.customer_gateway, gateway, sleep=sleeps.append).execute(
+            batch_size=2, pause_seconds=30, max_pauses=3,
+        )
+
+        assert [batch for batch, _ in gateway.batches] == [
+            [active[0].person_id, active[1].person_id],
+            [active[0].person_id, active[1].person_id],
+            [active[0].person_id, active[1].person_id],
+            [active[2].person_id],
+        ]
+        assert sleeps == [30, 30]
+        assert (stats["processed"], stats["synced"], stats["failed"], stats["pauses"]) == (3, 3, 0, 2)
+
+    def test_sync_customers_usecase_aborts_when_provider_stays_down(self):
+        active = [CustomerFactory() for _ in range(3)]
+        gateway = RecordingAuthProviderGateway(unavailable_calls=10)
+        sleeps = []
+
+        with pytest.raises(ServiceUnavailableException, match="sincronização interrompida") as error:
+            SyncCustomersUsecase(self.customer_gateway, gateway, sleep=sleeps.append).execute(
+                batch_size=2, pause_seconds=5, max_pauses=2,
+            )
+
+        assert [batch for batch, _ in gateway.batches] == [[active[0].person_id, active[1].person_id]] * 3
+        assert sleeps == [5, 5]
+        assert error.value.detail["details"]["processed"] == 0
+        assert error.value.detail["details"]["pauses"] == 2
+
+    def test_sync_customers_usecase_rejects_empty_batches(self):
+        with pytest.raises(ValueError):
+            SyncCustomersUsecase.build(self.customer_gateway, RecordingAuthProviderGateway()).execute(batch_size=0)
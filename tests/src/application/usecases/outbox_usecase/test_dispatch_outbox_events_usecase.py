@@ -0,0 +1,136 @@
+import pytest
+from datetime import timedelta
+
+from src.adapters.driven.repositories.models.outbox_event_model import OutboxEventModel
+from src.adapters.driven.repositories.outbox_repository import OutboxRepository
+from src.adapters.driven.repositories.person_repository import PersonRepository
+from src.application.usecases.outbox_usecase.dispatch_outbox_events_usecase import DispatchOutboxEventsUseCase
+from src.core.domain.entities.outbox_event import OutboxEvent, utc_now
+from src.core.domain.entities.person import Person
+from src.core.ports.auth.i_auth_provider_gateway import IAuthProviderGateway
+from tests.factories.person_factory import PersonFactory
+
+
+class FakeAuthProviderGateway(IAuthProviderGateway):
+    def __init__(self, results=None):
+        self.results = list(results or [])
+        self.synced = []
+
+    def authenticate(self, cpf: str) -> bool:
+        return True
+
+    def sync_user(self, person: Person) -> bool:
+        self.synced.append(person.id)
+        result = self.results.pop(0) if self.results else True
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+class TestDispatchOutboxEventsUseCase:
+    @pytest.fixture(autouse=True)
+    def setup(self, db_session):
+        self.db_session = db_session
+        self.outbox_gateway = OutboxRepository(db_session)
+        self.person_gateway = PersonRepository(db_session)
+        self.db_session.query(OutboxEventModel).delete()
+        self.db_session.commit()
+
+    def build_usecase(self, auth_provider_gateway, max_attempts: int = 3) -> DispatchOutboxEventsUseCase:
+        return DispatchOutboxEventsUseCase(
+            self.outbox_gateway,
+            self.person_gateway,
+            auth_provider_gateway,
+            max_attempts=max_attempts,
+            retry_backoff=10,
+            retry_max_backoff=60,
+            jitter=lambda: 1.0,
+        )
+
+    def enqueue(self, person_id: int, event_type: str = OutboxEvent.USER_SYNC) -> None:
+        # Vencido no passado: fica disponível para o despachante imediatamente
+        self.outbox_gateway.add(OutboxEvent(
+            event_type=event_type, payload={"person_id": person_id}, available_at=utc_now() - timedelta(seconds=1),
+        ))
+        self.db_session.commit()
+
+    def event_models(self):
+        self.db_session.expire_all()
+        return self.db_session.query(OutboxEventModel).order_by(OutboxEventModel.id).all()
+
+    def test_delivers_pending_events(self):
+        people = [PersonFactory(), PersonFactory()]
+        for person in people:
+            self.enqueue(person.id)
+        gateway = FakeAuthProviderGateway()
+
+        result = self.build_usecase(gateway).execute(batch_size=10)
+
+        assert result == {"claimed": 2, "processed": 2, "retried": 0, "dead_lettered": 0}
+        assert gateway.synced == [person.id for person in people]
+        assert all(event_model.processed_at is not None for event_model in self.event_models())
+
+    def test_failure_schedules_a_retry_with_backoff_and_stops_the_batch(self):
+        people = [PersonFactory(), PersonFactory()]
+        for person in people:
+            self.enqueue(person.id)
+        gateway = FakeAuthProviderGateway(results=[False])
+        started_at = utc_now()
+
+        result = self.build_usecase(gateway).execute(batch_size=10)
+
+        assert result == {"claimed": 2, "processed": 0, "retried": 1, "dead_lettered": 0}
+        assert gateway.synced == [people[0].id]
+        failed, untouched = self.event_models()
+        assert failed.attempts == 1
+        assert failed.processed_at is None
+        assert failed.last_error is not None
+        assert failed.available_at >= started_at + timedelta(seconds=10)
+        assert untouched.attempts == 0
+
+    def test_gateway_exceptions_are_retried(self):
+        person = PersonFactory()
+        self.enqueue(person.id)
+
+        result = self.build_usecase(FakeAuthProviderGateway(results=[ConnectionError("boom")])).execute(batch_size=10)
+
+        assert result["retried"] == 1
+        assert self.event_models()[0].last_error == "boom"
+
+    def test_moves_event_to_dead_letter_after_max_attempts(self):
+        person = PersonFactory()
+        self.enqueue(person.id)
+        gateway = FakeAuthProviderGateway(results=[False])
+        event_model = self.event_models()[0]
+        event_model.attempts = 2
+        self.db_session.commit()
+
+        result = self.build_usecase(gateway, max_attempts=3).execute(batch_size=10)
+
+        assert result["dead_lettered"] == 1
+        event_model = self.event_models()[0]
+        assert event_model.attempts == 3
+        assert event_model.dead_lettered_at is not None
+        assert self.build_usecase(gateway).execute(batch_size=10)["claimed"] == 0
+
+    def test_unknown_event_types_go_straight_to_dead_letter(self):
+        self.enqueue(1, event_type="unknown")
+
+        result = self.build_usecase(FakeAuthProviderGateway()).execute(batch_size=10)
+
+        assert result["dead_lettered"] == 1
+        assert self.event_models()[0].attempts == 1
+
+    def test_event_for_removed_person_is_discarded(self):
+        self.enqueue(999)
+        gateway = FakeAuthProviderGateway()
+
+        result = self.build_usecase(gateway).execute(batch_size=10)
+
+        assert result["processed"] == 1
+        assert gateway.synced == []
+
+    def test_retry_delay_grows_exponentially_up_to_the_limit(self):
+        usecase = self.build_usecase(FakeAuthProviderGateway())
+
+        assert [usecase._retry_delay(attempt) for attempt in range(1, 5)] == [10, 20, 40, 60]
@@ -0,0 +1,35 @@
+from fastapi import status
+
+from src.constants.permissions import CustomerPermissions
+from src.core.auth.auth_claims import AuthClaims
+from src.core.utils.jwt_util import JWTUtil
+from tests.factories.customer_factory import CustomerFactory
+
+
+def test_auth_claims_precomputes_permissions():
+    claims = AuthClaims({"profile": {"name": "customer", "permissions": ["a", "b"]}})
+
+    assert claims.permissions == frozenset({"a", "b"})
+    assert claims.has_scopes(["a"])
+    assert not claims.has_scopes(["a", "c"])
+
+
+def test_token_is_decoded_once_per_request(client, mocker):
+    customer = CustomerFactory()
+    decode_spy = mocker.spy(JWTUtil, "decode_token")
+
+    response = client.get(
+        f"/api/v1/customers/{customer.id}/id",
+        permissions=[CustomerPermissions.CAN_VIEW_CUSTOMERS]
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert decode_spy.call_count == 1
+
+
+def test_missing_scope_is_forbidden(client):
+    customer = CustomerFactory()
+
+    response = client.get(f"/api/v1/customers/{customer.id}/id", permissions=[])
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
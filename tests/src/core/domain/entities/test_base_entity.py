@@ -0,0 +1,55 @@
+import pytest
+import weakref
+
+from src.core.domain.entities import (
+    BaseEntity,
+    Customer,
+    Employee,
+    OutboxEvent,
+    Permission,
+    Person,
+    Profile,
+    ProfilePermission,
+    Role,
+    User,
+    UserProfile,
+)
+
+
+@pytest.mark.parametrize("entity_class", [
+    BaseEntity, Customer, Employee, OutboxEvent, Permission, Person, Profile, ProfilePermission, Role, User, UserProfile,
+])
+def test_entities_do_not_have_instance_dict(entity_class):
+    assert "__dict__" not in dir(entity_class)
+
+
+def test_entity_rejects_undeclared_attributes():
+    person = Person(name="John Doe")
+
+    with pytest.raises(AttributeError):
+        person.nickname = "Johnny"
+
+
+def test_entity_supports_weak_references():
+    person = Person(name="John Doe")
+
+    assert weakref.ref(person)() is person
+
+
+def test_repr_lists_attributes_from_the_whole_hierarchy():
+    customer = Customer(person=Person(name="John Doe", id=2), id=1)
+
+    assert repr(customer) == (
+        "Customer(id=1, created_at=None, updated_at=None, inactivated_at=None, "
+        "person=Person(id=2, created_at=None, updated_at=None, inactivated_at=None, "
+        "name='John Doe', cpf=None, email=None, birth_date=None))"
+    )
+
+
+def test_from_json_builds_slotted_entity():
+    role = Role.from_json({"id": 1, "name": "manager", "description": "Manager"})
+
+    assert role.id == 1
+    assert role.name == "manager"
+    assert role.description == "Manager"
+    assert role.is_new is False
@@ -0,0 +1,83 @@
+import pytest
+
+from src.core.domain.entities.user import (
+    Argon2PasswordHasher,
+    BcryptPasswordHasher,
+    User,
+    build_password_hasher,
+)
+
+
+def test_bcrypt_hasher_uses_configured_rounds():
+    hasher = BcryptPasswordHasher(rounds=5)
+
+    password_hash = hasher.hash("secret123")
+
+    assert password_hash.startswith("$2b$05$")
+    assert hasher.verify("secret123", password_hash)
+    assert not hasher.verify("wrong", password_hash)
+    assert not hasher.needs_rehash(password_hash)
+    assert BcryptPasswordHasher(rounds=6).needs_rehash(password_hash)
+
+
+def test_bcrypt_hasher_rejects_invalid_rounds():
+    with pytest.raises(ValueError):
+        BcryptPasswordHasher(rounds=3)
+
+
+def test_argon2_hasher_flags_outdated_parameters():
+    pytest.importorskip("argon2")
+    hasher = Argon2PasswordHasher(time_cost=1, memory_cost=8192, parallelism=1)
+
+    password_hash = hasher.hash("secret123")
+
+    assert password_hash.startswith("$argon2id$")
+    assert hasher.verify("secret123", password_hash)
+    assert not hasher.verify("wrong", password_hash)
+    assert not hasher.needs_rehash(password_hash)
+    assert Argon2PasswordHasher(time_cost=2, memory_cost=8192, parallelism=1).needs_rehash(password_hash)
+    assert hasher.needs_rehash(BcryptPasswordHasher(rounds=4).hash("secret123"))
+
+
+def test_build_password_hasher_rejects_unknown_algorithm():
+    with pytest.raises(ValueError, match="Unsupported password hasher"):
+        build_password_hasher("md5")
+
+
+def test_build_password_hasher_uses_given_parameters():
+    hasher = build_password_hasher("bcrypt", bcrypt_rounds=5)
+
+    assert isinstance(hasher, BcryptPasswordHasher)
+    assert hasher.rounds == 5
+
+
+def test_argon2_hasher_without_argon2_cffi_is_rejected(mocker):
+    mocker.patch.dict("sys.modules", {"argon2": None})
+
+    with pytest.raises(RuntimeError, match="poetry install --extras argon2"):
+        build_password_hasher("argon2id")
+
+
+def test_use_password_hasher_replaces_algorithm(mocker):
+    mocker.patch.object(User, "password_hasher", User.password_hasher)
+    hasher = BcryptPasswordHasher(rounds=4)
+
+    User.use_password_hasher(hasher)
+
+    assert User.password_hasher is hasher
+    assert User.hash_password("secret123").startswith("$2b$04$")
+
+
+def test_user_verifies_hashes_from_previous_algorithm(mocker):
+    pytest.importorskip("argon2")
+    legacy_hash = BcryptPasswordHasher(rounds=4).hash("secret123")
+    mocker.patch.object(User, "password_hasher", Argon2PasswordHasher(time_cost=1, memory_cost=8192, parallelism=1))
+
+    user = User(name="jane", password_hash=legacy_hash)
+
+    assert user.verify_password("secret123")
+    assert user.needs_rehash()
+
+    user.password = "secret123"
+    assert user.password_hash.startswith("$argon2id$")
+    assert not user.needs_rehash()
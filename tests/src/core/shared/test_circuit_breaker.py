@@ -0,0 +1,74 @@
+import pytest
+
+from src.core.shared.circuit_breaker import CircuitBreaker
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCircuitBreaker:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.clock = FakeClock()
+        self.breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30, clock=self.clock)
+
+    def test_starts_closed(self):
+        assert self.breaker.state == CircuitBreaker.CLOSED
+        assert self.breaker.allow_request() is True
+
+    def test_opens_after_consecutive_failures(self):
+        self.breaker.record_failure()
+        assert self.breaker.state == CircuitBreaker.CLOSED
+
+        self.breaker.record_failure()
+
+        assert self.breaker.state == CircuitBreaker.OPEN
+        assert self.breaker.allow_request() is False
+
+    def test_success_resets_the_failure_count(self):
+        self.breaker.record_failure()
+        self.breaker.record_success()
+        self.breaker.record_failure()
+
+        assert self.breaker.state == CircuitBreaker.CLOSED
+
+    def test_allows_a_single_trial_after_reset_timeout(self):
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.clock.now += 30
+
+        assert self.breaker.state == CircuitBreaker.HALF_OPEN
+        assert self.breaker.allow_request() is True
+        assert self.breaker.allow_request() is False
+
+    def test_successful_trial_closes_the_circuit(self):
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.clock.now += 30
+        self.breaker.allow_request()
+
+        self.breaker.record_success()
+
+        assert self.breaker.state == CircuitBreaker.CLOSED
+        assert self.breaker.stats() == {"state": CircuitBreaker.CLOSED, "failures": 0}
+
+    def test_failed_trial_reopens_the_circuit(self):
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.clock.now += 30
+        self.breaker.allow_request()
+
+        self.breaker.record_failure()
+
+        assert self.breaker.state == CircuitBreaker.OPEN
+        self.clock.now += 29
+        assert self.breaker.allow_request() is False
+
+    def test_rejects_invalid_threshold(self):
+        with pytest.raises(ValueError):
+            CircuitBreaker(failure_threshold=0, reset_timeout=30)
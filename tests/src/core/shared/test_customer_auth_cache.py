@@ -0,0 +1,87 @@
+import pytest
+
+from src.core.shared.customer_auth_cache import CustomerAuthCache, CustomerAuthEntry
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+ENTRY = CustomerAuthEntry(customer_id=1, name="John Doe", cpf="12345678909", email="john@example.com", is_deleted=False)
+
+
+class TestCustomerAuthCache:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.clock = FakeClock()
+        self.cache = CustomerAuthCache(max_size=10, ttl=60, negative_max_size=2, negative_ttl=5, clock=self.clock)
+
+    def test_returns_cached_entry_until_ttl(self):
+        self.cache.set(ENTRY.cpf, ENTRY, self.cache.version)
+
+        assert self.cache.get(ENTRY.cpf) == ENTRY
+        self.clock.now += 60
+        assert self.cache.get(ENTRY.cpf) is None
+
+    def test_unknown_cpfs_use_the_shorter_ttl(self):
+        self.cache.set("00000000000", None, self.cache.version)
+
+        assert self.cache.get("00000000000") is CustomerAuthCache.UNKNOWN
+        self.clock.now += 5
+        assert self.cache.get("00000000000") is None
+
+    def test_stats_count_hits_misses_and_negative_hits(self):
+        self.cache.get(ENTRY.cpf)
+        self.cache.set(ENTRY.cpf, ENTRY, self.cache.version)
+        self.cache.set("00000000000", None, self.cache.version)
+        self.cache.get(ENTRY.cpf)
+        self.cache.get("00000000000")
+        self.cache.invalidate(ENTRY.cpf)
+
+        assert self.cache.stats() == {
+            "size": 0,
+            "max_size": 10,
+            "negative_size": 1,
+            "negative_max_size": 2,
+            "hits": 1,
+            "misses": 1,
+            "negative_hits": 1,
+            "invalidations": 1,
+        }
+
+    def test_unknown_cpfs_do_not_evict_known_customers(self):
+        self.cache.set(ENTRY.cpf, ENTRY, self.cache.version)
+
+        for index in range(100):
+            self.cache.set(f"{index:011d}", None, self.cache.version)
+
+        assert self.cache.get(ENTRY.cpf) == ENTRY
+        assert self.cache.stats()["negative_size"] == 2
+
+    def test_invalidate_removes_only_the_given_cpfs(self):
+        self.cache.set(ENTRY.cpf, ENTRY, self.cache.version)
+        self.cache.set("00000000000", None, self.cache.version)
+
+        self.cache.invalidate("00000000000", None)
+
+        assert self.cache.get(ENTRY.cpf) == ENTRY
+        assert self.cache.get("00000000000") is None
+
+    def test_lookup_started_before_an_invalidation_is_not_cached(self):
+        version = self.cache.version
+
+        self.cache.invalidate(ENTRY.cpf)
+        self.cache.set(ENTRY.cpf, ENTRY, version)
+
+        assert self.cache.get(ENTRY.cpf) is None
+
+    def test_zero_size_disables_the_cache(self):
+        cache = CustomerAuthCache(max_size=0, ttl=60, negative_max_size=0, negative_ttl=5, clock=self.clock)
+
+        cache.set(ENTRY.cpf, ENTRY, cache.version)
+
+        assert cache.get(ENTRY.cpf) is None
@@ -0,0 +1,75 @@
+import asyncio
+import gc
+
+import pytest
+from anyio import to_thread
+
+from src.core.domain.entities.role import Role
+from src.core.shared.identity_map import IdentityMap
+
+
+def make_role(role_id: int) -> Role:
+    return Role(id=role_id, name=f"role-{role_id}", description="")
+
+
+class TestIdentityMap:
+    def test_evicts_least_recently_used_entity_when_full(self):
+        identity_map = IdentityMap(max_size=2)
+        identity_map.add(make_role(1))
+        identity_map.add(make_role(2))
+
+        assert identity_map.get(Role, 1) is not None
+        identity_map.add(make_role(3))
+
+        assert len(identity_map) == 2
+        assert identity_map.get(Role, 2) is None
+        assert identity_map.get(Role, 1) is not None
+        assert identity_map.get(Role, 3) is not None
+
+    def test_rejects_non_positive_max_size(self):
+        with pytest.raises(ValueError):
+            IdentityMap(max_size=0)
+
+    def test_weak_mode_drops_entities_no_longer_referenced(self):
+        identity_map = IdentityMap(weak=True)
+        kept = make_role(1)
+        identity_map.add(kept)
+        identity_map.add(make_role(2))
+        gc.collect()
+
+        assert identity_map.get(Role, 1) is kept
+        assert identity_map.get(Role, 2) is None
+        assert len(identity_map) == 1
+
+    def test_weak_mode_does_not_accept_max_size(self):
+        with pytest.raises(ValueError):
+            IdentityMap(max_size=10, weak=True)
+
+    def test_scope_replaces_and_restores_the_current_map(self):
+        outer = IdentityMap.get_instance()
+
+        with IdentityMap.scope(IdentityMap(max_size=5)) as scoped:
+            assert IdentityMap.get_instance() is scoped
+            assert scoped is not outer
+            assert scoped.max_size == 5
+
+        assert IdentityMap.get_instance() is outer
+
+    def test_concurrent_scopes_are_isolated(self):
+        async def handle_request(role_id: int, other_id: int):
+            with IdentityMap.scope():
+                IdentityMap.get_instance().add(make_role(role_id))
+                await asyncio.sleep(0)
+                # O mapa também é visto pelo threadpool da requisição
+                seen = await to_thread.run_sync(
+                    lambda: (IdentityMap.get_instance().get(Role, role_id), IdentityMap.get_instance().get(Role, other_id))
+                )
+                return seen
+
+        async def main():
+            return await asyncio.gather(handle_request(1, 2), handle_request(2, 1))
+
+        (own_1, other_1), (own_2, other_2) = asyncio.run(main())
+
+        assert own_1.id == 1 and other_1 is None
+        assert own_2.id == 2 and other_2 is None
@@ -0,0 +1,33 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.core.domain.entities.user import User
+from src.core.shared.password_hashing_executor import PasswordHashingExecutor
+
+
+def test_run_executes_on_dedicated_threads():
+    executor = PasswordHashingExecutor(max_workers=1)
+    try:
+        thread_name = asyncio.run(executor.run(lambda: threading.current_thread().name))
+    finally:
+        executor.shutdown()
+
+    assert thread_name.startswith("password-hashing")
+
+
+def test_process_executor_verifies_password():
+    executor = PasswordHashingExecutor(max_workers=1, kind="process")
+    password_hash = User.hash_password("secret")
+    try:
+        assert asyncio.run(executor.run(User.check_password, "secret", password_hash)) is True
+        assert asyncio.run(executor.run(User.check_password, "wrong", password_hash)) is False
+    finally:
+        executor.shutdown()
+
+
+@pytest.mark.parametrize("kwargs", [{"max_workers": 0}, {"max_workers": 1, "kind": "fiber"}])
+def test_invalid_configuration_is_rejected(kwargs):
+    with pytest.raises(ValueError):
+        PasswordHashingExecutor(**kwargs)
@@ -0,0 +1,57 @@
+import pytest
+
+from src.core.shared.ttl_cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLCache:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.clock = FakeClock()
+        self.cache = TTLCache(max_size=2, clock=self.clock)
+
+    def test_get_returns_value_before_expiration(self):
+        self.cache.set("a", 1, expires_at=self.clock.now + 10)
+
+        assert self.cache.get("a") == 1
+        assert self.cache.stats()["hits"] == 1
+
+    def test_get_evicts_expired_entry(self):
+        self.cache.set("a", 1, ttl=10)
+        self.clock.now += 10
+
+        assert self.cache.get("a") is None
+        assert len(self.cache) == 0
+        assert self.cache.stats()["misses"] == 1
+
+    def test_set_ignores_already_expired_entry(self):
+        self.cache.set("a", 1, expires_at=self.clock.now - 1)
+
+        assert len(self.cache) == 0
+
+    def test_evicts_least_recently_used_entry_when_full(self):
+        self.cache.set("a", 1, ttl=10)
+        self.cache.set("b", 2, ttl=10)
+        self.cache.get("a")
+        self.cache.set("c", 3, ttl=10)
+
+        assert self.cache.get("a") == 1
+        assert self.cache.get("b") is None
+        assert self.cache.get("c") == 3
+
+    def test_zero_max_size_disables_cache(self):
+        cache = TTLCache(max_size=0, clock=self.clock)
+        cache.set("a", 1, ttl=10)
+
+        assert cache.get("a") is None
+
+    def test_set_requires_expiration(self):
+        with pytest.raises(ValueError):
+            self.cache.set("a", 1)
@@ -0,0 +1,46 @@
+import pytest
+from jose import jwt
+
+from src.core.exceptions.invalid_token_exception import InvalidTokenException
+from src.core.utils.jwt_util import JWTUtil
+
+
+class TestJWTUtil:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        JWTUtil.verified_tokens.clear()
+        yield
+        JWTUtil.verified_tokens.clear()
+
+    def test_decode_token_returns_payload(self):
+        token = JWTUtil.create_token({"profile": {"name": "administrator", "permissions": []}})
+
+        payload = JWTUtil.decode_token(token)
+
+        assert payload["profile"]["name"] == "administrator"
+
+    def test_decode_token_verifies_each_token_only_once(self, mocker):
+        token = JWTUtil.create_token({"person": {"id": "1"}})
+        decode_spy = mocker.spy(jwt, "decode")
+
+        first = JWTUtil.decode_token(token)
+        second = JWTUtil.decode_token(token)
+
+        assert first == second
+        assert decode_spy.call_count == 1
+
+    def test_cached_token_expires_at_token_exp(self, mocker):
+        token = JWTUtil.create_token({"person": {"id": "1"}})
+        payload = JWTUtil.decode_token(token)
+        decode_spy = mocker.spy(jwt, "decode")
+
+        mocker.patch.object(JWTUtil.verified_tokens, "_clock", return_value=payload["exp"])
+        JWTUtil.decode_token(token)
+
+        assert decode_spy.call_count == 1
+
+    def test_invalid_token_raises_and_is_not_cached(self):
+        with pytest.raises(InvalidTokenException):
+            JWTUtil.decode_token("not-a-token")
+
+        assert len(JWTUtil.verified_tokens) == 0
@@ -0,0 +1,16 @@
+from dependency_injector import providers
+from fastapi.testclient import TestClient
+
+from src.app import app
+
+
+def test_lifespan_shuts_down_password_hashing_executor(mocker):
+    executor = mocker.Mock()
+    app.container.password_hashing_executor.override(providers.Object(executor))
+    try:
+        with TestClient(app):
+            executor.shutdown.assert_not_called()
+    finally:
+        app.container.password_hashing_executor.reset_override()
+
+    executor.shutdown.assert_called_once_with()
@@ -0,0 +1,69 @@
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import create_engine
+from sqlalchemy.pool import QueuePool
+
+from config.database import EngineSettings, get_pool_status
+
+
+def test_engine_settings_defaults_do_not_echo_sql(monkeypatch):
+    for name in ("DATABASE_ECHO", "DATABASE_POOL_SIZE", "DATABASE_MAX_OVERFLOW",
+                 "DATABASE_POOL_TIMEOUT", "DATABASE_POOL_PRE_PING", "DATABASE_POOL_RECYCLE"):
+        monkeypatch.delenv(name, raising=False)
+
+    settings = EngineSettings.from_env()
+
+    assert settings.engine_options() == {
+        "echo": False,
+        "pool_size": 5,
+        "max_overflow": 10,
+        "pool_timeout": 30.0,
+        "pool_pre_ping": True,
+        "pool_recycle": 3600,
+    }
+
+
+def test_engine_settings_read_from_env(monkeypatch):
+    monkeypatch.setenv("DATABASE_ECHO", "true")
+    monkeypatch.setenv("DATABASE_POOL_SIZE", "20")
+    monkeypatch.setenv("DATABASE_MAX_OVERFLOW", "-1")
+    monkeypatch.setenv("DATABASE_POOL_TIMEOUT", "2.5")
+    monkeypatch.setenv("DATABASE_POOL_PRE_PING", "0")
+    monkeypatch.setenv("DATABASE_POOL_RECYCLE", "600")
+
+    settings = EngineSettings.from_env()
+
+    assert settings.echo is True
+    assert settings.pool_size == 20
+    assert settings.max_overflow == -1
+    assert settings.pool_timeout == 2.5
+    assert settings.pool_pre_ping is False
+    assert settings.pool_recycle == 600
+
+
+@pytest.mark.parametrize("name, value", [
+    ("DATABASE_POOL_SIZE", "0"),
+    ("DATABASE_POOL_SIZE", "many"),
+    ("DATABASE_MAX_OVERFLOW", "-2"),
+    ("DATABASE_POOL_TIMEOUT", "0"),
+    ("DATABASE_POOL_RECYCLE", "-5"),
+    ("DATABASE_ECHO", "sometimes"),
+])
+def test_engine_settings_reject_invalid_values(monkeypatch, name, value):
+    monkeypatch.setenv(name, value)
+
+    with pytest.raises(ValidationError):
+        EngineSettings.from_env()
+
+
+def test_get_pool_status_reports_checked_out_connections():
+    settings = EngineSettings(pool_size=2, max_overflow=1)
+    engine = create_engine("sqlite://", poolclass=QueuePool, **settings.engine_options())
+    try:
+        with engine.connect():
+            status = get_pool_status(engine)
+            assert status["checkedout"] == 1
+            assert status["size"] == 2
+        assert get_pool_status(engine)["checkedout"] == 0
+    finally:
+        engine.dispose()
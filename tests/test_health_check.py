@@ -1,6 +1,8 @@
 from fastapi import status
 from src.app import app
 from fastapi.testclient import TestClient
+from src.constants.permissions import HealthCheckPermissions
+from src.core.utils.jwt_util import JWTUtil
 
 client = TestClient(app)
 
@@ -11,3 +13,22 @@ def test_health_check_v1():
     response = client.get("/api/v1/health")
     assert response.status_code == status.HTTP_200_OK
     assert response.json() == {"status": "healthy"}
+
+def test_database_pool_status_v1():
+    """
+    Testa a rota com as estatísticas do pool de conexões do banco.
+    """
+    assert client.get("/api/v1/health/database").status_code == status.HTTP_401_UNAUTHORIZED
+
+    token = JWTUtil.create_token({
+        "profile": {"name": "administrator", "permissions": [HealthCheckPermissions.CAN_VIEW_DIAGNOSTICS]},
+        "person": {"id": "1", "name": "Test User", "cpf": "12345678909", "email": "test@example.com"},
+    })
+    response = client.get("/api/v1/health/database", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == status.HTTP_200_OK
+
+    data = response.json()
+    assert data["pool_class"] == "QueuePool"
+    assert data["checkedout"] == 0
+    assert data["max_overflow"] == 10
+    assert data["pool_pre_ping"] is True